@@ -0,0 +1,322 @@
+"""
+Benchmark runner for the dictionary loader, the input loader and the scrambled string finder.
+
+Usage:
+    python3 -m benchmarks.benchmark_runner --output report.json [--baseline baseline.json]
+
+The runner generates the selected synthetic workloads, times every operation for every dictionary
+storage and match engine, and writes a JSON report with durations, throughput and peak memory. When
+a baseline report is given, the operations that became slower than the allowed threshold are reported
+as regressions and the runner exits with a non-zero status.
+"""
+
+# Imports
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+from benchmarks.workload_generator import WORKLOADS, WorkloadSpec, generate_workload
+from dictionary.compact_dictionary_storage import CompactDictionaryStorage
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.hash_dictionary_storage import HashDictionaryStorage
+from dictionary.set_dictionary_storage import SetDictionaryStorage
+from input_strings.input_file_provider import InputFileProvider
+from input_strings.input_strings_config import InputStringsConfig
+from log.null_logger import NullLogger
+from scrambled_string_finder import FinderOptions, ScrambledStringFinder
+from scrambled_strings import MATCH_ENGINES
+
+# Dictionary storages that are benchmarked
+STORAGES = {
+    "set": SetDictionaryStorage,
+    "hash": HashDictionaryStorage,
+    "compact": CompactDictionaryStorage,
+}
+
+# Default relative slowdown above which an operation is reported as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class BenchmarkOptions:
+    """
+    Options of the benchmarks of the workloads.
+
+    Attributes:
+        storages -- the dictionary storages to benchmark. Defaults to all storages.
+        engines -- the match engines to benchmark. Defaults to all engines.
+        repeat -- number of timed runs per operation
+        trace_memory -- whether to measure the peak memory of every operation
+    """
+    storages: Tuple[str, ...] = tuple(STORAGES)
+    engines: Tuple[str, ...] = tuple(MATCH_ENGINES)
+    repeat: int = 3
+    trace_memory: bool = True
+
+
+@dataclass(frozen=True)
+class BenchmarkedOperation:
+    """
+    Operation of a report record.
+
+    Attributes:
+        name -- name of the operation
+        chars -- number of characters processed by the operation
+        lines -- number of lines processed by the operation
+        storage -- the dictionary storage, if relevant
+        engine -- the match engine, if relevant
+    """
+    name: str
+    chars: int
+    lines: int
+    storage: Optional[str] = None
+    engine: Optional[str] = None
+
+
+def measure(operation: Callable[[], object], repeat: int, trace_memory: bool = True) -> dict:
+    """
+    Measures the duration and the peak memory of an operation.
+
+    The duration is the best of `repeat` runs. The peak memory is measured in an additional run,
+    since tracing memory allocations slows the operation down considerably.
+
+    Args:
+        operation (Callable[[], object]): The operation to measure.
+        repeat (int): Number of timed runs.
+        trace_memory (bool): Whether to measure the peak memory.
+
+    Returns:
+        dict: The duration in seconds and the peak memory in bytes (None if it is not measured).
+    """
+    durations = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - start_time)
+
+    if not trace_memory:
+        return {"seconds": min(durations), "peak_memory_bytes": None}
+
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(durations), "peak_memory_bytes": peak_memory}
+
+
+def make_record(spec: WorkloadSpec, operation: BenchmarkedOperation, measurement: dict) -> dict:
+    """
+    Creates a report record with the throughput of a measured operation.
+
+    Args:
+        spec (WorkloadSpec): The workload specification.
+        operation (BenchmarkedOperation): The operation.
+        measurement (dict): The measurement returned by `measure`.
+
+    Returns:
+        dict: The report record.
+    """
+    seconds = max(measurement["seconds"], 1e-9)
+    return {
+        "workload": spec.name,
+        "operation": operation.name,
+        "storage": operation.storage,
+        "engine": operation.engine,
+        "seconds": measurement["seconds"],
+        "chars_per_sec": operation.chars / seconds,
+        "lines_per_sec": operation.lines / seconds,
+        "peak_memory_bytes": measurement["peak_memory_bytes"],
+    }
+
+
+def benchmark_workload(spec: WorkloadSpec, directory: str, options: BenchmarkOptions) -> list[dict]:
+    """
+    Benchmarks the loaders and the finder on a workload.
+
+    Args:
+        spec (WorkloadSpec): The workload specification.
+        directory (str): The directory where the workload files are generated.
+        options (BenchmarkOptions): The options of the benchmarks.
+
+    Returns:
+        list[dict]: The report records.
+    """
+    dictionary_path, input_path = generate_workload(spec, directory)
+    logger = NullLogger()
+
+    with open(dictionary_path, mode="r", encoding="utf-8") as file:
+        words = file.read().split()
+    dictionary_config = DictionaryConfig(min_word_length=1, max_word_length=max(spec.words.max_length, 1),
+                                         max_sum_lengths_of_all_words=max(sum(map(len, words)),
+                                                                          spec.words.max_length, 1))
+    input_strings_config = InputStringsConfig(min_line_length=1, max_line_length=spec.lines.length + 1)
+    input_chars = os.path.getsize(input_path)
+    dictionary_chars = os.path.getsize(dictionary_path)
+
+    def load_inputs() -> InputFileProvider:
+        input_provider = InputFileProvider(input_path, input_strings_config)
+        input_provider.load()
+        return input_provider
+
+    records = [make_record(spec, BenchmarkedOperation("input_load", input_chars, spec.lines.count),
+                           measure(load_inputs, options.repeat, options.trace_memory))]
+    input_provider = load_inputs()
+
+    for storage in options.storages:
+        def load_dictionary(storage_type=STORAGES[storage]) -> Dictionary:
+            dictionary = Dictionary(storage_type(), dictionary_config, logger)
+            dictionary.load_from_file(dictionary_path)
+            return dictionary
+
+        records.append(make_record(spec, BenchmarkedOperation("dictionary_load", dictionary_chars, len(words),
+                                                              storage=storage),
+                                   measure(load_dictionary, options.repeat, options.trace_memory)))
+        dictionary = load_dictionary()
+
+        for engine in options.engines:
+            try:
+                match_engine = MATCH_ENGINES[engine](dictionary, logger)
+            except ImportError as err:
+                print(f"Skipping engine '{engine}': {err}", file=sys.stderr)
+                continue
+
+            finder = ScrambledStringFinder(input_provider=input_provider, dictionary=dictionary,
+                                           logger=logger, options=FinderOptions(match_engine=match_engine))
+            operation = BenchmarkedOperation("find_scrambled_strings", input_chars, spec.lines.count,
+                                             storage=storage, engine=engine)
+            records.append(make_record(spec, operation, measure(finder.find_scrambled_strings, options.repeat,
+                                                                options.trace_memory)))
+
+    return records
+
+
+def run_benchmarks(workloads: list[str], options: BenchmarkOptions) -> dict:
+    """
+    Runs the benchmarks of the given workloads.
+
+    Args:
+        workloads (list[str]): The names of the workloads (see `WORKLOADS`).
+        options (BenchmarkOptions): The options of the benchmarks.
+
+    Returns:
+        dict: The benchmark report.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for workload in workloads:
+            results.extend(benchmark_workload(WORKLOADS[workload], directory, options))
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "workloads": {workload: WORKLOADS[workload].to_dict() for workload in workloads},
+        "results": results,
+    }
+
+
+def compare_reports(baseline: dict, report: dict, threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> list[dict]:
+    """
+    Compares a report against a baseline report.
+
+    Args:
+        baseline (dict): The baseline report.
+        report (dict): The current report.
+        threshold (float): The relative slowdown above which an operation is reported as a regression.
+
+    Returns:
+        list[dict]: The regressions, with the baseline and current durations and the relative slowdown.
+    """
+    def key(record: dict) -> tuple:
+        return record["workload"], record["operation"], record["storage"], record["engine"]
+
+    baseline_results = {key(record): record for record in baseline["results"]}
+    regressions = []
+    for record in report["results"]:
+        baseline_record = baseline_results.get(key(record))
+        if baseline_record is None or baseline_record["seconds"] <= 0:
+            continue
+
+        slowdown = record["seconds"] / baseline_record["seconds"] - 1
+        if slowdown > threshold:
+            regressions.append({
+                "workload": record["workload"],
+                "operation": record["operation"],
+                "storage": record["storage"],
+                "engine": record["engine"],
+                "baseline_seconds": baseline_record["seconds"],
+                "seconds": record["seconds"],
+                "slowdown": slowdown,
+            })
+
+    return regressions
+
+
+def parse_arguments():
+    """
+    Parses command line arguments.
+
+    Returns:
+        argparse.Namespace: An object containing the parsed command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Scrambled String Finder benchmarks")
+    parser.add_argument("--output", required=True, help="Path to the JSON report to write.")
+    parser.add_argument("--baseline", help="Path to a baseline JSON report to compare against.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="Relative slowdown reported as a regression (default: 0.10).")
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS),
+                        help="Workloads to benchmark (default: all).")
+    parser.add_argument("--storages", nargs="+", choices=list(STORAGES), default=list(STORAGES),
+                        help="Dictionary storages to benchmark (default: all).")
+    parser.add_argument("--engines", nargs="+", choices=list(MATCH_ENGINES), default=list(MATCH_ENGINES),
+                        help="Match engines to benchmark (default: all).")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per operation (default: 3).")
+    parser.add_argument("--skip-memory", action="store_true",
+                        help="Do not measure the peak memory (tracing allocations slows the benchmarks down).")
+    return parser.parse_args()
+
+
+def main():
+    """
+    Runs the benchmarks, writes the report and compares it against the baseline, if any.
+    """
+    args = parse_arguments()
+
+    options = BenchmarkOptions(storages=tuple(args.storages), engines=tuple(args.engines), repeat=args.repeat,
+                               trace_memory=not args.skip_memory)
+    report = run_benchmarks(args.workloads, options)
+    with open(args.output, mode="w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    for record in report["results"]:
+        print(f"{record['workload']:<15} {record['operation']:<24} {record['storage'] or '-':<6} "
+              f"{record['engine'] or '-':<10} {record['seconds']:>10.4f}s {record['chars_per_sec']:>14.0f} chars/s "
+              f"{record['peak_memory_bytes'] if record['peak_memory_bytes'] is not None else '-':>12} B")
+
+    if args.baseline:
+        with open(args.baseline, mode="r", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        regressions = compare_reports(baseline, report, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression['workload']} {regression['operation']} "
+                  f"{regression['storage'] or '-'} {regression['engine'] or '-'}: "
+                  f"{regression['baseline_seconds']:.4f}s -> {regression['seconds']:.4f}s "
+                  f"(+{regression['slowdown']:.0%})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Test cases for the benchmark runner.
+"""
+
+# Imports
+import tempfile
+import unittest
+from benchmarks.benchmark_runner import BenchmarkOptions, benchmark_workload, compare_reports, measure
+from benchmarks.workload_generator import LineSpec, WordSpec, WorkloadSpec
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """
+    Unit tests for the benchmark_runner module.
+    """
+
+    def test_measure(self):
+        """Test that an operation is measured with and without memory tracing."""
+        measurement = measure(lambda: [0] * 100_000, repeat=2)
+        self.assertGreaterEqual(measurement["seconds"], 0)
+        self.assertGreater(measurement["peak_memory_bytes"], 0)
+        self.assertIsNone(measure(lambda: None, repeat=1, trace_memory=False)["peak_memory_bytes"])
+
+    def test_benchmark_workload(self):
+        """Test that a record is written for every loader and for every storage and engine of the finder."""
+        spec = WorkloadSpec(name="test", words=WordSpec(count=20), lines=LineSpec(count=5, length=50))
+        options = BenchmarkOptions(storages=("set", "compact"), engines=("window",), repeat=1, trace_memory=False)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            records = benchmark_workload(spec, temp_dir, options)
+
+        self.assertEqual([(record["operation"], record["storage"], record["engine"]) for record in records], [
+            ("input_load", None, None),
+            ("dictionary_load", "set", None),
+            ("find_scrambled_strings", "set", "window"),
+            ("dictionary_load", "compact", None),
+            ("find_scrambled_strings", "compact", "window"),
+        ])
+        self.assertTrue(all(record["lines_per_sec"] > 0 for record in records))
+
+    def test_compare_reports(self):
+        """Test that only operations slower than the threshold are reported as regressions."""
+        def record(operation, seconds):
+            return {"workload": "small", "operation": operation, "storage": "set", "engine": "window",
+                    "seconds": seconds}
+
+        baseline = {"results": [record("find", 1.0), record("load", 1.0)]}
+        report = {"results": [record("find", 1.5), record("load", 1.05), record("new", 1.0)]}
+
+        regressions = compare_reports(baseline, report, threshold=0.1)
+        self.assertEqual([regression["operation"] for regression in regressions], ["find"])
+        self.assertAlmostEqual(regressions[0]["slowdown"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
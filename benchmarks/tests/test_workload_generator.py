@@ -0,0 +1,56 @@
+"""
+Test cases for the workload generator.
+"""
+
+# Imports
+import os
+import random
+import tempfile
+import unittest
+from benchmarks.workload_generator import (
+    LineSpec,
+    WordSpec,
+    WorkloadSpec,
+    generate_workload,
+    generate_words,
+    scramble_word,
+)
+
+
+class TestWorkloadGenerator(unittest.TestCase):
+    """
+    Unit tests for the workload_generator module.
+    """
+
+    def test_reproducible_workload(self):
+        """Test that the same specification always generates the same files."""
+        spec = WorkloadSpec(name="test", words=WordSpec(count=20),
+                            lines=LineSpec(count=5, length=50, match_density=0.1))
+        contents = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for run in range(2):
+                dictionary_path, input_path = generate_workload(spec, os.path.join(temp_dir, str(run)))
+                with open(dictionary_path, encoding="utf-8") as dict_file, open(input_path, encoding="utf-8") as file:
+                    contents.append((dict_file.read(), file.read()))
+
+        self.assertEqual(contents[0], contents[1])
+        lines = contents[0][1].splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(all(len(line) == 50 for line in lines))
+
+    def test_small_alphabet(self):
+        """Test that a single-letter alphabet generates only the words it can provide."""
+        spec = WorkloadSpec(name="test", alphabet_size=1, words=WordSpec(count=100, min_length=2, max_length=5))
+        words = generate_words(spec, random.Random(spec.seed))
+        self.assertEqual(sorted(words), ["aa", "aaa", "aaaa", "aaaaa"])
+
+    def test_scramble_word(self):
+        """Test that scrambling keeps the first and last letters and the middle characters."""
+        scrambled = scramble_word("scramble", random.Random(1))
+        self.assertEqual((scrambled[0], scrambled[-1]), ("s", "e"))
+        self.assertEqual(sorted(scrambled), sorted("scramble"))
+        self.assertEqual(scramble_word("a", random.Random(1)), "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Python module that generates reproducible synthetic workloads for benchmarking.
+
+A workload consists of a dictionary file and an input file, both generated from a seed, so that
+the same specification always produces exactly the same files.
+"""
+
+# Imports
+import os
+import random
+import string
+from dataclasses import dataclass, asdict
+from typing import Tuple
+
+# Characters used for building the alphabets of the workloads
+ALPHABET_CHARACTERS = string.ascii_lowercase + string.ascii_uppercase
+
+
+@dataclass(frozen=True)
+class WordSpec:
+    """
+    Specification of the dictionary words of a workload.
+
+    Attributes:
+        count -- number of dictionary words (fewer words are generated if the alphabet is too small)
+        min_length -- minimum length of dictionary words
+        max_length -- maximum length of dictionary words
+    """
+    count: int = 100
+    min_length: int = 2
+    max_length: int = 10
+
+
+@dataclass(frozen=True)
+class LineSpec:
+    """
+    Specification of the input strings of a workload.
+
+    Attributes:
+        count -- number of input strings
+        length -- length of every input string (excluding the newline)
+        match_density -- probability of planting a scrambled dictionary word at every position of a line
+    """
+    count: int = 100
+    length: int = 500
+    match_density: float = 0.01
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """
+    Specification of a synthetic workload.
+
+    Attributes:
+        name -- name of the workload
+        seed -- seed of the random generator
+        alphabet_size -- number of distinct characters used by words and input strings
+        words -- specification of the dictionary words
+        lines -- specification of the input strings
+    """
+    name: str
+    seed: int = 1
+    alphabet_size: int = 26
+    words: WordSpec = WordSpec()
+    lines: LineSpec = LineSpec()
+
+    def to_dict(self) -> dict:
+        """Returns the specification as a dictionary."""
+        return asdict(self)
+
+
+# Predefined workloads, including adversarial cases
+WORKLOADS = {
+    "small": WorkloadSpec(name="small"),
+    "long_words": WorkloadSpec(name="long_words", words=WordSpec(count=50, min_length=20, max_length=60),
+                               lines=LineSpec(count=20, length=5000, match_density=0.001)),
+    "many_words": WorkloadSpec(name="many_words", words=WordSpec(count=2000, min_length=4, max_length=8),
+                               lines=LineSpec(count=20, length=1000)),
+    "long_lines": WorkloadSpec(name="long_lines", words=WordSpec(count=200),
+                               lines=LineSpec(count=5, length=100_000, match_density=0.0001)),
+    "dense_matches": WorkloadSpec(name="dense_matches", alphabet_size=4, words=WordSpec(count=200),
+                                  lines=LineSpec(count=50, length=1000, match_density=0.2)),
+    "single_letter": WorkloadSpec(name="single_letter", alphabet_size=1,
+                                  words=WordSpec(count=20, min_length=2, max_length=40),
+                                  lines=LineSpec(count=50, length=1000)),
+}
+
+
+def scramble_word(word: str, rand: random.Random) -> str:
+    """
+    Scrambles a word by shuffling its middle characters.
+
+    Args:
+        word (str): The word to scramble.
+        rand (random.Random): The random generator.
+
+    Returns:
+        str: The scrambled word.
+    """
+    middle = list(word[1:-1])
+    rand.shuffle(middle)
+    return word[0] + "".join(middle) + word[-1] if len(word) > 1 else word
+
+
+def generate_words(spec: WorkloadSpec, rand: random.Random) -> list[str]:
+    """
+    Generates unique dictionary words.
+
+    Args:
+        spec (WorkloadSpec): The workload specification.
+        rand (random.Random): The random generator.
+
+    Returns:
+        list[str]: The generated words, in generation order.
+    """
+    alphabet = ALPHABET_CHARACTERS[:spec.alphabet_size]
+    words = {}
+
+    # Small alphabets cannot provide enough unique words, so the number of attempts is bounded
+    for _ in range(spec.words.count * 20):
+        if len(words) == spec.words.count:
+            break
+        word_length = rand.randint(spec.words.min_length, spec.words.max_length)
+        words.setdefault("".join(rand.choices(alphabet, k=word_length)), None)
+
+    return list(words)
+
+
+def generate_lines(spec: WorkloadSpec, words: list[str], rand: random.Random) -> list[str]:
+    """
+    Generates input strings with planted scrambled dictionary words.
+
+    Args:
+        spec (WorkloadSpec): The workload specification.
+        words (list[str]): The dictionary words.
+        rand (random.Random): The random generator.
+
+    Returns:
+        list[str]: The generated input strings (without newlines).
+    """
+    alphabet = ALPHABET_CHARACTERS[:spec.alphabet_size]
+    lines = []
+
+    line_spec = spec.lines
+    for _ in range(line_spec.count):
+        characters = rand.choices(alphabet, k=line_spec.length)
+        position = 0
+        while words and position < line_spec.length:
+            if rand.random() < line_spec.match_density:
+                planted = scramble_word(rand.choice(words), rand)[:line_spec.length - position]
+                characters[position: position + len(planted)] = planted
+                position += len(planted)
+            else:
+                position += 1
+        lines.append("".join(characters))
+
+    return lines
+
+
+def generate_workload(spec: WorkloadSpec, directory: str) -> Tuple[str, str]:
+    """
+    Generates the dictionary and input files of a workload.
+
+    Args:
+        spec (WorkloadSpec): The workload specification.
+        directory (str): The directory where the files are written.
+
+    Returns:
+        Tuple[str, str]: The paths of the dictionary file and of the input file.
+    """
+    rand = random.Random(spec.seed)
+    words = generate_words(spec, rand)
+    lines = generate_lines(spec, words, rand)
+
+    os.makedirs(directory, exist_ok=True)
+    dictionary_path = os.path.join(directory, f"{spec.name}_dict.txt")
+    input_path = os.path.join(directory, f"{spec.name}_input.txt")
+
+    with open(dictionary_path, mode="w", encoding="utf-8") as file:
+        file.write("\n".join(words) + "\n")
+    with open(input_path, mode="w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+
+    return dictionary_path, input_path
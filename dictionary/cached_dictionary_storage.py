@@ -0,0 +1,220 @@
+"""
+Module for implementing a memoizing wrapper around a dictionary data storage.
+"""
+
+# Imports
+import sys
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, Sequence, Tuple, Union
+from dictionary.dictionary_data_storage import DictionaryDataStorage, WordGroup
+from dictionary.multiset_signature import MultisetSignatureEncoder
+from stats.cache_stats import CacheStats
+
+# Approximate memory used by a cache entry besides its value: the ordered dictionary node, the key
+# tuple and the references to the word
+CACHE_ENTRY_OVERHEAD = 160
+
+# Kinds of cached values
+_CANONICAL = 0
+_SIGNATURE = 1
+
+
+class CachedDictionaryStorage(DictionaryDataStorage):
+    """
+    Implements a dictionary data storage that memoizes the canonical forms and the signatures of
+    another storage.
+
+    The words themselves are kept by the wrapped storage. The canonical forms and signatures that are
+    requested are cached with least-recently-used eviction, within a memory budget. This combines the
+    low memory footprint of a storage that computes canonical forms on demand (e.g. `SetDictionaryStorage`)
+    with the lookup speed of one that precomputes them.
+    """
+
+    def __init__(self, storage: DictionaryDataStorage, max_cache_bytes: int):
+        """
+        Initializes the CachedDictionaryStorage.
+
+        Args:
+            storage (DictionaryDataStorage): The wrapped storage.
+            max_cache_bytes (int): Memory budget of the cache in bytes (approximate).
+
+        Raises:
+            ValueError: If `max_cache_bytes` is not positive.
+        """
+        if max_cache_bytes < 1:
+            raise ValueError(f"The cache memory budget ({max_cache_bytes}) must be positive.")
+
+        self.storage: DictionaryDataStorage = storage
+        self.max_cache_bytes: int = max_cache_bytes
+        self.cache_bytes: int = 0
+        self.stats: CacheStats = CacheStats()
+        self._cache: OrderedDict[Tuple[int, str], Tuple[Union[str, int], int]] = OrderedDict()
+
+    def add_word(self, word: str) -> None:
+        """
+        Adds a word to the wrapped storage.
+
+        Args:
+            word (str): The word to add.
+        """
+        self.storage.add_word(word)
+
+    def add_precomputed_words(self, words: Sequence[str], canonical_words: Sequence[str],
+                              signatures: Sequence[int]) -> None:
+        """
+        Adds words whose canonical forms and signatures have already been computed to the wrapped storage.
+
+        Args:
+            words (Sequence[str]): The words to add.
+            canonical_words (Sequence[str]): The canonical form of every word.
+            signatures (Sequence[int]): The signature of the middle characters of every word.
+        """
+        self.storage.add_precomputed_words(words, canonical_words, signatures)
+
+    def remove_words(self, words: Iterable[str]) -> None:
+        """
+        Removes words of the wrapped storage. The cached values of the words stay valid, so they are kept.
+
+        Args:
+            words (Iterable[str]): The words to remove.
+        """
+        self.storage.remove_words(words)
+
+    def clear(self) -> None:
+        """
+        Removes all the words of the wrapped storage and empties the cache, since the signatures
+        depend on the signature encoder that is reset.
+        """
+        self.storage.clear()
+        self._cache.clear()
+        self.cache_bytes = 0
+
+    def contains_word(self, word: str) -> bool:
+        """
+        Checks if the wrapped storage contains the given word.
+
+        Args:
+            word (str): The word to check.
+
+        Returns:
+            bool: True if the word exists, False otherwise.
+        """
+        return self.storage.contains_word(word)
+
+    def get_all_words(self) -> set[str]:
+        """
+        Retrieves all original words from the wrapped storage.
+
+        Returns:
+            set[str]: A set of all words in the storage.
+        """
+        return self.storage.get_all_words()
+
+    def iter_words(self) -> Iterator[str]:
+        """
+        Iterates over the words of the wrapped storage.
+
+        Returns:
+            Iterator[str]: The words of the storage.
+        """
+        return self.storage.iter_words()
+
+    def iter_word_groups(self) -> Iterator[WordGroup]:
+        """
+        Iterates over the words of the wrapped storage grouped by length and by first and last letters.
+
+        Returns:
+            Iterator[WordGroup]: The length, the first and last letters, and the words of every group.
+        """
+        return self.storage.iter_word_groups()
+
+    def get_word_count(self) -> int:
+        """
+        Retrieves the number of words in the wrapped storage.
+
+        Returns:
+            int: The number of words.
+        """
+        return self.storage.get_word_count()
+
+    def get_canonical_word(self, word: str) -> str:
+        """
+        Retrieves the canonical form of the given word, from the cache if possible.
+
+        Args:
+            word (str): The word to canonicalize.
+
+        Returns:
+            str: The canonical form of the word.
+        """
+        return self._get_cached(_CANONICAL, word, self.storage.get_canonical_word)
+
+    def get_signature(self, word: str) -> int:
+        """
+        Retrieves the signature of the middle characters of the given word, from the cache if possible.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The signature of the middle characters of the word.
+        """
+        return self._get_cached(_SIGNATURE, word, self.storage.get_signature)
+
+    def get_signature_encoder(self) -> MultisetSignatureEncoder:
+        """
+        Retrieves the encoder of the signatures of the wrapped storage.
+
+        Returns:
+            MultisetSignatureEncoder: The signature encoder.
+        """
+        return self.storage.get_signature_encoder()
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Retrieves the statistics of the cache.
+
+        Returns:
+            dict[str, int]: The number of cache hits, misses and evictions, the number of cached values
+                            and the approximate memory they use.
+        """
+        return {
+            **self.stats.to_counters("canonical_cache"),
+            "canonical_cache_entries": len(self._cache),
+            "canonical_cache_bytes": self.cache_bytes,
+        }
+
+    def _get_cached(self, kind: int, word: str, compute: Callable[[str], Union[str, int]]) -> Union[str, int]:
+        """
+        Retrieves a value from the cache, or computes and caches it.
+
+        Args:
+            kind (int): The kind of the value (canonical form or signature).
+            word (str): The word.
+            compute (Callable[[str], Union[str, int]]): Computes the value of a word.
+
+        Returns:
+            Union[str, int]: The value.
+        """
+        key = (kind, word)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self.stats.hits += 1
+            self._cache.move_to_end(key)
+            return entry[0]
+
+        self.stats.misses += 1
+        value = compute(word)
+        size = sys.getsizeof(value) + CACHE_ENTRY_OVERHEAD
+        if size > self.max_cache_bytes:
+            return value
+
+        # Evict the least recently used values until the new value fits in the budget
+        while self.cache_bytes + size > self.max_cache_bytes:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self.cache_bytes -= evicted_size
+            self.stats.evictions += 1
+
+        self._cache[key] = (value, size)
+        self.cache_bytes += size
+        return value
@@ -0,0 +1,345 @@
+"""
+Module for implementing a compact data storage for large dictionaries.
+"""
+
+# Imports
+import sys
+from bisect import bisect_left
+from itertools import chain
+from typing import Collection, Iterable, Iterator, Sequence, Tuple
+from dictionary.dictionary_data_storage import DictionaryDataStorage, WordGroup
+from dictionary.dictionary_utils import compute_canonical_form
+from dictionary.multiset_signature import MultisetSignatureEncoder
+
+# Key of a group of words: (length, first letter, last letter)
+GroupKey = Tuple[int, str, str]
+
+# Minimum number of words that are buffered before they are merged into the compact groups
+DEFAULT_COMPACTION_THRESHOLD = 1 << 16
+
+
+class _MiddleSequence:
+    """
+    Read-only sequence view over the middles of the words of a group, used for binary searches.
+    """
+
+    def __init__(self, buffer: str, middle_length: int):
+        """
+        Initializes the view.
+
+        Args:
+            buffer (str): The concatenated middles of the words of the group.
+            middle_length (int): The length of the middle of every word of the group (positive).
+        """
+        self.buffer: str = buffer
+        self.middle_length: int = middle_length
+
+    def __len__(self) -> int:
+        """Returns the number of words of the group."""
+        return len(self.buffer) // self.middle_length
+
+    def __getitem__(self, index: int) -> str:
+        """Returns the middle of the word at the given index."""
+        start = index * self.middle_length
+        return self.buffer[start: start + self.middle_length]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the middles of the words of the group."""
+        buffer = self.buffer
+        middle_length = self.middle_length
+        return (buffer[start: start + middle_length] for start in range(0, len(buffer), middle_length))
+
+
+class _GroupWords:
+    """
+    Read-only collection view over the words of a group, which rebuilds the words from their middles on demand.
+    """
+
+    def __init__(self, middles: _MiddleSequence, first: str, last: str):
+        """
+        Initializes the view.
+
+        Args:
+            middles (_MiddleSequence): The middles of the words of the group.
+            first (str): The first letter of the words of the group.
+            last (str): The last letter of the words of the group.
+        """
+        self.middles: _MiddleSequence = middles
+        self.first: str = first
+        self.last: str = last
+
+    def __len__(self) -> int:
+        """Returns the number of words of the group."""
+        return len(self.middles)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the words of the group, in alphabetical order."""
+        first = self.first
+        last = self.last
+        return (first + middle + last for middle in self.middles)
+
+    def __contains__(self, word: object) -> bool:
+        """Checks whether a word belongs to the group."""
+        if not isinstance(word, str) or len(word) != self.middles.middle_length + 2:
+            return False
+        if word[0] != self.first or word[-1] != self.last:
+            return False
+
+        middle = word[1:-1]
+        index = bisect_left(self.middles, middle)
+        return index < len(self.middles) and self.middles[index] == middle
+
+
+class CompactDictionaryStorage(DictionaryDataStorage):
+    """
+    Implements a dictionary data storage with a compact memory layout, for dictionaries of millions of words.
+
+    Words are grouped by (length, first letter, last letter). Since all the words of a group share
+    their length and their first and last letters, a group only stores the middles of its words,
+    sorted and concatenated in a single string buffer: the middle of the `i`-th word starts at offset
+    `i * (length - 2)` of the buffer, so no per-word object, offset or length is kept. Membership is
+    checked with a binary search in the buffer of the group of the word. A word costs about `length - 2`
+    bytes (for words of one-byte characters) instead of the ~100 bytes of a string in a Python set.
+
+    Added words are buffered in a set and merged into the groups in batches, when the buffer grows
+    beyond a fraction of the dictionary or when the words are read. Like `SetDictionaryStorage`, the
+    canonical forms and signatures are computed on demand.
+    """
+
+    def __init__(self, compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD):
+        """
+        Initializes the CompactDictionaryStorage.
+
+        Args:
+            compaction_threshold (int): Minimum number of buffered words that triggers a merge into the groups.
+
+        Raises:
+            ValueError: If `compaction_threshold` is not positive.
+        """
+        if compaction_threshold < 1:
+            raise ValueError(f"The compaction threshold ({compaction_threshold}) must be positive.")
+
+        self.compaction_threshold: int = compaction_threshold
+        self.groups: dict[GroupKey, str] = {}
+        self.word_count: int = 0
+        self.signature_encoder: MultisetSignatureEncoder = MultisetSignatureEncoder()
+        self._pending: set[str] = set()
+
+    def add_word(self, word: str) -> None:
+        """
+        Adds a word that is not in the storage yet. The membership is not checked again here, since the
+        `Dictionary` already checks it for every word.
+
+        Args:
+            word (str): The word to add.
+        """
+        self._pending.add(word)
+        self.word_count += 1
+        self.signature_encoder.register(word)
+
+        # Merge geometrically growing batches, so that every word is copied a bounded number of times
+        if len(self._pending) >= max(self.compaction_threshold, self.word_count // 4):
+            self.compact()
+
+    def add_precomputed_words(self, words: Sequence[str], canonical_words: Sequence[str],
+                              signatures: Sequence[int]) -> None:
+        """
+        Adds words in bulk, merging them into the compact groups at once. Their canonical forms and signatures
+        are computed on demand, so they are ignored.
+
+        Args:
+            words (Sequence[str]): The words to add.
+            canonical_words (Sequence[str]): The canonical form of every word.
+            signatures (Sequence[int]): The signature of the middle characters of every word.
+        """
+        del canonical_words, signatures
+        self._pending.update(words)
+        self.word_count += len(words)
+        self.compact()
+
+    def remove_words(self, words: Iterable[str]) -> None:
+        """
+        Removes words of the storage. The buffered words are merged first, and every group that loses
+        words is rebuilt once.
+
+        Args:
+            words (Iterable[str]): The words to remove.
+        """
+        self.compact()
+
+        removed_middles: dict[GroupKey, set[str]] = {}
+        for word in words:
+            removed_middles.setdefault((len(word), word[0], word[-1]), set()).add(word[1:-1])
+            self.word_count -= 1
+
+        for key, middles in removed_middles.items():
+            length = key[0]
+            kept = [] if length <= 2 else [middle for middle in _MiddleSequence(self.groups[key], length - 2)
+                                           if middle not in middles]
+            if kept:
+                self.groups[key] = "".join(kept)
+            else:
+                del self.groups[key]
+
+    def clear(self) -> None:
+        """
+        Removes all the words of the storage and resets its signature encoder.
+        """
+        self.groups = {}
+        self.word_count = 0
+        self.signature_encoder = MultisetSignatureEncoder()
+        self._pending = set()
+
+    def contains_word(self, word: str) -> bool:
+        """
+        Checks if the storage contains the given word.
+
+        Args:
+            word (str): The word to check.
+
+        Returns:
+            bool: True if the word exists, False otherwise.
+        """
+        if not word:
+            return False
+        if word in self._pending:
+            return True
+
+        buffer = self.groups.get((len(word), word[0], word[-1]))
+        if buffer is None:
+            return False
+        if len(word) <= 2:
+            # The word is the only one of its group
+            return True
+        return word in _GroupWords(_MiddleSequence(buffer, len(word) - 2), word[0], word[-1])
+
+    def get_all_words(self) -> set[str]:
+        """
+        Retrieves all original words in the dictionary.
+
+        Note:
+            The words are expanded into a new set on every call. Use `iter_words` or `iter_word_groups`
+            to go through the words of a large dictionary.
+
+        Returns:
+            set[str]: A set containing all the original dictionary words.
+        """
+        return set(self.iter_words())
+
+    def iter_words(self) -> Iterator[str]:
+        """
+        Iterates over the words of the dictionary, without building a set of all the words.
+
+        Returns:
+            Iterator[str]: The dictionary words, grouped by length and by first and last letters.
+        """
+        return chain.from_iterable(words for _, _, _, words in self.iter_word_groups())
+
+    def iter_word_groups(self) -> Iterator[WordGroup]:
+        """
+        Iterates over the words of the dictionary grouped by length and by first and last letters.
+        Every group is yielded once.
+
+        Yields:
+            WordGroup: The length, the first and last letters, and the words of every group.
+        """
+        self.compact()
+        for (length, first, last), buffer in self.groups.items():
+            yield length, first, last, self._expand_group(length, first, last, buffer)
+
+    def get_word_count(self) -> int:
+        """
+        Retrieves the number of words in the dictionary.
+
+        Returns:
+            int: The number of words.
+        """
+        return self.word_count
+
+    def get_canonical_word(self, word: str) -> str:
+        """
+        Computes and returns the canonical form of the given word.
+
+        Args:
+            word (str): The word to canonicalize.
+
+        Returns:
+            str: The canonical form of the word.
+        """
+        return compute_canonical_form(word)
+
+    def get_signature(self, word: str) -> int:
+        """
+        Computes and returns the signature of the middle characters of the given word.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The signature of the middle characters of the word.
+        """
+        return self.signature_encoder.encode_middle(word)
+
+    def get_signature_encoder(self) -> MultisetSignatureEncoder:
+        """
+        Retrieves the encoder of the signatures.
+
+        Returns:
+            MultisetSignatureEncoder: The signature encoder.
+        """
+        return self.signature_encoder
+
+    def get_memory_usage(self) -> int:
+        """
+        Retrieves the approximate memory used by the words of the storage.
+
+        Returns:
+            int: The size in bytes of the group buffers, of their keys and of the buffered words.
+        """
+        groups_size = sys.getsizeof(self.groups) + sum(sys.getsizeof(key) + sys.getsizeof(buffer)
+                                                       for key, buffer in self.groups.items())
+        pending_size = sys.getsizeof(self._pending) + sum(sys.getsizeof(word) for word in self._pending)
+        return groups_size + pending_size
+
+    def compact(self) -> None:
+        """
+        Merges the buffered words into the compact groups.
+        """
+        if not self._pending:
+            return
+
+        new_middles: dict[GroupKey, list[str]] = {}
+        for word in self._pending:
+            new_middles.setdefault((len(word), sys.intern(word[0]), sys.intern(word[-1])), []).append(word[1:-1])
+        self._pending = set()
+
+        for key, middles in new_middles.items():
+            length = key[0]
+            if length <= 2:
+                # Words of length two or less have no middle: the group only records that the word exists
+                self.groups[key] = ""
+                continue
+
+            buffer = self.groups.get(key, "")
+            self.groups[key] = "".join(sorted(chain(_MiddleSequence(buffer, length - 2), middles)))
+
+    @staticmethod
+    def _expand_group(length: int, first: str, last: str, buffer: str) -> Collection[str]:
+        """
+        Rebuilds the words of a group.
+
+        Args:
+            length (int): The length of the words of the group.
+            first (str): The first letter of the words of the group.
+            last (str): The last letter of the words of the group.
+            buffer (str): The concatenated middles of the words of the group.
+
+        Returns:
+            Collection[str]: The words of the group, rebuilt when they are iterated.
+        """
+        if length == 1:
+            return (first,)
+        if length == 2:
+            return (first + last,)
+
+        return _GroupWords(_MiddleSequence(buffer, length - 2), first, last)
@@ -3,12 +3,26 @@ Module for managing a dictionary using customizable storage.
 """
 
 # Imports
+import hashlib
 import os
-from dictionary.dictionary_data_storage import DictionaryDataStorage
+import time
+from typing import Iterable, Iterator, Mapping, Optional, Tuple
+from dictionary.dictionary_data_storage import DictionaryDataStorage, WordGroup
 from dictionary.dictionary_errors import DictionaryError
-from dictionary.dictionary_utils import validate_word_length_or_raise, validate_total_length_or_raise
+from dictionary.dictionary_utils import (
+    format_total_length_violation,
+    format_word_length_violation,
+    validate_total_length_or_raise,
+    validate_word_length_or_raise,
+)
 from dictionary.dictionary_config import DictionaryConfig
+from dictionary.multiset_signature import MultisetSignatureEncoder
 from log.logger import Logger
+from log.null_logger import NullLogger
+
+# Equivalence classes of the words sharing their length and their first and last letters:
+# (length, first, last, number of words by signature of the middle characters of the class)
+EquivalenceClassGroup = Tuple[int, str, str, Mapping[int, int]]
 
 
 class Dictionary:
@@ -17,6 +31,11 @@ class Dictionary:
 
     This class provides high-level operations for managing a dictionary, such as
     adding words, checking for duplicates, and retrieving canonical forms.
+
+    The dictionary also keeps the equivalence classes of its words, i.e. the number of words of every
+    length, first and last letters and signature of the middle characters, so that words that are scrambled
+    forms of each other are matched once, and a fingerprint of its contents. Both are built on first use
+    (or with `build_equivalence_classes`) and rebuilt after words are added.
     """
     def __init__(self, storage: DictionaryDataStorage, dictionary_config: DictionaryConfig, logger: Logger):
         """
@@ -31,6 +50,19 @@ class Dictionary:
         self.total_length_of_all_words: int = 0
         self.dictionary_data_storage: DictionaryDataStorage = storage
         self.logger: Logger = logger
+        self._equivalence_classes: Optional[dict[Tuple[int, str, str], dict[int, int]]] = None
+        self._fingerprint: Optional[bytes] = None
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state of the dictionary used for pickling (e.g. when sent to worker processes).
+
+        Returns:
+            dict: The attributes of the dictionary, with the logger replaced by a `NullLogger`.
+        """
+        state = self.__dict__.copy()
+        state["logger"] = NullLogger()
+        return state
 
     def add_word(self, word: str) -> None:
         """
@@ -55,6 +87,8 @@ class Dictionary:
         # Add the word
         self.dictionary_data_storage.add_word(word)
         self.total_length_of_all_words += len(word)
+        self._equivalence_classes = None
+        self._fingerprint = None
 
         # Validate total length
         validate_total_length_or_raise(total_length=self.total_length_of_all_words,
@@ -62,12 +96,84 @@ class Dictionary:
 
         self.logger.info(f"Word '{word}' added successfully.")
 
+    def add_words(self, words: Iterable[str]) -> int:
+        """
+        Adds a batch of words to the dictionary.
+
+        The words are validated and added in a single streaming pass, so that the batch is never held in
+        memory besides the storage: length constraints are checked for every word, duplicates (within the
+        batch or against the dictionary) are found with the membership check of the storage, and the total
+        length is checked once for the whole batch. All violations are reported together, and a single
+        summary record is logged instead of one record per word.
+
+        If any word violates the constraints, the added words are removed again. A batch loaded into an
+        empty dictionary (the usual case) is rolled back by clearing the storage; otherwise the added words
+        are remembered until the batch is validated.
+
+        Args:
+            words (Iterable[str]): The words to add.
+
+        Returns:
+            int: The number of added words.
+
+        Raises:
+            DictionaryError: If any word violates constraints (e.g., duplicate, invalid length), or if the
+                             total length of all words exceeds the configured maximum. The dictionary is
+                             left unchanged in this case.
+        """
+        start_time = time.perf_counter()
+        min_word_length = self.dictionary_config.min_word_length
+        max_word_length = self.dictionary_config.max_word_length
+        storage = self.dictionary_data_storage
+        contains_word = storage.contains_word
+        add_word = storage.add_word
+
+        # Words to remove on a violation (None when the storage is cleared instead)
+        added_words: Optional[list[str]] = [] if storage.get_word_count() else None
+        violations = []
+        added_count = 0
+        batch_length = 0
+
+        for word in words:
+            word_length = len(word)
+            if not min_word_length <= word_length <= max_word_length:
+                violations.append(format_word_length_violation(word, min_word_length, max_word_length))
+            elif contains_word(word):
+                violations.append(f"Duplicate word found: '{word}'")
+            else:
+                add_word(word)
+                if added_words is not None:
+                    added_words.append(word)
+                added_count += 1
+                batch_length += word_length
+
+        total_length = self.total_length_of_all_words + batch_length
+        if total_length > self.dictionary_config.max_sum_lengths_of_all_words:
+            violations.append(format_total_length_violation(total_length,
+                                                            self.dictionary_config.max_sum_lengths_of_all_words))
+
+        if violations:
+            if added_words is None:
+                storage.clear()
+            else:
+                storage.remove_words(added_words)
+            raise DictionaryError(f"{len(violations)} dictionary violation(s) found:\n" + "\n".join(violations))
+
+        self.total_length_of_all_words = total_length
+        self._equivalence_classes = None
+        self._fingerprint = None
+
+        self.logger.info(f"{added_count} words ({batch_length} characters) added successfully "
+                         f"in {time.perf_counter() - start_time:.3f} seconds.")
+        return added_count
+
     def load_from_file(self, dictionary_file_path: str) -> None:
         """
         Reads and validates words from the dictionary file.
 
         Validates each word against length constraints, checks for duplicates,
         and ensures the total length of all words does not exceed the configured limit.
+        The words are added as a single batch (see `add_words`).
 
         Raises:
             FileNotFoundError: If the dictionary file does not exist.
@@ -77,17 +183,26 @@ class Dictionary:
         if not os.path.exists(dictionary_file_path):
             raise FileNotFoundError(f"Dictionary file path '{dictionary_file_path}' does not exist!")
 
-        # Open the file and read line by line
-        with open(dictionary_file_path, mode="r", encoding="utf-8") as file:
+        empty_words = 0
+
+        def read_words(file) -> Iterator[str]:
+            nonlocal empty_words
             for line in file:
                 word = line.strip()
 
                 # Skip empty words
                 if not word:
-                    self.logger.warning(f"Empty word detected in {dictionary_file_path}. Skipping...")
+                    empty_words += 1
                     continue
 
-                self.add_word(word)
+                yield word
+
+        # Open the file and read line by line
+        with open(dictionary_file_path, mode="r", encoding="utf-8") as file:
+            self.add_words(read_words(file))
+
+        if empty_words:
+            self.logger.warning(f"{empty_words} empty word(s) detected in {dictionary_file_path}. Skipped.")
 
     def get_all_words(self) -> set[str]:
         """
@@ -98,6 +213,35 @@ class Dictionary:
          """
         return self.dictionary_data_storage.get_all_words()
 
+    def iter_words(self) -> Iterator[str]:
+        """
+        Iterates over the words of the dictionary, without building a new collection of all the words.
+
+        Returns:
+            Iterator[str]: The dictionary words.
+        """
+        return self.dictionary_data_storage.iter_words()
+
+    def iter_word_groups(self) -> Iterator[WordGroup]:
+        """
+        Iterates over the words of the dictionary grouped by length and by first and last letters.
+
+        Returns:
+            Iterator[WordGroup]: The length, the first and last letters, and the words of every group.
+                                 Depending on the storage, words of the same group may be split into
+                                 several groups.
+        """
+        return self.dictionary_data_storage.iter_word_groups()
+
+    def get_word_count(self) -> int:
+        """
+        Retrieves the number of words of the dictionary.
+
+        Returns:
+            int: The number of words.
+        """
+        return self.dictionary_data_storage.get_word_count()
+
     def get_canonical_word(self, word: str) -> str:
         """
         Retrieves the canonical form of the given word.
@@ -109,3 +253,136 @@ class Dictionary:
             str: The canonical form of the word.
         """
         return self.dictionary_data_storage.get_canonical_word(word)
+
+    def get_signature(self, word: str) -> int:
+        """
+        Retrieves the bit-packed signature of the middle characters of the given word.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The signature of the middle characters of the word.
+        """
+        return self.dictionary_data_storage.get_signature(word)
+
+    def get_signature_encoder(self) -> MultisetSignatureEncoder:
+        """
+        Retrieves the encoder of the signatures of the dictionary words.
+
+        Returns:
+            MultisetSignatureEncoder: The signature encoder.
+        """
+        return self.dictionary_data_storage.get_signature_encoder()
+
+    def get_fingerprint(self) -> bytes:
+        """
+        Retrieves a fingerprint of the words of the dictionary, which identifies the dictionary contents
+        (e.g. in the keys of a persistent result cache).
+
+        The fingerprint does not depend on the order of the words or on the storage: it is the digest of the
+        number of words and of the sum of the 128-bit BLAKE2b digests of the words. It is computed on first
+        use and recomputed after words are added.
+
+        Returns:
+            bytes: The 128-bit fingerprint.
+        """
+        if self._fingerprint is None:
+            digest_sum = 0
+            for word in self.iter_words():
+                word_digest = hashlib.blake2b(word.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+                digest_sum += int.from_bytes(word_digest, "little")
+            contents = f"{self.get_word_count()}:{digest_sum % (1 << 128)}".encode("ascii")
+            self._fingerprint = hashlib.blake2b(contents, digest_size=16).digest()
+
+        return self._fingerprint
+
+    def build_equivalence_classes(self) -> None:
+        """
+        Builds the equivalence classes of the dictionary words if they are not built yet.
+
+        Match engines call this method when they are created, so that the classes are built once, before
+        the first input string, and are part of the pickled state sent to the worker processes.
+        """
+        self._get_equivalence_classes()
+
+    def set_equivalence_classes(self, equivalence_classes: dict[Tuple[int, str, str], dict[int, int]]) -> None:
+        """
+        Sets the equivalence classes of the dictionary words, built beforehand (e.g. loaded from a dictionary
+        snapshot), so that they are not built again.
+
+        Args:
+            equivalence_classes (dict[Tuple[int, str, str], dict[int, int]]): The number of words of every class
+                                                                              by signature, by length and first
+                                                                              and last letters.
+        """
+        self._equivalence_classes = equivalence_classes
+
+    def iter_equivalence_classes(self) -> Iterator[EquivalenceClassGroup]:
+        """
+        Iterates over the equivalence classes of the dictionary words, grouped by length and by first and
+        last letters.
+
+        Returns:
+            Iterator[EquivalenceClassGroup]: The length, the first and last letters, and the number of words
+                                             of every class by signature of its middle characters. Every group
+                                             is yielded once.
+        """
+        return ((length, first, last, classes)
+                for (length, first, last), classes in self._get_equivalence_classes().items())
+
+    def get_equivalence_class_size(self, word: str) -> int:
+        """
+        Retrieves the number of dictionary words that are scrambled forms of the given word.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The number of words of the equivalence class of the word, or 0 if no dictionary word is a
+                 scrambled form of the word.
+        """
+        classes = self._get_equivalence_classes().get((len(word), word[0], word[-1])) if word else None
+        return classes.get(self.get_signature(word), 0) if classes else 0
+
+    def get_equivalence_class_count(self) -> int:
+        """
+        Retrieves the number of equivalence classes of the dictionary words.
+
+        Returns:
+            int: The number of distinct canonical forms of the dictionary words.
+        """
+        return sum(len(classes) for classes in self._get_equivalence_classes().values())
+
+    def get_max_word_length(self) -> int:
+        """
+        Retrieves the length of the longest dictionary word.
+
+        Returns:
+            int: The length of the longest dictionary word, or 0 if the dictionary is empty.
+        """
+        return max((length for length, _, _ in self._get_equivalence_classes()), default=0)
+
+    def _get_equivalence_classes(self) -> dict[Tuple[int, str, str], dict[int, int]]:
+        """
+        Retrieves the equivalence classes of the dictionary words, building them if needed.
+
+        The words of a class share their length, their first and last letters and the signature of their middle
+        characters, so a class is identified by these without building its canonical form, and only its number
+        of words is kept.
+
+        Returns:
+            dict[Tuple[int, str, str], dict[int, int]]: The number of words of every class by signature, by length
+                                                        and first and last letters.
+        """
+        if self._equivalence_classes is None:
+            equivalence_classes: dict[Tuple[int, str, str], dict[int, int]] = {}
+            get_signature = self.get_signature
+            for length, first, last, words in self.iter_word_groups():
+                classes = equivalence_classes.setdefault((length, first, last), {})
+                for word in words:
+                    signature = get_signature(word)
+                    classes[signature] = classes.get(signature, 0) + 1
+            self._equivalence_classes = equivalence_classes
+
+        return self._equivalence_classes
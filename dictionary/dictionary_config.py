@@ -30,6 +30,12 @@ class DictionaryConfig(Config):
         description="Maximum sum of all dictionary word lengths (must be positive)."
     )
 
+    canonical_cache_bytes: int = Field(
+        default=0,
+        ge=0,
+        description="Memory budget in bytes of the cache of canonical forms and signatures (0 disables the cache)."
+    )
+
     @model_validator(mode='after')
     def validate_attributes(self):
         """
@@ -3,6 +3,11 @@ Abstract module for dictionary data storage.
 """
 
 from abc import ABC, abstractmethod
+from typing import Collection, Iterable, Iterator, Sequence, Tuple
+from dictionary.multiset_signature import MultisetSignatureEncoder
+
+# Group of words sharing their length and their first and last letters: (length, first, last, words)
+WordGroup = Tuple[int, str, str, Collection[str]]
 
 
 class DictionaryDataStorage(ABC):
@@ -14,13 +19,51 @@ class DictionaryDataStorage(ABC):
     @abstractmethod
     def add_word(self, word: str) -> None:
         """
-        Adds a word to the storage.
+        Adds a word that is not in the storage yet (the `Dictionary` checks the duplicates).
 
         Args:
             word (str): The word to add.
         """
         pass
 
+    @abstractmethod
+    def remove_words(self, words: Iterable[str]) -> None:
+        """
+        Removes words of the storage, e.g. to roll back a batch of words that failed validation.
+
+        Args:
+            words (Iterable[str]): The words to remove, which must be in the storage.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Removes all the words of the storage and resets its signature encoder.
+        """
+        pass
+
+    def add_precomputed_words(self, words: Sequence[str], canonical_words: Sequence[str],
+                              signatures: Sequence[int]) -> None:
+        """
+        Adds words that are not in the storage yet, whose canonical forms and signatures have already been
+        computed (e.g. loaded from a dictionary snapshot). The letters of the words are already registered in
+        the signature encoder of the storage.
+
+        Storages should override this method to add the words in bulk, and to keep the canonical forms and
+        signatures instead of recomputing them if they store them. The sequences may compute their items on
+        access, so that storages that do not use them do not pay for them. This default implementation adds
+        the words one at a time.
+
+        Args:
+            words (Sequence[str]): The words to add.
+            canonical_words (Sequence[str]): The canonical form of every word.
+            signatures (Sequence[int]): The signature of the middle characters of every word.
+        """
+        del canonical_words, signatures
+        for word in words:
+            self.add_word(word)
+
     @abstractmethod
     def contains_word(self, word: str) -> bool:
         """
@@ -44,6 +87,40 @@ class DictionaryDataStorage(ABC):
          """
         pass
 
+    def iter_words(self) -> Iterator[str]:
+        """
+        Iterates over the words of the storage, without building a new collection of all the words.
+
+        Storages that do not keep their words in a set should override this method.
+
+        Returns:
+            Iterator[str]: The words of the storage.
+        """
+        return iter(self.get_all_words())
+
+    def iter_word_groups(self) -> Iterator[WordGroup]:
+        """
+        Iterates over the words of the storage grouped by length and by first and last letters.
+
+        This default implementation yields every word in a group of its own. Storages that keep their
+        words grouped should override it to yield every group once, so that the work shared by the
+        words of a group is done once.
+
+        Yields:
+            WordGroup: The length, the first and last letters, and the words of every group.
+        """
+        for word in self.iter_words():
+            yield len(word), word[0], word[-1], (word,)
+
+    def get_word_count(self) -> int:
+        """
+        Retrieves the number of words in the storage.
+
+        Returns:
+            int: The number of words.
+        """
+        return len(self.get_all_words())
+
     @abstractmethod
     def get_canonical_word(self, word: str) -> str:
         """
@@ -60,3 +137,34 @@ class DictionaryDataStorage(ABC):
             this method should compute the canonical form dynamically.
         """
         pass
+
+    @abstractmethod
+    def get_signature(self, word: str) -> int:
+        """
+        Retrieves the bit-packed signature of the middle characters of the given word.
+
+        Two words of the same length with the same first and last letters are scrambled forms of each
+        other if and only if their signatures are equal.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The signature of the middle characters of the word, encoded with the encoder
+                 returned by `get_signature_encoder`.
+
+        Note:
+            If the storage does not contain precomputed signatures,
+            this method should compute the signature dynamically.
+        """
+        pass
+
+    @abstractmethod
+    def get_signature_encoder(self) -> MultisetSignatureEncoder:
+        """
+        Retrieves the encoder of the signatures, whose alphabet contains the letters of all the stored words.
+
+        Returns:
+            MultisetSignatureEncoder: The signature encoder.
+        """
+        pass
@@ -0,0 +1,82 @@
+"""
+Module for detecting changes to the contents of a dictionary file.
+"""
+
+# Imports
+import os
+from typing import Optional, Tuple
+from utils.file_utils import compute_file_digest
+
+
+class DictionaryFileWatcher:
+    """
+    Detects changes to the contents of a dictionary file by polling it.
+
+    Every poll compares the modification time and the size of the file with those of the contents that were
+    last seen, which costs a single `stat`. Once they differ, the file must keep the same modification time
+    and size until the next poll, so a file that is still being written is not reported, and only then is the
+    SHA-256 digest of the contents computed: a file that is touched or rewritten with the same contents is
+    not reported.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initializes the DictionaryFileWatcher with the current contents of the file.
+
+        Args:
+            file_path (str): Path to the dictionary file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        self.file_path: str = file_path
+        self._file_stat: Optional[Tuple[int, int]] = self._get_file_stat()
+        self._digest: bytes = compute_file_digest(file_path)
+        # Modification time and size of a change that is waiting to be stable
+        self._pending_file_stat: Optional[Tuple[int, int]] = None
+
+    def poll(self) -> bool:
+        """
+        Checks whether the contents of the file have changed since they were last seen. A change is
+        reported once, and its contents are then the ones seen, whether the caller manages to load them or not.
+
+        Returns:
+            bool: True if the contents of the file have changed and the file is stable, otherwise False.
+                  A file that cannot be read, for example while it is being replaced, is reported unchanged.
+        """
+        file_stat = self._get_file_stat()
+        if file_stat is None or file_stat == self._file_stat:
+            self._pending_file_stat = None
+            return False
+
+        # The file is changing, so it is only read once it is stable for a poll
+        if file_stat != self._pending_file_stat:
+            self._pending_file_stat = file_stat
+            return False
+
+        try:
+            digest = compute_file_digest(self.file_path)
+        except OSError:
+            return False
+
+        self._file_stat = file_stat
+        self._pending_file_stat = None
+        if digest == self._digest:
+            return False
+
+        self._digest = digest
+        return True
+
+    def _get_file_stat(self) -> Optional[Tuple[int, int]]:
+        """
+        Gets the modification time and the size of the file.
+
+        Returns:
+            Optional[Tuple[int, int]]: The modification time in nanoseconds and the size in bytes,
+                                       or None if the file cannot be accessed.
+        """
+        try:
+            file_stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
@@ -0,0 +1,103 @@
+"""
+Module for a compiled, signature-indexed view of a dictionary.
+"""
+
+# Imports
+from typing import Tuple
+from dictionary.dictionary import Dictionary
+from dictionary.multiset_signature import MultisetSignatureEncoder
+
+# Signature of a word: (length, first character, last character, bit-packed signature of the middle characters)
+Signature = Tuple[int, str, str, int]
+
+
+def compute_signature(word: str, middle_signature: int) -> Signature:
+    """
+    Computes the signature of a word from the signature of its middle characters.
+
+    Args:
+        word (str): The word.
+        middle_signature (int): The bit-packed signature of the middle characters of the word
+                                (see `MultisetSignatureEncoder`).
+
+    Returns:
+        Signature: The signature of the word.
+    """
+    return len(word), word[0], word[-1], middle_signature
+
+
+class DictionaryIndex:
+    """
+    Compiled index that maps the signature of the dictionary words to the words satisfying it.
+
+    A signature consists of the length, the first character, the last character and the bit-packed
+    multiset signature of the middle characters of a word (see `MultisetSignatureEncoder`), so the
+    signature of a window is obtained from the prefix signatures of the input string. Words that share
+    a signature are anagram-equivalent with respect to the scrambling rule, so a single probe of the
+    index with the signature of a substring identifies all the dictionary words that the substring matches.
+    """
+
+    def __init__(self, dictionary: Dictionary):
+        """
+        Compiles the DictionaryIndex from the words of the given dictionary.
+
+        Args:
+            dictionary (Dictionary): Instance of Dictionary to fetch dictionary data.
+        """
+        self.signature_encoder: MultisetSignatureEncoder = dictionary.get_signature_encoder()
+        self.signatures: dict[Signature, set[str]] = {}
+        self.endpoints_by_length: dict[int, set[Tuple[str, str]]] = {}
+        self.signatures_by_length: dict[int, list[Signature]] = {}
+
+        for dict_word in dictionary.iter_words():
+            signature = compute_signature(dict_word, dictionary.get_signature(dict_word))
+            self.signatures.setdefault(signature, set()).add(dict_word)
+            self.endpoints_by_length.setdefault(len(dict_word), set()).add((dict_word[0], dict_word[-1]))
+
+        for signature in self.signatures:
+            self.signatures_by_length.setdefault(signature[0], []).append(signature)
+
+    def get_lengths(self) -> list[int]:
+        """
+        Retrieves the distinct lengths of the dictionary words.
+
+        Returns:
+            list[int]: The distinct word lengths.
+        """
+        return list(self.endpoints_by_length)
+
+    def get_endpoints(self, length: int) -> set[Tuple[str, str]]:
+        """
+        Retrieves the (first character, last character) pairs of the dictionary words of the given length.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            set[Tuple[str, str]]: The endpoint pairs of the words of the given length.
+        """
+        return self.endpoints_by_length.get(length, set())
+
+    def get_words(self, signature: Signature) -> set[str]:
+        """
+        Retrieves the dictionary words that satisfy the given signature.
+
+        Args:
+            signature (Signature): The signature to look up.
+
+        Returns:
+            set[str]: The words satisfying the signature (empty if there are none).
+        """
+        return self.signatures.get(signature, set())
+
+    def get_signatures(self, length: int) -> list[Signature]:
+        """
+        Retrieves the distinct signatures of the dictionary words of the given length.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            list[Signature]: The signatures of the words of the given length.
+        """
+        return self.signatures_by_length.get(length, [])
@@ -0,0 +1,536 @@
+"""
+Module for compiling a dictionary into a binary snapshot and loading it back.
+
+A snapshot contains the validated words of a dictionary together with their canonical forms, the alphabet
+of the signature encoder, and the signatures and the equivalence classes of the words, so that loading it
+skips the validation, the duplicate checks and the computation of canonical forms, signatures and equivalence
+classes. Every section is decoded in bulk.
+
+Snapshot layout (all integers are little-endian, and every section is prefixed by its length in bytes):
+    - Header: magic, format version, SHA-256 digest, size and modification time of the source dictionary file,
+      field width of the signatures and number of bytes of their stored count fields, the `DictionaryConfig`
+      limits, the number of words, the total length of all words, the number of equivalence classes and the
+      number of groups of classes sharing their length and their first and last letters.
+    - Words section: the UTF-8 encoded words, separated by line feeds.
+    - Canonical section: the canonical forms of the words, with the same layout.
+    - Alphabet section: the UTF-8 encoded letters of the signature encoder, in the order of their codes.
+    - Word classes section: the index of the equivalence class of every word (unsigned 64-bit).
+    - Group sections: the length of the words of every group (unsigned 64-bit), the first letters and the
+      last letters of the groups (UTF-8 encoded, one letter per group), and the number of classes of every
+      group (unsigned 64-bit). The classes are numbered group by group.
+    - Class sizes section: the number of words of every class (unsigned 64-bit).
+    - Class signatures section: `class_count + 1` offsets (unsigned 64-bit) of the signatures of the classes,
+      in count fields, followed by their concatenation. Only the low bytes of the count fields are stored,
+      as the counts are bounded by the maximum word length.
+"""
+
+# Imports
+import mmap
+import os
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Iterable, Iterator, List, Tuple
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.dictionary_data_storage import DictionaryDataStorage
+from dictionary.dictionary_errors import DictionaryError
+from log.logger import Logger
+from utils.file_utils import compute_file_digest, create_parent_directories
+
+SNAPSHOT_MAGIC = b"SSFDICT\0"
+SNAPSHOT_VERSION = 2
+
+# magic, version, source digest, source size and modification time, signature field width and count bytes,
+# min/max word length, max sum of lengths, word count, total length, class count, group count
+_HEADER = struct.Struct("<8sH32sQQQQQQQQQQQ")
+_SECTION_LENGTH = struct.Struct("<Q")
+_INTEGER_SIZE = 8
+_SEPARATOR = "\n"
+
+# Equivalence classes of the dictionary words: the number of words of every class by signature, by length and
+# first and last letters
+EquivalenceClasses = dict[Tuple[int, str, str], dict[int, int]]
+
+
+class _WordSignatures:
+    """
+    Read-only sequence view over the signatures of the words, which are the signatures of their classes.
+    """
+
+    def __init__(self, class_signatures: List[int], word_classes: array):
+        """
+        Initializes the view.
+
+        Args:
+            class_signatures (List[int]): The signature of every equivalence class.
+            word_classes (array): The index of the equivalence class of every word.
+        """
+        self.class_signatures: List[int] = class_signatures
+        self.word_classes: array = word_classes
+
+    def __len__(self) -> int:
+        """Returns the number of words."""
+        return len(self.word_classes)
+
+    def __getitem__(self, index: int) -> int:
+        """Returns the signature of the word at the given index."""
+        return self.class_signatures[self.word_classes[index]]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over the signatures of the words."""
+        return map(self.class_signatures.__getitem__, self.word_classes)
+
+
+def _pack_section(data: bytes) -> bytes:
+    """
+    Prefixes the contents of a section with its length.
+
+    Args:
+        data (bytes): The contents of the section.
+
+    Returns:
+        bytes: The packed section.
+    """
+    return _SECTION_LENGTH.pack(len(data)) + data
+
+
+def _pack_integers(values: Iterable[int]) -> bytes:
+    """
+    Packs unsigned 64-bit integers into a section.
+
+    Args:
+        values (Iterable[int]): The integers to pack.
+
+    Returns:
+        bytes: The packed section.
+    """
+    packed = array("Q", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return _pack_section(packed.tobytes())
+
+
+def _pack_strings(strings: List[str]) -> bytes:
+    """
+    Packs strings into a section, separated by line feeds.
+
+    Args:
+        strings (List[str]): The strings to pack.
+
+    Returns:
+        bytes: The packed section.
+
+    Raises:
+        DictionaryError: If a string contains a line feed.
+    """
+    text = _SEPARATOR.join(strings)
+    if text.count(_SEPARATOR) != max(len(strings) - 1, 0):
+        raise DictionaryError("Words containing line feeds cannot be compiled into a dictionary index.")
+    return _pack_section(text.encode("utf-8"))
+
+
+def _pack_signatures(signatures: List[int], field_bytes: int, count_bytes: int) -> bytes:
+    """
+    Packs signatures into a section, keeping the low `count_bytes` bytes of every count field.
+
+    Args:
+        signatures (List[int]): The signatures.
+        field_bytes (int): The number of bytes of the count fields of the signatures.
+        count_bytes (int): The number of bytes of the stored count fields. Every count must fit in it.
+
+    Returns:
+        bytes: The packed section.
+    """
+    offsets = array("Q", [0])
+    packed = bytearray()
+    for signature in signatures:
+        fields = -(-signature.bit_length() // (field_bytes * 8))
+        wide = signature.to_bytes(fields * field_bytes, "little")
+        narrow = bytearray(fields * count_bytes)
+        for byte in range(count_bytes):
+            narrow[byte::count_bytes] = wide[byte::field_bytes]
+        packed += narrow
+        offsets.append(offsets[-1] + fields)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    return _pack_section(offsets.tobytes() + packed)
+
+
+def _read_section(buffer: memoryview, position: int) -> Tuple[bytes, int]:
+    """
+    Reads a section of the snapshot.
+
+    Args:
+        buffer (memoryview): The snapshot contents.
+        position (int): The offset of the section in the snapshot.
+
+    Returns:
+        Tuple[bytes, int]: The contents of the section and the offset following the section.
+    """
+    (section_length,) = _SECTION_LENGTH.unpack_from(buffer, position)
+    position += _SECTION_LENGTH.size
+    if position + section_length > len(buffer):
+        raise ValueError("section exceeds the end of the file")
+    return bytes(buffer[position: position + section_length]), position + section_length
+
+
+def _to_integers(data: bytes, count: int) -> array:
+    """
+    Converts the unsigned 64-bit integers at the start of the contents of a section.
+
+    Args:
+        data (bytes): The contents of the section.
+        count (int): The number of integers.
+
+    Returns:
+        array: The integers.
+    """
+    if count * _INTEGER_SIZE > len(data):
+        raise ValueError("section is shorter than its number of items")
+
+    values = array("Q")
+    values.frombytes(data[: count * _INTEGER_SIZE])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _unpack_integers(buffer: memoryview, position: int, count: int) -> Tuple[array, int]:
+    """
+    Unpacks a section created by `_pack_integers`.
+
+    Args:
+        buffer (memoryview): The snapshot contents.
+        position (int): The offset of the section in the snapshot.
+        count (int): The number of integers of the section.
+
+    Returns:
+        Tuple[array, int]: The unpacked integers and the offset following the section.
+    """
+    data, position = _read_section(buffer, position)
+    return _to_integers(data, count), position
+
+
+def _unpack_strings(buffer: memoryview, position: int, count: int) -> Tuple[List[str], int]:
+    """
+    Unpacks a section created by `_pack_strings`.
+
+    Args:
+        buffer (memoryview): The snapshot contents.
+        position (int): The offset of the section in the snapshot.
+        count (int): The number of strings of the section.
+
+    Returns:
+        Tuple[List[str], int]: The unpacked strings and the offset following the section.
+    """
+    data, position = _read_section(buffer, position)
+    strings = str(data, encoding="utf-8").split(_SEPARATOR) if count else []
+    if len(strings) != count:
+        raise ValueError("section does not have the expected number of items")
+    return strings, position
+
+
+def _unpack_signatures(buffer: memoryview, position: int, count: int, field_bytes: int,
+                       count_bytes: int) -> Tuple[List[int], int]:
+    """
+    Unpacks a section created by `_pack_signatures`. The count fields are widened in bulk, before the
+    signatures are converted.
+
+    Args:
+        buffer (memoryview): The snapshot contents.
+        position (int): The offset of the section in the snapshot.
+        count (int): The number of signatures of the section.
+        field_bytes (int): The number of bytes of the count fields of the signatures.
+        count_bytes (int): The number of bytes of the stored count fields.
+
+    Returns:
+        Tuple[List[int], int]: The unpacked signatures and the offset following the section.
+    """
+    data, position = _read_section(buffer, position)
+    offsets = _to_integers(data, count + 1)
+    narrow = memoryview(data)[(count + 1) * _INTEGER_SIZE:]
+    if len(narrow) != offsets[-1] * count_bytes:
+        raise ValueError("section does not have the expected length")
+
+    wide = bytearray(offsets[-1] * field_bytes)
+    for byte in range(count_bytes):
+        wide[byte::field_bytes] = narrow[byte::count_bytes]
+    # The signatures are sliced and converted without a Python loop
+    bounds = list(map(field_bytes.__mul__, offsets))
+    slices = map(wide.__getitem__, map(slice, bounds[:-1], bounds[1:]))
+    return list(map(int.from_bytes, slices, repeat("little"))), position
+
+
+def _compute_equivalence_classes(dictionary: Dictionary, words: List[str]) -> Tuple[List[int], EquivalenceClasses]:
+    """
+    Computes the equivalence classes of the words of a dictionary, and numbers them group by group.
+
+    Args:
+        dictionary (Dictionary): The dictionary.
+        words (List[str]): The words of the dictionary.
+
+    Returns:
+        Tuple[List[int], EquivalenceClasses]: The index of the class of every word, and the classes.
+    """
+    word_keys = []
+    equivalence_classes: EquivalenceClasses = {}
+    for word in words:
+        group_key = (len(word), word[0], word[-1])
+        signature = dictionary.get_signature(word)
+        classes = equivalence_classes.setdefault(group_key, {})
+        classes[signature] = classes.get(signature, 0) + 1
+        word_keys.append((group_key, signature))
+
+    class_indexes = {}
+    for group_key, classes in equivalence_classes.items():
+        for signature in classes:
+            class_indexes[group_key, signature] = len(class_indexes)
+    return [class_indexes[key] for key in word_keys], equivalence_classes
+
+
+def write_dictionary_snapshot(dictionary: Dictionary, source_file_path: str, snapshot_path: str) -> None:
+    """
+    Writes a binary snapshot of the dictionary.
+
+    Args:
+        dictionary (Dictionary): The loaded dictionary.
+        source_file_path (str): Path to the dictionary file the dictionary was loaded from.
+        snapshot_path (str): Path to the snapshot file to write.
+
+    Raises:
+        DictionaryError: If a word contains a line feed, or if the count fields of the signatures are not
+                         whole bytes.
+    """
+    config = dictionary.dictionary_config
+    words = sorted(dictionary.iter_words())
+    canonical_words = [dictionary.get_canonical_word(word) for word in words]
+    signature_encoder = dictionary.get_signature_encoder()
+    if signature_encoder.field_width % 8:
+        raise DictionaryError(f"Signatures with {signature_encoder.field_width}-bit count fields cannot be "
+                              f"compiled into a dictionary index.")
+    field_bytes = signature_encoder.field_width // 8
+    # A letter appears at most `max_word_length` times in a word
+    count_bytes = min(max(-(-config.max_word_length.bit_length() // 8), 1), field_bytes)
+
+    word_classes, equivalence_classes = _compute_equivalence_classes(dictionary, words)
+    groups = list(equivalence_classes)
+    class_count = sum(len(classes) for classes in equivalence_classes.values())
+
+    source_stat = os.stat(source_file_path)
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, compute_file_digest(source_file_path),
+                          source_stat.st_size, source_stat.st_mtime_ns, signature_encoder.field_width, count_bytes,
+                          config.min_word_length, config.max_word_length, config.max_sum_lengths_of_all_words,
+                          len(words), dictionary.total_length_of_all_words, class_count, len(groups))
+
+    create_parent_directories(snapshot_path)
+
+    # Write to a temporary file first, so that readers never see a partially written snapshot
+    temp_path = f"{snapshot_path}.tmp"
+    with open(temp_path, mode="wb") as file:
+        file.write(header)
+        file.write(_pack_strings(words))
+        file.write(_pack_strings(canonical_words))
+        file.write(_pack_section("".join(signature_encoder.weights).encode("utf-8")))
+        file.write(_pack_integers(word_classes))
+        file.write(_pack_integers(length for length, _, _ in groups))
+        file.write(_pack_section("".join(first for _, first, _ in groups).encode("utf-8")))
+        file.write(_pack_section("".join(last for _, _, last in groups).encode("utf-8")))
+        file.write(_pack_integers(len(classes) for classes in equivalence_classes.values()))
+        file.write(_pack_integers(size for classes in equivalence_classes.values() for size in classes.values()))
+        file.write(_pack_signatures([signature for classes in equivalence_classes.values() for signature in classes],
+                                    field_bytes, count_bytes))
+    os.replace(temp_path, snapshot_path)
+
+
+@dataclass
+class _SnapshotContents:
+    """
+    Decoded sections of a snapshot.
+
+    Attributes:
+        words -- the words of the dictionary
+        canonical_words -- the canonical form of every word
+        alphabet -- the letters of the signature encoder, in the order of their codes
+        signatures -- the signature of every word
+        equivalence_classes -- the equivalence classes of the words
+    """
+    words: List[str]
+    canonical_words: List[str]
+    alphabet: str
+    signatures: _WordSignatures
+    equivalence_classes: EquivalenceClasses
+
+
+def _read_snapshot(buffer: memoryview, header: tuple) -> _SnapshotContents:
+    """
+    Decodes the sections of a snapshot.
+
+    Args:
+        buffer (memoryview): The snapshot contents.
+        header (tuple): The unpacked header of the snapshot.
+
+    Returns:
+        _SnapshotContents: The decoded sections.
+    """
+    field_bytes = header[5] // 8
+    count_bytes = header[6]
+    word_count, _, class_count, group_count = header[10:]
+
+    words, position = _unpack_strings(buffer, _HEADER.size, word_count)
+    canonical_words, position = _unpack_strings(buffer, position, word_count)
+    alphabet, position = _read_section(buffer, position)
+    word_classes, position = _unpack_integers(buffer, position, word_count)
+    group_lengths, position = _unpack_integers(buffer, position, group_count)
+    group_firsts, position = _read_section(buffer, position)
+    group_lasts, position = _read_section(buffer, position)
+    group_class_counts, position = _unpack_integers(buffer, position, group_count)
+    class_sizes, position = _unpack_integers(buffer, position, class_count)
+    class_signatures, _ = _unpack_signatures(buffer, position, class_count, field_bytes, count_bytes)
+
+    group_firsts = str(group_firsts, encoding="utf-8")
+    group_lasts = str(group_lasts, encoding="utf-8")
+    if len(group_firsts) != group_count or len(group_lasts) != group_count:
+        raise ValueError("section does not have the expected number of items")
+    if word_classes and max(word_classes) >= class_count:
+        raise ValueError("equivalence class index out of range")
+
+    # Every group of classes is built at once from the consecutive signatures and sizes of its classes
+    equivalence_classes: EquivalenceClasses = {}
+    start = 0
+    for length, first, last, group_class_count in zip(group_lengths, group_firsts, group_lasts,
+                                                      group_class_counts):
+        end = start + group_class_count
+        equivalence_classes[length, first, last] = dict(zip(class_signatures[start:end], class_sizes[start:end]))
+        start = end
+    if start != class_count:
+        raise ValueError("the groups do not have the expected number of classes")
+
+    return _SnapshotContents(words, canonical_words, str(alphabet, encoding="utf-8"),
+                             _WordSignatures(class_signatures, word_classes), equivalence_classes)
+
+
+def _check_header(header: tuple, snapshot_path: str, source_file_path: str, dictionary_config: DictionaryConfig,
+                  field_width: int) -> None:
+    """
+    Checks that a snapshot has a supported format and is not stale.
+
+    The digest of the dictionary file is only computed if its size or modification time differ from the ones
+    recorded in the snapshot, so that the snapshot of an unchanged file is loaded without reading the file.
+
+    Args:
+        header (tuple): The unpacked header of the snapshot.
+        snapshot_path (str): Path to the snapshot file.
+        source_file_path (str): Path to the dictionary file the snapshot must have been compiled from.
+        dictionary_config (DictionaryConfig): Dictionary configuration.
+        field_width (int): Width in bits of the count fields of the signature encoder of the storage.
+
+    Raises:
+        DictionaryError: If the snapshot has an unsupported format, or is stale.
+    """
+    magic, version, digest, source_size, source_mtime_ns, snapshot_field_width, count_bytes = header[:7]
+    if (magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION or snapshot_field_width != field_width
+            or not 0 < count_bytes <= field_width // 8):
+        raise DictionaryError(f"Dictionary index '{snapshot_path}' has an unsupported format.")
+
+    source_stat = os.stat(source_file_path)
+    if ((source_stat.st_size, source_stat.st_mtime_ns) != (source_size, source_mtime_ns)
+            and digest != compute_file_digest(source_file_path)):
+        raise DictionaryError(f"Dictionary index '{snapshot_path}' is stale: "
+                              f"the dictionary file '{source_file_path}' has changed.")
+
+    if header[7:10] != (dictionary_config.min_word_length, dictionary_config.max_word_length,
+                        dictionary_config.max_sum_lengths_of_all_words):
+        raise DictionaryError(f"Dictionary index '{snapshot_path}' is stale: "
+                              f"the dictionary configuration has changed.")
+
+
+def load_dictionary_snapshot(snapshot_path: str, source_file_path: str, storage: DictionaryDataStorage,
+                             dictionary_config: DictionaryConfig, logger: Logger) -> Dictionary:
+    """
+    Loads a dictionary from a binary snapshot.
+
+    The words are added to the storage in bulk, with their canonical forms and signatures, and the equivalence
+    classes of the dictionary are restored, so that they are not built again.
+
+    Args:
+        snapshot_path (str): Path to the snapshot file.
+        source_file_path (str): Path to the dictionary file the snapshot must have been compiled from.
+        storage (DictionaryDataStorage): An empty storage that receives the words of the snapshot.
+        dictionary_config (DictionaryConfig): Dictionary configuration.
+        logger (Logger): Logger.
+
+    Returns:
+        Dictionary: The loaded dictionary.
+
+    Raises:
+        FileNotFoundError: If the snapshot file does not exist.
+        DictionaryError: If the snapshot is invalid, or stale (i.e. it was compiled from different
+                         dictionary contents or with a different dictionary configuration).
+    """
+    if not os.path.exists(snapshot_path):
+        raise FileNotFoundError(f"Dictionary index path '{snapshot_path}' does not exist!")
+
+    signature_encoder = storage.get_signature_encoder()
+    with open(snapshot_path, mode="rb") as file:
+        if os.fstat(file.fileno()).st_size < _HEADER.size:
+            raise DictionaryError(f"Dictionary index '{snapshot_path}' is truncated.")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            view = memoryview(buffer)
+            try:
+                header = _HEADER.unpack_from(view, 0)
+                _check_header(header, snapshot_path, source_file_path, dictionary_config,
+                              signature_encoder.field_width)
+                try:
+                    contents = _read_snapshot(view, header)
+                except (struct.error, ValueError, IndexError) as err:
+                    raise DictionaryError(f"Dictionary index '{snapshot_path}' is corrupted: {err}") from err
+            finally:
+                view.release()
+
+    # The letters are registered in the order of their codes, so that the signatures of the snapshot are valid
+    signature_encoder.register(contents.alphabet)
+    storage.add_precomputed_words(contents.words, contents.canonical_words, contents.signatures)
+
+    dictionary = Dictionary(storage=storage, dictionary_config=dictionary_config, logger=logger)
+    dictionary.total_length_of_all_words = header[11]
+    dictionary.set_equivalence_classes(contents.equivalence_classes)
+
+    logger.info(f"Loaded {len(contents.words)} words from dictionary index '{snapshot_path}'.")
+    return dictionary
+
+
+def load_or_compile_dictionary(snapshot_path: str, source_file_path: str, storage: DictionaryDataStorage,
+                               dictionary_config: DictionaryConfig, logger: Logger) -> Dictionary:
+    """
+    Loads a dictionary from a binary snapshot, or compiles a new snapshot if it is missing, invalid or stale.
+
+    Args:
+        snapshot_path (str): Path to the snapshot file.
+        source_file_path (str): Path to the dictionary file.
+        storage (DictionaryDataStorage): An empty storage that receives the dictionary words.
+        dictionary_config (DictionaryConfig): Dictionary configuration.
+        logger (Logger): Logger.
+
+    Returns:
+        Dictionary: The loaded dictionary.
+
+    Raises:
+        FileNotFoundError: If the dictionary file does not exist.
+        DictionaryError: If a word of the dictionary file violates constraints.
+    """
+    try:
+        return load_dictionary_snapshot(snapshot_path, source_file_path, storage, dictionary_config, logger)
+    except (FileNotFoundError, DictionaryError) as err:
+        if not os.path.exists(source_file_path):
+            raise FileNotFoundError(f"Dictionary file path '{source_file_path}' does not exist!") from err
+        logger.warning(f"{err} Rebuilding dictionary index...")
+
+    dictionary = Dictionary(storage=storage, dictionary_config=dictionary_config, logger=logger)
+    dictionary.load_from_file(source_file_path)
+    write_dictionary_snapshot(dictionary, source_file_path, snapshot_path)
+    logger.info(f"Dictionary index '{snapshot_path}' compiled.")
+    return dictionary
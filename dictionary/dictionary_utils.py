@@ -38,10 +38,23 @@ def validate_word_length_or_raise(word: str, min_word_length: int, max_word_leng
     """
     word_length = len(word)
     if not min_word_length <= word_length <= max_word_length:
-        raise DictionaryError(
-            f"Word '{word}' does not meet the length constraints "
-            f"({min_word_length} <= len(word) <= {max_word_length})."
-        )
+        raise DictionaryError(format_word_length_violation(word, min_word_length, max_word_length))
+
+
+def format_word_length_violation(word: str, min_word_length: int, max_word_length: int) -> str:
+    """
+    Formats the message describing a word that does not meet the length constraints.
+
+    Args:
+        word (str): The invalid word.
+        min_word_length (int): Minimum allowed length of the word.
+        max_word_length (int): Maximum allowed length of the word.
+
+    Returns:
+        str: The message describing the violation.
+    """
+    return (f"Word '{word}' does not meet the length constraints "
+            f"({min_word_length} <= len(word) <= {max_word_length}).")
 
 
 def validate_total_length_or_raise(total_length: int, max_allowed_length: int) -> None:
@@ -56,6 +69,18 @@ def validate_total_length_or_raise(total_length: int, max_allowed_length: int) -
         DictionaryError: If the total length exceeds the allowed limit.
     """
     if total_length > max_allowed_length:
-        raise DictionaryError(
-            f"The total length of all words ({total_length}) exceeds the allowed limit of {max_allowed_length}."
-        )
+        raise DictionaryError(format_total_length_violation(total_length, max_allowed_length))
+
+
+def format_total_length_violation(total_length: int, max_allowed_length: int) -> str:
+    """
+    Formats the message describing a total length of words that exceeds the allowed limit.
+
+    Args:
+        total_length (int): The total length of all words.
+        max_allowed_length (int): The maximum allowed total length of all words.
+
+    Returns:
+        str: The message describing the violation.
+    """
+    return f"The total length of all words ({total_length}) exceeds the allowed limit of {max_allowed_length}."
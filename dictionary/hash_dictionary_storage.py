@@ -3,22 +3,26 @@ Module for implementing data storage using a hash table.
 """
 
 # Imports
+from typing import Iterable, Iterator, Sequence
 from dictionary.dictionary_data_storage import DictionaryDataStorage
 from dictionary.dictionary_utils import compute_canonical_form
+from dictionary.multiset_signature import MultisetSignatureEncoder
 
 
 class HashDictionaryStorage(DictionaryDataStorage):
     """
     Implements a dictionary data storage using a hash table.
 
-    This implementation precomputes and stores the canonical form of each word for
-    efficient lookup and comparison during scrambled word matching.
+    This implementation precomputes and stores the canonical form and the signature of each word
+    for efficient lookup and comparison during scrambled word matching.
     """
     def __init__(self):
         """
         Initializes the HashDictionaryStorage.
         """
         self.storage: dict[str, str] = {}
+        self.signatures: dict[str, int] = {}
+        self.signature_encoder: MultisetSignatureEncoder = MultisetSignatureEncoder()
 
     def add_word(self, word: str) -> None:
         """
@@ -28,6 +32,40 @@ class HashDictionaryStorage(DictionaryDataStorage):
             word (str): The word to add.
         """
         self.storage[word] = compute_canonical_form(word)
+        self.signature_encoder.register(word)
+        self.signatures[word] = self.signature_encoder.encode_middle(word)
+
+    def add_precomputed_words(self, words: Sequence[str], canonical_words: Sequence[str],
+                              signatures: Sequence[int]) -> None:
+        """
+        Adds words together with their precomputed canonical forms and signatures, in bulk.
+
+        Args:
+            words (Sequence[str]): The words to add.
+            canonical_words (Sequence[str]): The canonical form of every word.
+            signatures (Sequence[int]): The signature of the middle characters of every word.
+        """
+        self.storage.update(zip(words, canonical_words))
+        self.signatures.update(zip(words, signatures))
+
+    def remove_words(self, words: Iterable[str]) -> None:
+        """
+        Removes words of the storage, together with their canonical forms and signatures.
+
+        Args:
+            words (Iterable[str]): The words to remove.
+        """
+        for word in words:
+            del self.storage[word]
+            del self.signatures[word]
+
+    def clear(self) -> None:
+        """
+        Removes all the words of the storage and resets its signature encoder.
+        """
+        self.storage = {}
+        self.signatures = {}
+        self.signature_encoder = MultisetSignatureEncoder()
 
     def contains_word(self, word: str) -> bool:
         """
@@ -50,6 +88,24 @@ class HashDictionaryStorage(DictionaryDataStorage):
          """
         return set(self.storage.keys())
 
+    def iter_words(self) -> Iterator[str]:
+        """
+        Iterates over the words of the storage, without copying them into a set.
+
+        Returns:
+            Iterator[str]: The words of the storage.
+        """
+        return iter(self.storage)
+
+    def get_word_count(self) -> int:
+        """
+        Retrieves the number of words in the storage.
+
+        Returns:
+            int: The number of words.
+        """
+        return len(self.storage)
+
     def get_canonical_word(self, word: str) -> str:
         """
         Retrieves the canonical form of the given word.
@@ -63,4 +119,34 @@ class HashDictionaryStorage(DictionaryDataStorage):
         Returns:
             str: The canonical form of the word.
         """
-        return self.storage.get(word, compute_canonical_form(word))
+        canonical_word = self.storage.get(word)
+        if canonical_word is None:
+            canonical_word = compute_canonical_form(word)
+        return canonical_word
+
+    def get_signature(self, word: str) -> int:
+        """
+        Retrieves the signature of the middle characters of the given word.
+
+        If the word exists in the dictionary, its precomputed signature is returned.
+        Otherwise, the signature is computed dynamically.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The signature of the middle characters of the word.
+        """
+        signature = self.signatures.get(word)
+        if signature is None:
+            signature = self.signature_encoder.encode_middle(word)
+        return signature
+
+    def get_signature_encoder(self) -> MultisetSignatureEncoder:
+        """
+        Retrieves the encoder of the signatures.
+
+        Returns:
+            MultisetSignatureEncoder: The signature encoder.
+        """
+        return self.signature_encoder
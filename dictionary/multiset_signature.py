@@ -0,0 +1,129 @@
+"""
+Module for encoding multisets of characters as bit-packed integers.
+
+The middle characters of a word (all its characters except the first and the last) form a multiset.
+Two words of the same length with the same first and last letters match each other under the
+scrambling rule if and only if their middle multisets are equal, so the multiset is packed into a
+single Python int that is compared in one operation instead of building and comparing sorted strings.
+"""
+
+# Imports
+from itertools import accumulate
+from typing import Iterable
+
+# Default width in bits of the count field of every letter. It bounds the number of occurrences of a
+# letter in the middle of a word to 2^32 - 1.
+DEFAULT_FIELD_WIDTH = 32
+
+
+class MultisetSignatureEncoder:
+    """
+    Encodes multisets of characters as integers with a fixed-width count field per letter.
+
+    Letters are mapped to a dense alphabet in the order they are registered: the count of the letter
+    with code `c` is held in bits `[c * field_width, (c + 1) * field_width)`. Field 0 is shared by all the
+    characters that have not been registered, so the signature of a text containing such a character is
+    never equal to the signature of a text made of registered letters only.
+
+    The signature of a multiset is the sum of the weights `1 << (c * field_width)` of its characters, so a
+    signature is updated with a single addition or subtraction when a character enters or leaves a
+    sliding window, and the signature of any substring is the difference of two prefix signatures.
+    """
+
+    def __init__(self, field_width: int = DEFAULT_FIELD_WIDTH):
+        """
+        Initializes the MultisetSignatureEncoder with an empty alphabet.
+
+        Args:
+            field_width (int): Width in bits of the count field of every letter.
+
+        Raises:
+            ValueError: If `field_width` is not positive.
+        """
+        if field_width < 1:
+            raise ValueError(f"The field width ({field_width}) must be positive.")
+
+        self.field_width: int = field_width
+        self.weights: dict[str, int] = {}
+        self.unknown_weight: int = 1
+
+    def register(self, letters: Iterable[str]) -> None:
+        """
+        Adds letters to the alphabet. Letters that are already registered keep their code.
+
+        Args:
+            letters (Iterable[str]): The letters to add.
+        """
+        for letter in letters:
+            if letter not in self.weights:
+                self.weights[letter] = 1 << ((len(self.weights) + 1) * self.field_width)
+
+    def get_weight(self, char: str) -> int:
+        """
+        Retrieves the weight of a character.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            int: The weight of the character, or the shared weight of the unregistered characters.
+        """
+        return self.weights.get(char, self.unknown_weight)
+
+    def encode(self, text: str) -> int:
+        """
+        Computes the signature of the multiset of the characters of a text.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            int: The signature.
+        """
+        weights = self.weights
+        unknown_weight = self.unknown_weight
+        return sum(weights.get(char, unknown_weight) for char in text)
+
+    def encode_middle(self, word: str) -> int:
+        """
+        Computes the signature of the middle characters of a word.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The signature of all the characters of the word except the first and the last.
+        """
+        return self.encode(word[1:-1])
+
+    def encode_prefixes(self, text: str) -> list[int]:
+        """
+        Computes the signatures of all the prefixes of a text.
+
+        The signature of `text[i:j]` is `prefixes[j] - prefixes[i]`.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            list[int]: The `len(text) + 1` prefix signatures, starting with the empty prefix.
+        """
+        weights = self.weights
+        unknown_weight = self.unknown_weight
+        return list(accumulate((weights.get(char, unknown_weight) for char in text), initial=0))
+
+    def encode_presence(self, letters: Iterable[str]) -> int:
+        """
+        Computes a mask with all the bits of the count fields of the given letters set.
+
+        A multiset contains only letters of `letters` if and only if `signature & ~mask == 0`, which
+        checks that a word can be made of the letters of a text with a single operation.
+
+        Args:
+            letters (Iterable[str]): The letters.
+
+        Returns:
+            int: The mask of the count fields of the letters.
+        """
+        field_mask = (1 << self.field_width) - 1
+        return sum({self.get_weight(letter) for letter in letters}) * field_mask
@@ -3,8 +3,10 @@ Module for implementing data storage using a set.
 """
 
 # Imports
+from typing import Iterable, Sequence
 from dictionary.dictionary_data_storage import DictionaryDataStorage
 from dictionary.dictionary_utils import compute_canonical_form
+from dictionary.multiset_signature import MultisetSignatureEncoder
 
 
 class SetDictionaryStorage(DictionaryDataStorage):
@@ -12,7 +14,7 @@ class SetDictionaryStorage(DictionaryDataStorage):
     Implements a dictionary data storage using a set.
 
     Unlike other implementations, this class does not precompute or store canonical forms
-    of the words, opting instead to compute them dynamically when needed. This approach
+    or signatures of the words, opting instead to compute them dynamically when needed. This approach
     prioritizes storage efficiency while maintaining flexibility for scrambled word matching.
     """
 
@@ -21,6 +23,7 @@ class SetDictionaryStorage(DictionaryDataStorage):
         Initializes the SetDictionaryStorage.
         """
         self.storage: set[str] = set()
+        self.signature_encoder: MultisetSignatureEncoder = MultisetSignatureEncoder()
 
     def add_word(self, word: str) -> None:
         """
@@ -30,6 +33,36 @@ class SetDictionaryStorage(DictionaryDataStorage):
             word (str): The word to add.
         """
         self.storage.add(word)
+        self.signature_encoder.register(word)
+
+    def add_precomputed_words(self, words: Sequence[str], canonical_words: Sequence[str],
+                              signatures: Sequence[int]) -> None:
+        """
+        Adds words in bulk. Their canonical forms and signatures are computed on demand, so they are ignored.
+
+        Args:
+            words (Sequence[str]): The words to add.
+            canonical_words (Sequence[str]): The canonical form of every word.
+            signatures (Sequence[int]): The signature of the middle characters of every word.
+        """
+        del canonical_words, signatures
+        self.storage.update(words)
+
+    def remove_words(self, words: Iterable[str]) -> None:
+        """
+        Removes words of the storage.
+
+        Args:
+            words (Iterable[str]): The words to remove.
+        """
+        self.storage.difference_update(words)
+
+    def clear(self) -> None:
+        """
+        Removes all the words of the storage and resets its signature encoder.
+        """
+        self.storage = set()
+        self.signature_encoder = MultisetSignatureEncoder()
 
     def contains_word(self, word: str) -> bool:
         """
@@ -52,6 +85,15 @@ class SetDictionaryStorage(DictionaryDataStorage):
         """
         return self.storage
 
+    def get_word_count(self) -> int:
+        """
+        Retrieves the number of words in the dictionary.
+
+        Returns:
+            int: The number of words.
+        """
+        return len(self.storage)
+
     def get_canonical_word(self, word: str) -> str:
         """
         Computes and returns the canonical form of the given word.
@@ -63,3 +105,24 @@ class SetDictionaryStorage(DictionaryDataStorage):
             str: The canonical form of the word.
         """
         return compute_canonical_form(word)
+
+    def get_signature(self, word: str) -> int:
+        """
+        Computes and returns the signature of the middle characters of the given word.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The signature of the middle characters of the word.
+        """
+        return self.signature_encoder.encode_middle(word)
+
+    def get_signature_encoder(self) -> MultisetSignatureEncoder:
+        """
+        Retrieves the encoder of the signatures.
+
+        Returns:
+            MultisetSignatureEncoder: The signature encoder.
+        """
+        return self.signature_encoder
@@ -0,0 +1,26 @@
+"""
+Test cases shared by the dictionary data storages.
+"""
+
+# Imports
+from dictionary.dictionary_data_storage import DictionaryDataStorage
+
+
+class DictionaryStorageTestMixin:
+    """
+    Mixin of the test cases of a dictionary data storage. The test case sets up an empty storage in
+    `storage` for every test.
+    """
+
+    storage: DictionaryDataStorage
+
+    def test_get_signature(self):
+        """Test that scrambled forms of a word share its signature and that the encoder knows its letters."""
+        self.storage.add_word("scramble")
+        self.storage.add_word("sbmarcle")
+        encoder = self.storage.get_signature_encoder()
+
+        self.assertEqual(self.storage.get_signature("scramble"), encoder.encode("crambl"))
+        self.assertEqual(self.storage.get_signature("scramble"), self.storage.get_signature("sbmarcle"))
+        self.assertNotEqual(self.storage.get_signature("scramble"), self.storage.get_signature("scrambee"))
+        self.assertEqual(set(encoder.weights), set("scramble"))
@@ -0,0 +1,83 @@
+"""
+Test cases for CachedDictionaryStorage.
+"""
+
+# Imports
+import unittest
+from unittest.mock import patch
+from dictionary.cached_dictionary_storage import CACHE_ENTRY_OVERHEAD, CachedDictionaryStorage
+from dictionary.set_dictionary_storage import SetDictionaryStorage
+from dictionary.tests.storage_test_mixin import DictionaryStorageTestMixin
+
+
+class TestCachedDictionaryStorage(DictionaryStorageTestMixin, unittest.TestCase):
+    """
+    Unit tests for the CachedDictionaryStorage class.
+    """
+
+    def setUp(self):
+        """Set up a cached set storage."""
+        self.wrapped_storage = SetDictionaryStorage()
+        self.storage = CachedDictionaryStorage(self.wrapped_storage, max_cache_bytes=1_000_000)
+
+    def test_delegation(self):
+        """Test that words are stored by the wrapped storage."""
+        self.storage.add_word("test")
+        self.storage.add_precomputed_words(["example"], ["eamlpxe"], [self.storage.get_signature("example")])
+
+        self.assertTrue(self.storage.contains_word("test"))
+        self.assertFalse(self.storage.contains_word("not_in_storage"))
+        self.assertEqual(self.storage.get_all_words(), {"test", "example"})
+        self.assertEqual(self.wrapped_storage.get_all_words(), {"test", "example"})
+        self.assertIs(self.storage.get_signature_encoder(), self.wrapped_storage.get_signature_encoder())
+
+    def test_hits_and_misses(self):
+        """Test that canonical forms and signatures are computed once and then served from the cache."""
+        self.storage.add_word("scramble")
+        with patch.object(self.wrapped_storage, "get_canonical_word",
+                          wraps=self.wrapped_storage.get_canonical_word) as mock_get_canonical_word:
+            for _ in range(3):
+                self.assertEqual(self.storage.get_canonical_word("scramble"), "sabclmre")
+            mock_get_canonical_word.assert_called_once_with("scramble")
+
+        self.assertEqual(self.storage.get_signature("scramble"), self.wrapped_storage.get_signature("scramble"))
+        self.assertEqual(self.storage.get_signature("scramble"), self.wrapped_storage.get_signature("scramble"))
+
+        stats = self.storage.get_cache_stats()
+        self.assertEqual(stats["canonical_cache_hits"], 3)
+        self.assertEqual(stats["canonical_cache_misses"], 2)
+        self.assertEqual(stats["canonical_cache_entries"], 2)
+        self.assertEqual(stats["canonical_cache_evictions"], 0)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used values are evicted when the memory budget is exceeded."""
+        storage = CachedDictionaryStorage(SetDictionaryStorage(), max_cache_bytes=2 * (CACHE_ENTRY_OVERHEAD + 60))
+        storage.get_canonical_word("abcd")
+        storage.get_canonical_word("efgh")
+        storage.get_canonical_word("abcd")  # "efgh" becomes the least recently used value
+        storage.get_canonical_word("ijkl")
+
+        stats = storage.get_cache_stats()
+        self.assertEqual(stats["canonical_cache_evictions"], 1)
+        self.assertEqual(stats["canonical_cache_entries"], 2)
+        self.assertLessEqual(stats["canonical_cache_bytes"], storage.max_cache_bytes)
+
+        storage.get_canonical_word("abcd")
+        self.assertEqual(storage.get_cache_stats()["canonical_cache_hits"], 2)
+        storage.get_canonical_word("efgh")
+        self.assertEqual(storage.get_cache_stats()["canonical_cache_misses"], 4)
+
+    def test_value_larger_than_budget(self):
+        """Test that a value larger than the whole budget is returned without being cached."""
+        storage = CachedDictionaryStorage(SetDictionaryStorage(), max_cache_bytes=CACHE_ENTRY_OVERHEAD)
+        self.assertEqual(storage.get_canonical_word("scramble"), "sabclmre")
+        self.assertEqual(storage.get_cache_stats()["canonical_cache_entries"], 0)
+
+    def test_invalid_budget(self):
+        """Test that a non-positive memory budget raises an error."""
+        with self.assertRaises(ValueError):
+            CachedDictionaryStorage(SetDictionaryStorage(), max_cache_bytes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
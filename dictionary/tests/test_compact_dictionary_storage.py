@@ -0,0 +1,114 @@
+"""
+Test cases for CompactDictionaryStorage.
+"""
+
+# Imports
+import random
+import sys
+import unittest
+from dictionary.compact_dictionary_storage import CompactDictionaryStorage
+from dictionary.tests.storage_test_mixin import DictionaryStorageTestMixin
+
+# pylint: disable=duplicate-code
+class TestCompactDictionaryStorage(DictionaryStorageTestMixin, unittest.TestCase):
+    """
+    Unit tests for the CompactDictionaryStorage class.
+    """
+
+    def setUp(self):
+        """Set up a fresh instance of CompactDictionaryStorage for each test."""
+        self.storage = CompactDictionaryStorage(compaction_threshold=2)
+
+    def test_invalid_compaction_threshold(self):
+        """Test that a non-positive compaction threshold is rejected."""
+        with self.assertRaises(ValueError):
+            CompactDictionaryStorage(compaction_threshold=0)
+
+    def test_add_and_contains_word(self):
+        """Test adding words and checking their existence, before and after they are compacted."""
+        for word in ["test", "tent", "text", "a", "ab", "café"]:
+            self.storage.add_word(word)
+            self.assertTrue(self.storage.contains_word(word))
+
+        self.storage.compact()
+        for word in ["test", "tent", "text", "a", "ab", "café"]:
+            self.assertTrue(self.storage.contains_word(word))
+        for word in ["", "b", "ba", "tast", "tett", "tests", "cafe"]:
+            self.assertFalse(self.storage.contains_word(word))
+
+    def test_remove_words_and_clear(self):
+        """Test that removed words leave their groups, and that clearing the storage removes every word."""
+        for word in ["test", "tent", "text", "to", "tab"]:
+            self.storage.add_word(word)
+
+        self.storage.remove_words(["tent", "to", "tab"])
+        self.assertEqual(self.storage.get_word_count(), 2)
+        self.assertEqual(sorted(self.storage.iter_words()), ["test", "text"])
+        self.assertFalse(self.storage.contains_word("tent"))
+        self.assertEqual({(length, first, last) for length, first, last, _ in self.storage.iter_word_groups()},
+                         {(4, "t", "t")})
+
+        self.storage.clear()
+        self.assertEqual(self.storage.get_word_count(), 0)
+        self.assertEqual(self.storage.get_all_words(), set())
+        self.assertEqual(self.storage.get_signature_encoder().weights, {})
+
+    def test_get_all_words(self):
+        """Test that all stored words are retrieved correctly."""
+        self.storage.add_word("test")
+        self.storage.add_word("example")
+        self.assertEqual(self.storage.get_all_words(), {"test", "example"})
+
+    def test_iter_word_groups(self):
+        """Test that the words are grouped by length and by first and last letters, with one group each."""
+        for word in ["test", "tent", "tart", "team", "t", "to", "tab"]:
+            self.storage.add_word(word)
+
+        groups = {(length, first, last): sorted(words)
+                  for length, first, last, words in self.storage.iter_word_groups()}
+        self.assertEqual(groups, {
+            (4, "t", "t"): ["tart", "tent", "test"],
+            (4, "t", "m"): ["team"],
+            (1, "t", "t"): ["t"],
+            (2, "t", "o"): ["to"],
+            (3, "t", "b"): ["tab"],
+        })
+
+        words = next(words for length, _, last, words in self.storage.iter_word_groups() if last == "t" and length == 4)
+        self.assertEqual(len(words), 3)
+        self.assertIn("tent", words)
+        self.assertNotIn("tint", words)
+
+    def test_random_words(self):
+        """Test that a random dictionary is stored exactly, across many compactions."""
+        rng = random.Random(7)
+        words = {"".join(rng.choice("abcé") for _ in range(rng.randint(1, 6))) for _ in range(2000)}
+        for word in words:
+            self.storage.add_word(word)
+
+        self.assertEqual(self.storage.get_word_count(), len(words))
+        self.assertEqual(self.storage.get_all_words(), words)
+        self.assertTrue(all(self.storage.contains_word(word) for word in words))
+        self.assertFalse(any(self.storage.contains_word(word + "d") for word in words))
+
+    def test_memory_usage(self):
+        """Test that the storage uses several times less memory than a set of the same words."""
+        rng = random.Random(11)
+        words = {"".join(rng.choice("abcdefghij") for _ in range(10)) for _ in range(20000)}
+        storage = CompactDictionaryStorage()
+        for word in words:
+            storage.add_word(word)
+        storage.compact()
+
+        set_size = sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+        self.assertLess(storage.get_memory_usage() * 4, set_size)
+
+    def test_get_canonical_word(self):
+        """Test retrieval of canonical forms for words."""
+        self.storage.add_word("scramble")
+        self.assertEqual(self.storage.get_canonical_word("scramble"), "sabclmre")
+        self.assertEqual(self.storage.get_canonical_word("not_in_storage"), "n__aginoorstte")  # Dynamic computation
+
+
+if __name__ == "__main__":
+    unittest.main()
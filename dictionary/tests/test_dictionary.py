@@ -6,6 +6,7 @@ Test cases for Dictionary.
 import unittest
 from unittest.mock import Mock
 from unittest.mock import mock_open, patch
+from dictionary.compact_dictionary_storage import CompactDictionaryStorage
 from dictionary.dictionary import Dictionary
 from dictionary.dictionary_config import DictionaryConfig
 from dictionary.hash_dictionary_storage import HashDictionaryStorage
@@ -76,6 +77,96 @@ class TestDictionary(unittest.TestCase):
         with self.assertRaises(DictionaryError):
             dictionary.add_word("_" * max_word_length)
 
+    def test_add_words(self):
+        """Test that a batch of words is added with a single summary log record."""
+        dictionary = Dictionary(SetDictionaryStorage(), self.config, self.logger)
+        self.assertEqual(dictionary.add_words(["test", "example"]), 2)
+        self.assertEqual(dictionary.get_all_words(), {"test", "example"})
+        self.assertEqual(dictionary.total_length_of_all_words, len("test") + len("example"))
+        self.logger.info.assert_called_once()
+
+    def test_equivalence_classes(self):
+        """Test that the words are grouped by signature with their multiplicity, and regrouped after additions."""
+        dictionary = Dictionary(SetDictionaryStorage(), self.config, self.logger)
+        dictionary.add_words(["tihs", "this", "ab", "tabs"])
+        dictionary.build_equivalence_classes()
+
+        classes = {(length, first, last, signature): size
+                   for length, first, last, group in dictionary.iter_equivalence_classes()
+                   for signature, size in group.items()}
+        self.assertEqual(classes, {(4, "t", "s", dictionary.get_signature("this")): 2,
+                                   (2, "a", "b", 0): 1,
+                                   (4, "t", "s", dictionary.get_signature("tabs")): 1})
+        self.assertEqual(dictionary.get_equivalence_class_count(), 3)
+        self.assertEqual(dictionary.get_equivalence_class_size("this"), 2)
+        self.assertEqual(dictionary.get_equivalence_class_size("thsi"), 0)
+        self.assertEqual(dictionary.get_equivalence_class_size("tzzs"), 0)
+        self.assertEqual(dictionary.get_equivalence_class_size(""), 0)
+
+        dictionary.add_word("tbas")
+        self.assertEqual(dictionary.get_equivalence_class_size("tabs"), 2)
+        self.assertEqual(dictionary.get_equivalence_class_count(), 3)
+
+    def test_max_word_length(self):
+        """Test that the length of the longest word follows the added words."""
+        dictionary = Dictionary(SetDictionaryStorage(), self.config, self.logger)
+        self.assertEqual(dictionary.get_max_word_length(), 0)
+        dictionary.add_words(["tihs", "ab"])
+        self.assertEqual(dictionary.get_max_word_length(), 4)
+        dictionary.add_word("scrambled")
+        self.assertEqual(dictionary.get_max_word_length(), 9)
+
+    def test_fingerprint(self):
+        """Test that the fingerprint identifies the words, whatever their order and storage."""
+        dictionary = Dictionary(SetDictionaryStorage(), self.config, self.logger)
+        dictionary.add_words(["tihs", "this", "ab"])
+        same_dictionary = Dictionary(HashDictionaryStorage(), self.config, self.logger)
+        same_dictionary.add_words(["ab", "this", "tihs"])
+
+        fingerprint = dictionary.get_fingerprint()
+        self.assertEqual(len(fingerprint), 16)
+        self.assertEqual(same_dictionary.get_fingerprint(), fingerprint)
+
+        dictionary.add_word("abc")
+        self.assertNotEqual(dictionary.get_fingerprint(), fingerprint)
+
+    def test_add_words_aggregates_violations(self):
+        """Test that all violations of a batch are reported in one error and no word is added."""
+        dictionary = Dictionary(HashDictionaryStorage(), self.config, self.logger)
+        dictionary.add_word("test")
+
+        with self.assertRaises(DictionaryError) as err:
+            dictionary.add_words(["valid", "a", "test", "valid", "thisisaverylongword"])
+        message = str(err.exception)
+        self.assertIn("4 dictionary violation(s)", message)
+        self.assertIn("'a'", message)
+        self.assertIn("Duplicate word found: 'test'", message)
+        self.assertIn("Duplicate word found: 'valid'", message)
+        self.assertIn("'thisisaverylongword'", message)
+        self.assertEqual(dictionary.get_all_words(), {"test"})
+        self.assertEqual(dictionary.total_length_of_all_words, len("test"))
+
+        with self.assertRaises(DictionaryError):
+            dictionary.add_words([f"{ind}" * 10 for ind in range(5)])  # Total length exceeded
+        self.assertEqual(dictionary.get_all_words(), {"test"})
+
+    def test_add_words_rolls_back_every_storage(self):
+        """Test that a failed batch leaves every storage unchanged, whether the dictionary was empty or not."""
+        for storage in (SetDictionaryStorage(), HashDictionaryStorage(), CompactDictionaryStorage(2)):
+            with self.subTest(storage=type(storage).__name__):
+                dictionary = Dictionary(storage, self.config, self.logger)
+                with self.assertRaises(DictionaryError):
+                    dictionary.add_words(["test", "tent", "text", "test"])
+                self.assertEqual(storage.get_word_count(), 0)
+                self.assertEqual(dictionary.get_all_words(), set())
+
+                dictionary.add_words(["ab", "tent"])
+                with self.assertRaises(DictionaryError):
+                    dictionary.add_words(["test", "text", "ab"])
+                self.assertEqual(storage.get_word_count(), 2)
+                self.assertEqual(dictionary.get_all_words(), {"ab", "tent"})
+                self.assertEqual(dictionary.total_length_of_all_words, len("ab") + len("tent"))
+
     @patch("os.path.exists", return_value=True)
     @patch("builtins.open", new_callable=mock_open, read_data="test\nexample\nanother\n")
     def test_load_from_file(self, mock_file, mock_exists):
@@ -87,6 +87,13 @@ class TestDictionaryConfig(unittest.TestCase):
         self.assertEqual(config.max_word_length, 105)
         self.assertEqual(config.max_sum_lengths_of_all_words, 105)
 
+    def test_canonical_cache_bytes(self):
+        """Test that the canonical form cache is disabled by default and rejects negative budgets."""
+        self.assertEqual(DictionaryConfig().canonical_cache_bytes, 0)
+        self.assertEqual(DictionaryConfig(canonical_cache_bytes=4096).canonical_cache_bytes, 4096)
+        with self.assertRaises(ValidationError):
+            DictionaryConfig(canonical_cache_bytes=-1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+"""
+Test cases for DictionaryFileWatcher.
+"""
+
+# Imports
+import os
+import tempfile
+import unittest
+from dictionary.dictionary_file_watcher import DictionaryFileWatcher
+
+
+class TestDictionaryFileWatcher(unittest.TestCase):
+    """Unit tests for the DictionaryFileWatcher class."""
+
+    def setUp(self):
+        """Set up a dictionary file in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.dictionary_path = os.path.join(self.temp_dir.name, "dict.txt")
+        self.write_dictionary("scramble\ntihs\n", mtime=1)
+        self.watcher = DictionaryFileWatcher(self.dictionary_path)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def write_dictionary(self, contents: str, mtime: int) -> None:
+        """Writes the given contents to the dictionary file, with the given modification time in seconds."""
+        with open(self.dictionary_path, mode="w", encoding="utf-8") as file:
+            file.write(contents)
+        os.utime(self.dictionary_path, (mtime, mtime))
+
+    def test_change_is_reported_once_stable(self):
+        """Test that a change is reported once, after the file is unchanged for a poll."""
+        self.assertFalse(self.watcher.poll())
+
+        self.write_dictionary("scramble\ntihs\nab\n", mtime=2)
+        self.assertFalse(self.watcher.poll())
+        self.assertTrue(self.watcher.poll())
+        self.assertFalse(self.watcher.poll())
+
+    def test_file_being_written(self):
+        """Test that a file that changes between two polls is not reported until it is stable."""
+        self.write_dictionary("scramble\n", mtime=2)
+        self.assertFalse(self.watcher.poll())
+        self.write_dictionary("scramble\ntihs\nab\n", mtime=3)
+        self.assertFalse(self.watcher.poll())
+        self.assertTrue(self.watcher.poll())
+
+    def test_same_contents(self):
+        """Test that a file that is touched or rewritten with the same contents is not reported."""
+        self.write_dictionary("scramble\ntihs\n", mtime=2)
+        self.assertFalse(self.watcher.poll())
+        self.assertFalse(self.watcher.poll())
+        self.assertFalse(self.watcher.poll())
+
+    def test_missing_file(self):
+        """Test that a missing file is reported unchanged, and that it is reported once it is written again."""
+        os.remove(self.dictionary_path)
+        self.assertFalse(self.watcher.poll())
+        self.assertFalse(self.watcher.poll())
+
+        self.write_dictionary("tihs\n", mtime=2)
+        self.assertFalse(self.watcher.poll())
+        self.assertTrue(self.watcher.poll())
+
+        with self.assertRaises(OSError):
+            DictionaryFileWatcher(os.path.join(self.temp_dir.name, "missing.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+Test cases for DictionaryIndex.
+"""
+
+# Imports
+import unittest
+from unittest.mock import Mock
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.dictionary_index import DictionaryIndex, compute_signature
+from dictionary.hash_dictionary_storage import HashDictionaryStorage
+
+
+class TestDictionaryIndex(unittest.TestCase):
+    """Unit tests for the DictionaryIndex class."""
+
+    def setUp(self):
+        """Set up a dictionary with anagram-equivalent words."""
+        self.dictionary = Dictionary(HashDictionaryStorage(),
+                                     DictionaryConfig(min_word_length=2, max_word_length=10,
+                                                      max_sum_lengths_of_all_words=50),
+                                     Mock())
+        for word in ["this", "tihs", "ab", "scramble"]:
+            self.dictionary.add_word(word)
+
+    def test_compute_signature(self):
+        """Test that signatures are computed from the signature of the middle characters."""
+        self.assertEqual(compute_signature("tihs", 5), (4, "t", "s", 5))
+        self.assertEqual(compute_signature("ab", 0), (2, "a", "b", 0))
+
+    def test_words_sharing_a_signature(self):
+        """Test that words sharing a canonical form are grouped under one signature."""
+        index = DictionaryIndex(self.dictionary)
+        middle_signature = index.signature_encoder.encode("hi")
+        self.assertEqual(index.get_words((4, "t", "s", middle_signature)), {"this", "tihs"})
+        self.assertEqual(index.get_words((4, "t", "s", index.signature_encoder.encode("xx"))), set())
+        self.assertEqual(sorted(index.get_lengths()), [2, 4, 8])
+        self.assertEqual(index.get_endpoints(4), {("t", "s")})
+        self.assertEqual(index.get_signatures(4), [(4, "t", "s", middle_signature)])
+        self.assertEqual(index.get_signatures(5), [])
+
+if __name__ == "__main__":
+    unittest.main()
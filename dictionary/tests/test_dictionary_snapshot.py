@@ -0,0 +1,124 @@
+"""
+Test cases for dictionary snapshots.
+"""
+
+# Imports
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from dictionary.compact_dictionary_storage import CompactDictionaryStorage
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.dictionary_errors import DictionaryError
+from dictionary.dictionary_snapshot import (
+    load_dictionary_snapshot,
+    load_or_compile_dictionary,
+    write_dictionary_snapshot,
+)
+from dictionary.hash_dictionary_storage import HashDictionaryStorage
+from dictionary.set_dictionary_storage import SetDictionaryStorage
+
+
+class TestDictionarySnapshot(unittest.TestCase):
+    """Unit tests for writing and loading dictionary snapshots."""
+
+    def setUp(self):
+        """Set up a dictionary file and a snapshot path in a temporary directory."""
+        self.logger = Mock()
+        self.config = DictionaryConfig(min_word_length=2, max_word_length=10, max_sum_lengths_of_all_words=50)
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.dictionary_path = os.path.join(self.temp_dir.name, "dict.txt")
+        self.snapshot_path = os.path.join(self.temp_dir.name, "index", "dict.idx")
+        self.write_dictionary("scramble\ntihs\ncafé\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def write_dictionary(self, contents: str) -> None:
+        """Writes the given contents to the dictionary file."""
+        with open(self.dictionary_path, mode="w", encoding="utf-8") as file:
+            file.write(contents)
+
+    def compile_snapshot(self) -> None:
+        """Loads the dictionary file and writes its snapshot."""
+        dictionary = Dictionary(HashDictionaryStorage(), self.config, self.logger)
+        dictionary.load_from_file(self.dictionary_path)
+        write_dictionary_snapshot(dictionary, self.dictionary_path, self.snapshot_path)
+
+    def test_round_trip(self):
+        """Test that a snapshot restores the words, canonical forms, signatures, classes and total length."""
+        self.write_dictionary("scramble\nsbmarcle\ntihs\nthis\ncafé\nab\n")
+        expected = Dictionary(SetDictionaryStorage(), self.config, self.logger)
+        expected.load_from_file(self.dictionary_path)
+        self.compile_snapshot()
+
+        for storage in (HashDictionaryStorage(), SetDictionaryStorage(), CompactDictionaryStorage()):
+            dictionary = load_dictionary_snapshot(self.snapshot_path, self.dictionary_path, storage,
+                                                  self.config, self.logger)
+            with patch.object(dictionary, "iter_word_groups", side_effect=AssertionError("classes not restored")):
+                self.assertEqual(sorted(dictionary.iter_equivalence_classes()),
+                                 sorted(expected.iter_equivalence_classes()))
+            self.assertEqual(dictionary.get_all_words(), expected.get_all_words())
+            self.assertEqual(dictionary.get_canonical_word("scramble"), "sabclmre")
+            self.assertEqual(dictionary.get_signature_encoder().weights, expected.get_signature_encoder().weights)
+            for word in ("scramble", "tihs", "café", "ab", "zz"):
+                self.assertEqual(dictionary.get_signature(word), expected.get_signature(word))
+            self.assertEqual(dictionary.get_equivalence_class_size("this"), 2)
+            self.assertEqual(dictionary.total_length_of_all_words, expected.total_length_of_all_words)
+
+    def test_unchanged_file_is_not_hashed(self):
+        """Test that the dictionary file is only hashed when its size or modification time have changed."""
+        self.compile_snapshot()
+        with patch("dictionary.dictionary_snapshot.compute_file_digest") as mock_compute_file_digest:
+            load_dictionary_snapshot(self.snapshot_path, self.dictionary_path, SetDictionaryStorage(),
+                                     self.config, self.logger)
+            mock_compute_file_digest.assert_not_called()
+
+        # A touched file with the same contents is hashed, and the snapshot is still loaded
+        os.utime(self.dictionary_path, ns=(1, 1))
+        dictionary = load_dictionary_snapshot(self.snapshot_path, self.dictionary_path, SetDictionaryStorage(),
+                                              self.config, self.logger)
+        self.assertEqual(dictionary.get_all_words(), {"scramble", "tihs", "café"})
+
+    def test_stale_snapshot(self):
+        """Test that a snapshot is rejected when the dictionary file or the configuration has changed."""
+        self.compile_snapshot()
+        other_config = DictionaryConfig(min_word_length=2, max_word_length=10, max_sum_lengths_of_all_words=60)
+        with self.assertRaises(DictionaryError):
+            load_dictionary_snapshot(self.snapshot_path, self.dictionary_path, HashDictionaryStorage(),
+                                     other_config, self.logger)
+
+        self.write_dictionary("scramble\n")
+        with self.assertRaises(DictionaryError):
+            load_dictionary_snapshot(self.snapshot_path, self.dictionary_path, HashDictionaryStorage(),
+                                     self.config, self.logger)
+
+    def test_corrupted_snapshot(self):
+        """Test that a truncated snapshot is rejected."""
+        self.compile_snapshot()
+        with open(self.snapshot_path, mode="r+b") as file:
+            file.truncate(os.path.getsize(self.snapshot_path) - 4)
+        with self.assertRaises(DictionaryError):
+            load_dictionary_snapshot(self.snapshot_path, self.dictionary_path, HashDictionaryStorage(),
+                                     self.config, self.logger)
+
+    def test_load_or_compile_rebuilds(self):
+        """Test that a missing or stale snapshot is rebuilt automatically."""
+        dictionary = load_or_compile_dictionary(self.snapshot_path, self.dictionary_path, HashDictionaryStorage(),
+                                                self.config, self.logger)
+        self.assertEqual(dictionary.get_all_words(), {"scramble", "tihs", "café"})
+        self.assertTrue(os.path.exists(self.snapshot_path))
+
+        self.write_dictionary("example\n")
+        dictionary = load_or_compile_dictionary(self.snapshot_path, self.dictionary_path, HashDictionaryStorage(),
+                                                self.config, self.logger)
+        self.assertEqual(dictionary.get_all_words(), {"example"})
+        dictionary = load_dictionary_snapshot(self.snapshot_path, self.dictionary_path, HashDictionaryStorage(),
+                                              self.config, self.logger)
+        self.assertEqual(dictionary.get_all_words(), {"example"})
+
+
+if __name__ == "__main__":
+    unittest.main()
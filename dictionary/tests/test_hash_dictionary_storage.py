@@ -4,10 +4,12 @@ Test cases for HashDictionaryStorage.
 
 # Imports
 import unittest
+from unittest.mock import patch
 from dictionary.hash_dictionary_storage import HashDictionaryStorage
+from dictionary.tests.storage_test_mixin import DictionaryStorageTestMixin
 
 
-class TestHashDictionaryStorage(unittest.TestCase):
+class TestHashDictionaryStorage(DictionaryStorageTestMixin, unittest.TestCase):
     """
     Unit tests for the HashDictionaryStorage class.
     """
@@ -34,6 +36,13 @@ class TestHashDictionaryStorage(unittest.TestCase):
         self.assertEqual(self.storage.get_canonical_word("scramble"), "sabclmre")
         self.assertEqual(self.storage.get_canonical_word("not_in_storage"), "n__aginoorstte")  # Dynamic computation
 
+    def test_get_canonical_word_hit_does_not_compute(self):
+        """Test that the canonical form of a stored word is not recomputed."""
+        self.storage.add_word("scramble")
+        with patch("dictionary.hash_dictionary_storage.compute_canonical_form") as mock_compute_canonical_form:
+            self.assertEqual(self.storage.get_canonical_word("scramble"), "sabclmre")
+            mock_compute_canonical_form.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
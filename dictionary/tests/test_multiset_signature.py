@@ -0,0 +1,73 @@
+"""
+Test cases for MultisetSignatureEncoder.
+"""
+
+# Imports
+import unittest
+from dictionary.multiset_signature import MultisetSignatureEncoder
+
+
+class TestMultisetSignatureEncoder(unittest.TestCase):
+    """
+    Unit tests for the MultisetSignatureEncoder class.
+    """
+
+    def setUp(self):
+        """Set up an encoder with a registered alphabet."""
+        self.encoder = MultisetSignatureEncoder(field_width=8)
+        self.encoder.register("scrambled")
+
+    def test_register(self):
+        """Test that letters get dense codes in registration order, and keep them when registered again."""
+        self.assertEqual(self.encoder.get_weight("s"), 1 << 8)
+        self.assertEqual(self.encoder.get_weight("c"), 1 << 16)
+        self.encoder.register("cats")
+        self.assertEqual(self.encoder.get_weight("c"), 1 << 16)
+        self.assertEqual(self.encoder.get_weight("t"), 1 << (len("scrambled") + 1) * 8)
+
+    def test_encode(self):
+        """Test that signatures are equal if and only if the multisets are equal."""
+        self.assertEqual(self.encoder.encode("abel"), self.encoder.encode("lbea"))
+        self.assertEqual(self.encoder.encode("ssa"), self.encoder.encode("sas"))
+        self.assertNotEqual(self.encoder.encode("ssa"), self.encoder.encode("saa"))
+        self.assertEqual(self.encoder.encode(""), 0)
+
+    def test_unregistered_characters(self):
+        """Test that unregistered characters never produce the signature of registered letters."""
+        self.assertEqual(self.encoder.encode("xy"), self.encoder.encode("zz"))
+        self.assertNotEqual(self.encoder.encode("ax"), self.encoder.encode("a"))
+        self.assertNotEqual(self.encoder.encode("ax"), self.encoder.encode("ab"))
+
+    def test_encode_middle(self):
+        """Test that the first and last characters are excluded from the middle signature."""
+        self.assertEqual(self.encoder.encode_middle("scramble"), self.encoder.encode("cramble"[:-1]))
+        self.assertEqual(self.encoder.encode_middle("ab"), 0)
+        self.assertEqual(self.encoder.encode_middle("a"), 0)
+
+    def test_encode_prefixes(self):
+        """Test that the signature of any substring is the difference of two prefix signatures."""
+        text = "sssssssssssssssssssscrambled"  # More occurrences than the capacity of a field
+        encoder = MultisetSignatureEncoder(field_width=4)
+        encoder.register(text)
+        prefixes = encoder.encode_prefixes(text)
+        self.assertEqual(prefixes[0], 0)
+        for start in range(len(text)):
+            for stop in range(start, min(start + 15, len(text)) + 1):
+                self.assertEqual(prefixes[stop] - prefixes[start], encoder.encode(text[start: stop]))
+
+    def test_encode_presence(self):
+        """Test that the presence mask accepts exactly the multisets made of the given letters."""
+        self.encoder.register("scramble")
+        mask = self.encoder.encode_presence("scrab")
+        self.assertEqual(self.encoder.encode("abbacs") & ~mask, 0)
+        self.assertNotEqual(self.encoder.encode("ramble") & ~mask, 0)
+        self.assertEqual(self.encoder.encode_presence(""), 0)
+
+    def test_invalid_field_width(self):
+        """Test that a non-positive field width raises an error."""
+        with self.assertRaises(ValueError):
+            MultisetSignatureEncoder(field_width=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,10 @@ Test cases for SetDictionaryStorage.
 # Imports
 import unittest
 from dictionary.set_dictionary_storage import SetDictionaryStorage
+from dictionary.tests.storage_test_mixin import DictionaryStorageTestMixin
 
 # pylint: disable=duplicate-code
-class TestSetDictionaryStorage(unittest.TestCase):
+class TestSetDictionaryStorage(DictionaryStorageTestMixin, unittest.TestCase):
     """
     Unit tests for the SetDictionaryStorage class.
     """
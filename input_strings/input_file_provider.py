@@ -3,11 +3,9 @@ Concrete implementation of InputProvider using file-based input.
 """
 
 # Imports
-import os
-from typing import List
+from typing import Iterator, List
 from input_strings.input_provider import InputProvider
 from input_strings.input_strings_config import InputStringsConfig
-from input_strings.input_string_errors import InputStringError
 
 
 class InputFileProvider(InputProvider):
@@ -32,29 +30,10 @@ class InputFileProvider(InputProvider):
 
         Raises:
             FileNotFoundError: If the input file does not exist.
-            InputStringError: If a line violates constraints (e.g., invalid length)
+            InputStringError: If a line violates constraints (e.g., invalid length), or if the file is empty.
         """
-        if not os.path.exists(self.input_file_path):
-            raise FileNotFoundError(f"Input file '{self.input_file_path}' does not exist!")
-
-        min_line_length = self.input_strings_config.min_line_length
-        max_line_length = self.input_strings_config.max_line_length
-
-        # Open the file and read line by line
-        with open(self.input_file_path, mode="r", encoding="utf-8") as file:
-            for line in file:
-                # Validate line length
-                line_length = len(line)
-                if not min_line_length <= line_length <= max_line_length:
-                    raise InputStringError(
-                        f"Line '{line}' does not meet the length constraints "
-                        f"({min_line_length} <= len(line) <= {max_line_length})."
-                    )
-
-                self.inputs.append(line)
-
-        if not self.inputs:
-            raise InputStringError(f"Input file '{self.input_file_path}' is empty.")
+        self._check_input_file(self.input_file_path)
+        self.inputs.extend(self._iter_file_lines(self.input_file_path, self.input_strings_config))
 
     def get(self) -> List[str]:
         """
@@ -64,3 +43,12 @@ class InputFileProvider(InputProvider):
             List[str]: A list of input strings.
         """
         return self.inputs
+
+    def iter_inputs(self) -> Iterator[str]:
+        """
+        Iterates over the loaded input strings.
+
+        Returns:
+            Iterator[str]: An iterator over the input strings.
+        """
+        return iter(self.inputs)
@@ -3,8 +3,15 @@ Abstract module for input providers.
 """
 
 # Imports
+import os
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Tuple
+from input_strings.input_string_errors import InputStringError
+from input_strings.input_strings_config import InputStringsConfig
+from input_strings.input_strings_utils import validate_line_length_or_raise
+
+# Chunk of an input string: at most a given number of its characters, and whether it ends the input string
+InputChunk = Tuple[str, bool]
 
 
 class InputProvider(ABC):
@@ -31,3 +38,90 @@ class InputProvider(ABC):
             List[str]: A list of input strings.
         """
         pass
+
+    @abstractmethod
+    def iter_inputs(self) -> Iterator[str]:
+        """
+        Iterates over the input strings.
+
+        Implementations may read the input strings lazily, so that they do not have to be kept in memory.
+
+        Returns:
+            Iterator[str]: An iterator over the input strings.
+
+        Raises:
+            Exception: If an input string cannot be read.
+        """
+        pass
+
+    def iter_input_chunks(self, chunk_size: int) -> Iterator[InputChunk]:
+        """
+        Iterates over the input strings in chunks of at most `chunk_size` characters.
+
+        The chunks of every input string are yielded in order, and the last one is flagged as ending the
+        input string. This implementation splits the input strings returned by `iter_inputs`; providers that
+        can read an input string without building it override it, so that memory usage does not depend on
+        the length of the input strings.
+
+        Args:
+            chunk_size (int): Maximum number of characters of a chunk.
+
+        Returns:
+            Iterator[InputChunk]: An iterator over the chunks of the input strings.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
+            Exception: If an input string cannot be read.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size ({chunk_size}) must be positive.")
+
+        for input_string in self.iter_inputs():
+            for start in range(0, max(len(input_string), 1), chunk_size):
+                yield input_string[start: start + chunk_size], start + chunk_size >= len(input_string)
+
+    @staticmethod
+    def _check_input_file(input_file_path: str) -> None:
+        """
+        Checks that an input file exists.
+
+        Args:
+            input_file_path (str): Path to the input file.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+        """
+        if not os.path.exists(input_file_path):
+            raise FileNotFoundError(f"Input file '{input_file_path}' does not exist!")
+
+    @staticmethod
+    def _iter_file_lines(input_file_path: str, input_strings_config: InputStringsConfig) -> Iterator[str]:
+        """
+        Reads, validates and yields the lines of an input file one at a time.
+
+        Args:
+            input_file_path (str): Path to the input file.
+            input_strings_config (InputStringsConfig): Configuration of the input strings.
+
+        Yields:
+            str: The next line.
+
+        Raises:
+            InputStringError: If a line violates constraints (e.g., invalid length), or if the file is empty.
+        """
+        min_line_length = input_strings_config.min_line_length
+        max_line_length = input_strings_config.max_line_length
+        is_empty = True
+
+        # Open the file and read line by line
+        with open(input_file_path, mode="r", encoding="utf-8") as file:
+            for line in file:
+                # Validate line length
+                validate_line_length_or_raise(line=line,
+                                              min_line_length=min_line_length,
+                                              max_line_length=max_line_length)
+                is_empty = False
+                yield line
+
+        if is_empty:
+            raise InputStringError(f"Input file '{input_file_path}' is empty.")
@@ -0,0 +1,26 @@
+"""
+Utility functions for input string operations.
+"""
+
+# Imports
+from input_strings.input_string_errors import InputStringError
+
+
+def validate_line_length_or_raise(line: str, min_line_length: int, max_line_length: int) -> None:
+    """
+    Validates the length of an input line and raises an exception if it is invalid.
+
+    Args:
+        line (str): The line to validate.
+        min_line_length (int): Minimum allowed length of the line.
+        max_line_length (int): Maximum allowed length of the line.
+
+    Raises:
+        InputStringError: If the line's length does not meet the constraints.
+    """
+    line_length = len(line)
+    if not min_line_length <= line_length <= max_line_length:
+        raise InputStringError(
+            f"Line '{line}' does not meet the length constraints "
+            f"({min_line_length} <= len(line) <= {max_line_length})."
+        )
@@ -0,0 +1,116 @@
+"""
+Concrete implementation of InputProvider that reads the input strings of a memory-mapped file.
+"""
+
+# Imports
+import mmap
+import os
+from typing import Iterator, List, Tuple
+from input_strings.input_provider import InputProvider
+from input_strings.input_strings_config import InputStringsConfig
+from input_strings.input_string_errors import InputStringError
+
+
+class MmapInputFileProvider(InputProvider):
+    """
+    Class responsible for reading input strings from a memory-mapped file.
+
+    The file is mapped into memory instead of being read through a text-mode file object. Line
+    boundaries are found by scanning the raw bytes for newlines, and the length constraints are
+    validated on the raw byte spans. A line is decoded directly from the mapped memory only when it is
+    handed to the caller, so no intermediate copies of the lines are created.
+
+    Note:
+        Line lengths are measured in bytes (including the trailing newline), which is equal to the
+        number of characters for ASCII input. Line endings are not translated.
+    """
+    def __init__(self, input_file_path: str, input_strings_config: InputStringsConfig):
+        """
+        Initializes the MmapInputFileProvider.
+
+        Args:
+            input_file_path (str): Path to the input file.
+            input_strings_config (InputStringsConfig): Configuration of the input strings.
+        """
+        self.input_file_path: str = input_file_path
+        self.input_strings_config: InputStringsConfig = input_strings_config
+
+    def load(self) -> None:
+        """
+        Checks that the input file exists and is not empty. The lines are read lazily by `iter_inputs`.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+            InputStringError: If the input file is empty.
+        """
+        self._check_input_file(self.input_file_path)
+
+        if os.path.getsize(self.input_file_path) == 0:
+            raise InputStringError(f"Input file '{self.input_file_path}' is empty.")
+
+    def iter_spans(self, buffer: mmap.mmap) -> Iterator[Tuple[int, int]]:
+        """
+        Finds and validates the spans of the lines of a mapped file.
+
+        Args:
+            buffer (mmap.mmap): The mapped input file.
+
+        Yields:
+            Tuple[int, int]: The start (inclusive) and end (exclusive) offsets of the next line,
+                             including its trailing newline.
+
+        Raises:
+            InputStringError: If a line violates constraints (e.g., invalid length).
+        """
+        min_line_length = self.input_strings_config.min_line_length
+        max_line_length = self.input_strings_config.max_line_length
+        size = len(buffer)
+
+        start = 0
+        while start < size:
+            end = buffer.find(b"\n", start)
+            end = size if end == -1 else end + 1
+
+            # Validate line length on the raw span
+            if not min_line_length <= end - start <= max_line_length:
+                raise InputStringError(
+                    f"Line '{buffer[start: end].decode('utf-8', errors='replace')}' does not meet the length "
+                    f"constraints ({min_line_length} <= len(line) <= {max_line_length})."
+                )
+
+            yield start, end
+            start = end
+
+    def iter_inputs(self) -> Iterator[str]:
+        """
+        Yields the lines of the input file one at a time, decoding each one directly from the mapped memory.
+
+        Yields:
+            str: The next input string.
+
+        Raises:
+            InputStringError: If a line violates constraints (e.g., invalid length), or if the file is empty.
+        """
+        with open(self.input_file_path, mode="rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                raise InputStringError(f"Input file '{self.input_file_path}' is empty.")
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                view = memoryview(buffer)
+                try:
+                    for start, end in self.iter_spans(buffer):
+                        yield str(view[start: end], encoding="utf-8")
+                finally:
+                    view.release()
+
+    def get(self) -> List[str]:
+        """
+        Reads all the input strings.
+
+        Note:
+            This method keeps all the lines in memory; use `iter_inputs` for streaming.
+
+        Returns:
+            List[str]: A list of input strings.
+        """
+        return list(self.iter_inputs())
@@ -0,0 +1,119 @@
+"""
+Concrete implementation of InputProvider that streams the input strings of a file.
+"""
+
+# Imports
+from typing import Iterator, List
+from input_strings.input_provider import InputChunk, InputProvider
+from input_strings.input_strings_config import InputStringsConfig
+from input_strings.input_string_errors import InputStringError
+
+
+class StreamingInputFileProvider(InputProvider):
+    """
+    Class responsible for streaming input strings from a file.
+
+    Unlike `InputFileProvider`, the lines are not kept in memory: they are read, validated and
+    yielded one at a time, so memory usage does not depend on the size of the input file and the
+    first line can be processed as soon as it has been read. The lines can also be read in chunks of
+    characters (see `iter_input_chunks`), so that memory usage does not depend on the length of the
+    lines either.
+    """
+    def __init__(self, input_file_path: str, input_strings_config: InputStringsConfig):
+        """
+        Initializes the StreamingInputFileProvider.
+
+        Args:
+            input_file_path (str): Path to the input file.
+            input_strings_config (InputStringsConfig): Configuration of the input strings.
+        """
+        self.input_file_path: str = input_file_path
+        self.input_strings_config: InputStringsConfig = input_strings_config
+
+    def load(self) -> None:
+        """
+        Checks that the input file exists. The lines are read lazily by `iter_inputs`.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+        """
+        self._check_input_file(self.input_file_path)
+
+    def iter_inputs(self) -> Iterator[str]:
+        """
+        Reads, validates and yields the lines of the input file one at a time.
+
+        Returns:
+            Iterator[str]: An iterator over the input strings.
+
+        Raises:
+            InputStringError: If a line violates constraints (e.g., invalid length), or if the file is empty.
+        """
+        return self._iter_file_lines(self.input_file_path, self.input_strings_config)
+
+    def iter_input_chunks(self, chunk_size: int) -> Iterator[InputChunk]:
+        """
+        Reads the lines of the input file in chunks of at most `chunk_size` characters, without building
+        the lines. The length of every line is validated while it is read.
+
+        Args:
+            chunk_size (int): Maximum number of characters of a chunk.
+
+        Yields:
+            InputChunk: The next chunk, and whether it ends its line.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
+            InputStringError: If a line violates constraints (e.g., invalid length), or if the file is empty.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size ({chunk_size}) must be positive.")
+
+        min_line_length = self.input_strings_config.min_line_length
+        max_line_length = self.input_strings_config.max_line_length
+        # Number of the current line, and number of its characters read so far
+        line_number = 1
+        line_length = 0
+
+        def length_error() -> InputStringError:
+            return InputStringError(f"Line {line_number} does not meet the length constraints "
+                                    f"({min_line_length} <= len(line) <= {max_line_length}).")
+
+        with open(self.input_file_path, mode="r", encoding="utf-8") as file:
+            while data := file.read(chunk_size):
+                start = 0
+                while start < len(data):
+                    # The chunk ends at the end of the line, or at the end of the data
+                    end = data.find("\n", start) + 1 or len(data)
+                    line_length += end - start
+                    if line_length > max_line_length:
+                        raise length_error()
+
+                    line_ended = data[end - 1] == "\n"
+                    if line_ended:
+                        if line_length < min_line_length:
+                            raise length_error()
+                        line_number += 1
+                        line_length = 0
+                    yield data[start: end], line_ended
+                    start = end
+
+        # The last line may not end with a line break
+        if line_length:
+            if line_length < min_line_length:
+                raise length_error()
+            yield "", True
+        elif line_number == 1:
+            raise InputStringError(f"Input file '{self.input_file_path}' is empty.")
+
+    def get(self) -> List[str]:
+        """
+        Reads all the input strings.
+
+        Note:
+            This method keeps all the lines in memory; use `iter_inputs` for streaming.
+
+        Returns:
+            List[str]: A list of input strings.
+        """
+        return list(self.iter_inputs())
@@ -27,6 +27,15 @@ class TestInputFileProvider(unittest.TestCase):
         provider.load()
         self.assertEqual(provider.get(), ["valid_str"])
 
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="valid_str\nabc\n")
+    def test_iter_input_chunks(self, mock_file, mock_exists):
+        """Test that the loaded lines are split into chunks."""
+        provider = InputFileProvider(self.file_path, self.config)
+        provider.load()
+        self.assertEqual(list(provider.iter_input_chunks(4)),
+                         [("vali", False), ("d_st", False), ("r\n", True), ("abc\n", True)])
+
     @patch("os.path.exists", return_value=True)
     @patch("builtins.open", new_callable=mock_open, read_data="too_long_line_exceeds\nvalid\n")
     def test_line_too_long(self, mock_file, mock_exists):
@@ -0,0 +1,66 @@
+"""
+Test cases for MmapInputFileProvider.
+"""
+
+# Imports
+import os
+import tempfile
+import unittest
+from input_strings.mmap_input_file_provider import MmapInputFileProvider
+from input_strings.input_strings_config import InputStringsConfig
+from input_strings.input_string_errors import InputStringError
+
+
+class TestMmapInputFileProvider(unittest.TestCase):
+    """
+    Unit tests for the MmapInputFileProvider class.
+    """
+    def setUp(self):
+        """Set up test configuration and a temporary directory."""
+        self.config = InputStringsConfig(min_line_length=3, max_line_length=10)
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.file_path = os.path.join(self.temp_dir.name, "input.txt")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def write_input(self, data: bytes) -> None:
+        """Writes the given data to the input file."""
+        with open(self.file_path, mode="wb") as file:
+            file.write(data)
+
+    def test_iter_valid_file(self):
+        """Test reading a valid file, with and without a trailing newline."""
+        self.write_input(b"valid_str\nanother\nlast")
+        provider = MmapInputFileProvider(self.file_path, self.config)
+        provider.load()
+        self.assertEqual(provider.get(), ["valid_str\n", "another\n", "last"])
+
+    def test_line_too_long(self):
+        """Test that the length constraints are validated on the raw spans."""
+        self.write_input(b"valid\ntoo_long_line_exceeds\n")
+        provider = MmapInputFileProvider(self.file_path, self.config)
+        inputs = provider.iter_inputs()
+        self.assertEqual(next(inputs), "valid\n")
+        with self.assertRaises(InputStringError):
+            next(inputs)
+
+    def test_empty_file(self):
+        """Test reading an empty file."""
+        self.write_input(b"")
+        provider = MmapInputFileProvider(self.file_path, self.config)
+        with self.assertRaises(InputStringError):
+            provider.load()
+        with self.assertRaises(InputStringError):
+            provider.get()
+
+    def test_file_not_found(self):
+        """Test file not found."""
+        provider = MmapInputFileProvider(self.file_path, self.config)
+        with self.assertRaises(FileNotFoundError):
+            provider.load()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Test cases for StreamingInputFileProvider.
+"""
+
+# Imports
+import unittest
+from unittest.mock import mock_open, patch
+from input_strings.streaming_input_file_provider import StreamingInputFileProvider
+from input_strings.input_strings_config import InputStringsConfig
+from input_strings.input_string_errors import InputStringError
+
+
+class TestStreamingInputFileProvider(unittest.TestCase):
+    """
+    Unit tests for the StreamingInputFileProvider class.
+    """
+    def setUp(self):
+        """Set up test configuration and provider."""
+        self.config = InputStringsConfig(min_line_length=3, max_line_length=10)
+        self.file_path = "test_file.txt"
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="valid_str\nanother\n")
+    def test_iter_valid_file(self, mock_file, mock_exists):
+        """Test streaming a valid file."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        provider.load()
+        self.assertEqual(list(provider.iter_inputs()), ["valid_str\n", "another\n"])
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="valid\ntoo_long_line_exceeds\n")
+    def test_line_too_long(self, mock_file, mock_exists):
+        """Test that lines are validated while streaming, after the preceding lines were yielded."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        provider.load()
+        inputs = provider.iter_inputs()
+        self.assertEqual(next(inputs), "valid\n")
+        with self.assertRaises(InputStringError):
+            next(inputs)
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="")
+    def test_empty_file(self, mock_file, mock_exists):
+        """Test streaming an empty file."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        provider.load()
+        with self.assertRaises(InputStringError):
+            provider.get()
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="valid_str\nabc\nlast")
+    def test_iter_input_chunks(self, mock_file, mock_exists):
+        """Test reading the lines in chunks, including a last line without a line break."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        provider.load()
+        self.assertEqual(list(provider.iter_input_chunks(4)),
+                         [("vali", False), ("d_st", False), ("r\n", True), ("ab", False), ("c\n", True),
+                          ("la", False), ("st", False), ("", True)])
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="valid\ntoo_long_line_exceeds\n")
+    def test_chunked_line_too_long(self, mock_file, mock_exists):
+        """Test that the length of a line is validated while its chunks are read."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        provider.load()
+        chunks = provider.iter_input_chunks(4)
+        self.assertEqual([next(chunks) for _ in range(5)],
+                         [("vali", False), ("d\n", True), ("to", False), ("o_lo", False), ("ng_l", False)])
+        with self.assertRaises(InputStringError):
+            next(chunks)
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="valid\na\n")
+    def test_chunked_line_too_short(self, mock_file, mock_exists):
+        """Test that a line shorter than the minimum length is rejected when it ends."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        provider.load()
+        with self.assertRaises(InputStringError):
+            list(provider.iter_input_chunks(2))
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data="")
+    def test_chunked_empty_file(self, mock_file, mock_exists):
+        """Test reading an empty file in chunks."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        provider.load()
+        with self.assertRaises(InputStringError):
+            list(provider.iter_input_chunks(4))
+        with self.assertRaises(ValueError):
+            list(provider.iter_input_chunks(0))
+
+    @patch("os.path.exists", return_value=False)
+    def test_file_not_found(self, mock_exists):
+        """Test file not found."""
+        provider = StreamingInputFileProvider(self.file_path, self.config)
+        with self.assertRaises(FileNotFoundError):
+            provider.load()
+
+
+if __name__ == "__main__":
+    unittest.main()
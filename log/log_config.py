@@ -36,16 +36,39 @@ class LogConfig(Config):
         description="Whether to enable console logging."
     )
 
+    log_console_stream: Literal["STDOUT", "STDERR"] = Field(
+        default="STDOUT",
+        description="Stream of the console logging (must be one of STDOUT, STDERR)."
+    )
+
     log_level: Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"] = Field(
         default="INFO",
         description="Logging level (must be one of CRITICAL, ERROR, WARNING, INFO, DEBUG)."
     )
 
-    @field_validator("log_level", mode="before")
+    log_async: bool = Field(
+        default=False,
+        description="Whether log records are written by a background thread instead of the calling thread."
+    )
+
+    log_queue_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum number of log records waiting to be written when logging asynchronously "
+                    "(must be positive)."
+    )
+
+    log_queue_overflow: Literal["BLOCK", "DROP"] = Field(
+        default="BLOCK",
+        description="What happens when the queue of log records is full: BLOCK waits for free space, "
+                    "DROP discards the record (except the results, which are always waited for)."
+    )
+
+    @field_validator("log_level", "log_console_stream", "log_queue_overflow", mode="before")
     # pylint: disable=no-self-argument
     def normalize_log_level(cls, value: str) -> str:
         """
-        Converts the log_level attribute to uppercase.
+        Converts the log_level, log_console_stream and log_queue_overflow attributes to uppercase.
         """
         return value.upper()
 
@@ -11,8 +11,24 @@ from abc import ABC, abstractmethod
 class Logger(ABC):
     """
     Abstract base class for logging operations.
+
+    Building a log message may be expensive. Callers in hot paths should check `is_enabled_for` once
+    and only build the messages of the levels that are enabled.
     """
 
+    @abstractmethod
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Checks whether messages of a level are logged.
+
+        Args:
+            level (str): The level (CRITICAL, ERROR, WARNING, INFO or DEBUG).
+
+        Returns:
+            bool: True if messages of the level are logged, False otherwise.
+        """
+        pass
+
     @abstractmethod
     def info(self, message: str) -> None:
         """
@@ -0,0 +1,37 @@
+"""
+Python module that provides a logger which discards all messages.
+"""
+
+# Imports
+from log.logger import Logger
+
+
+class NullLogger(Logger):
+    """
+    Logger that discards all messages.
+
+    It is used where the application logger is not available, e.g. inside worker processes,
+    to which the handlers of the application logger cannot be transferred.
+    """
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Returns False, since no messages are logged."""
+        return False
+
+    def info(self, message: str) -> None:
+        """Discards an informational message."""
+
+    def debug(self, message: str) -> None:
+        """Discards a debug message."""
+
+    def warning(self, message: str) -> None:
+        """Discards a warning message."""
+
+    def error(self, message: str) -> None:
+        """Discards an error message."""
+
+    def critical(self, message: str) -> None:
+        """Discards a critical message."""
+
+    def always(self, message: str) -> None:
+        """Discards a message."""
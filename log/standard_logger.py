@@ -3,19 +3,81 @@ Python module that is responsible for logging functionalities.
 """
 
 # Imports
+import atexit
 import logging
+import queue
 import sys
 from logging import handlers
+from typing import Optional
 from log.logger import Logger
 from log.log_config import LogConfig
 from utils.file_utils import create_parent_directories
 
+# Custom log level of the messages that are always logged (e.g. the results), higher than CRITICAL
+ALWAYS_LEVEL = 100
+
+
+class BoundedQueueHandler(handlers.QueueHandler):
+    """
+    Queue handler that applies an overflow policy when its bounded queue is full.
+
+    Records of the ALWAYS level (e.g. the results) are never dropped: the handler waits for free space in the
+    queue for them, whatever the overflow policy.
+    """
+
+    def __init__(self, record_queue: queue.Queue, overflow: str):
+        """
+        Initializes the BoundedQueueHandler.
+
+        Args:
+            record_queue (queue.Queue): The bounded queue receiving the log records.
+            overflow (str): BLOCK to wait for free space in the queue, DROP to discard the record
+                            (except for records of the ALWAYS level).
+        """
+        super().__init__(record_queue)
+        self.overflow: str = overflow
+        self.dropped_records: int = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Adds a log record to the queue, applying the overflow policy if the queue is full.
+
+        Args:
+            record (logging.LogRecord): The log record.
+        """
+        if self.overflow == "BLOCK" or record.levelno >= ALWAYS_LEVEL:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+
+class BoundedQueueListener(handlers.QueueListener):
+    """
+    Queue listener that waits for free space in its bounded queue when it is stopped.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        """
+        Adds the sentinel that stops the listener to the queue, waiting until the queue has free space.
+        """
+        self.queue.put(self._sentinel)
+
 
 class StandardLogger(Logger):
     """
     Singleton class that manages a global logger instance for the application.
+
+    When asynchronous logging is enabled, log records are put in a bounded queue and written to the
+    console and the log file by a background thread, so that the calling thread does not wait for the
+    I/O. The queue is flushed when the application exits.
     """
     _instance = None
+    # Listener writing the queued log records, if logging asynchronously
+    _listener: Optional[BoundedQueueListener] = None
 
     def __new__(cls, log_config: LogConfig, logger_name: str):
         """
@@ -33,11 +95,17 @@ class StandardLogger(Logger):
             cls._instance = super(Logger, cls).__new__(cls)
             # Use the provided LogConfig to initialize the logger
             cls._instance._logger = cls._initialize_logger(log_config, logger_name)
+            cls._instance._listener = None
+            if log_config.log_async:
+                cls._instance._listener = cls._start_queue_listener(cls._instance._logger, log_config)
+                atexit.register(cls._instance.shutdown)
         return cls._instance
 
     @classmethod
     def reset_instance(cls):
         """Resets the singleton instance."""
+        if cls._instance is not None:
+            cls._instance.shutdown()
         cls._instance = None
 
     @staticmethod
@@ -69,11 +137,12 @@ class StandardLogger(Logger):
         # Customize the date format without milliseconds
         log_format.datefmt = "%Y-%m-%d %H:%M:%S"
 
-        # Enable stdout logging
+        # Enable console logging
         if log_config.log_enable_console:
-            stdout_handler = logging.StreamHandler(sys.stdout)
-            stdout_handler.setFormatter(log_format)
-            logger.addHandler(stdout_handler)
+            console_handler = logging.StreamHandler(sys.stderr if log_config.log_console_stream == "STDERR"
+                                                    else sys.stdout)
+            console_handler.setFormatter(log_format)
+            logger.addHandler(console_handler)
 
         # Enable file logging
         create_parent_directories(log_config.log_file)
@@ -85,6 +154,50 @@ class StandardLogger(Logger):
 
         return logger
 
+    @staticmethod
+    def _start_queue_listener(logger: logging.Logger, log_config: LogConfig) -> BoundedQueueListener:
+        """
+        Moves the handlers of the logger behind a bounded queue that is consumed by a background thread.
+
+        Args:
+            logger (logging.Logger): The configured logger.
+            log_config (LogConfig): The configuration object used to configure the logger.
+
+        Returns:
+            BoundedQueueListener: The started listener writing the queued log records.
+        """
+        output_handlers = list(logger.handlers)
+        for handler in output_handlers:
+            logger.removeHandler(handler)
+
+        record_queue = queue.Queue(maxsize=log_config.log_queue_size)
+        logger.addHandler(BoundedQueueHandler(record_queue, log_config.log_queue_overflow))
+
+        listener = BoundedQueueListener(record_queue, *output_handlers, respect_handler_level=True)
+        listener.start()
+        return listener
+
+    def shutdown(self) -> None:
+        """
+        Writes the queued log records and stops the background thread, if logging asynchronously.
+        """
+        listener = self._listener
+        if listener is not None:
+            self._listener = None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+
+            queue_handlers = [handler for handler in self._logger.handlers  # pylint: disable=no-member
+                              if isinstance(handler, BoundedQueueHandler)]
+            dropped_records = sum(handler.dropped_records for handler in queue_handlers)
+            if dropped_records:
+                print(f"{dropped_records} log record(s) dropped because the log queue was full.", file=sys.stderr)
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Checks whether messages of a level are logged."""
+        return self._logger.isEnabledFor(logging.getLevelName(level))  # pylint: disable=no-member
+
     def info(self, message: str) -> None:
         """Logs an informational message."""
         self._logger.info(message) # pylint: disable=no-member
@@ -107,4 +220,4 @@ class StandardLogger(Logger):
 
     def always(self, message: str) -> None:
         """Logs a message always."""
-        self._logger.log(100, message)  # Custom log level higher than CRITICAL # pylint: disable=no-member
+        self._logger.log(ALWAYS_LEVEL, message)  # pylint: disable=no-member
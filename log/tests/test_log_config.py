@@ -37,6 +37,9 @@ class TestLogConfig(unittest.TestCase):
         self.assertEqual(config.log_backup_count, 5)
         self.assertTrue(config.log_enable_console)
         self.assertEqual(config.log_level, "INFO")
+        self.assertFalse(config.log_async)
+        self.assertEqual(config.log_queue_size, 10_000)
+        self.assertEqual(config.log_queue_overflow, "BLOCK")
 
     def test_log_level_case_insensitivity(self):
         """Test that LogConfig handles log level case insensitivity."""
@@ -87,5 +90,11 @@ class TestLogConfig(unittest.TestCase):
             LogConfig(log_file="   ")
         self.assertIn("`log_file` cannot be null or an empty string", str(context.exception))
 
+    def test_queue_overflow_case_insensitivity(self):
+        """Test that LogConfig handles the queue overflow policy case insensitivity and rejects invalid policies."""
+        self.assertEqual(LogConfig(log_queue_overflow="drop").log_queue_overflow, "DROP")
+        with self.assertRaises(ValidationError):
+            LogConfig(log_queue_overflow="wait")
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,11 +3,15 @@ Test cases for StandardLogger
 """
 
 # Imports
+import os
+import queue
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 import logging
 from log.log_config import LogConfig
-from log.standard_logger import StandardLogger
+from log.standard_logger import ALWAYS_LEVEL, BoundedQueueHandler, StandardLogger
 
 
 class TestStandardLogger(unittest.TestCase):
@@ -90,6 +94,96 @@ class TestStandardLogger(unittest.TestCase):
         logger.critical("This is a critical message")
         mock_logger.critical.assert_called_with("This is a critical message")
 
+    @patch("log.standard_logger.create_parent_directories")
+    @patch("log.standard_logger.logging.getLogger")
+    def test_is_enabled_for(self, mock_get_logger, _):
+        """
+        Test that is_enabled_for checks the level of the underlying logger.
+        """
+        StandardLogger.reset_instance()
+
+        mock_get_logger.return_value = logging.Logger("test_is_enabled_for")
+        logger = StandardLogger(self.log_config, "test_logger_name")
+
+        self.assertTrue(logger.is_enabled_for("INFO"))
+        self.assertTrue(logger.is_enabled_for("ERROR"))
+        self.assertFalse(logger.is_enabled_for("DEBUG"))
+
+        StandardLogger.reset_instance()
+
+    def test_async_logging(self):
+        """
+        Test that asynchronous logging writes every record to the log file when the logger shuts down.
+        """
+        StandardLogger.reset_instance()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, "async.log")
+            log_config = LogConfig(log_file=log_file, log_enable_console=False, log_async=True, log_queue_size=4)
+            logger = StandardLogger(log_config, "test_async_logger")
+
+            for index in range(100):
+                logger.always(f"Case #{index}: 1")
+            StandardLogger.reset_instance()
+
+            with open(log_file, mode="r", encoding="utf-8") as file:
+                lines = file.read().splitlines()
+            self.assertEqual(len(lines), 100)
+            self.assertTrue(lines[-1].endswith("Case #99: 1"))
+
+            for handler in logging.getLogger("test_async_logger").handlers:
+                handler.close()
+
+    def test_bounded_queue_handler_drop(self):
+        """
+        Test that the DROP overflow policy discards the records that do not fit in the queue.
+        """
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), "DROP")
+        for index in range(5):
+            handler.emit(logging.makeLogRecord({"msg": f"message {index}", "levelno": logging.INFO}))
+
+        self.assertEqual(handler.queue.qsize(), 2)
+        self.assertEqual(handler.dropped_records, 3)
+
+    def test_bounded_queue_handler_drop_keeps_always_records(self):
+        """
+        Test that the DROP overflow policy waits for free space in the queue for the records of the ALWAYS level.
+        """
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), "DROP")
+        handler.emit(logging.makeLogRecord({"msg": "message", "levelno": logging.INFO}))
+        always_record = logging.makeLogRecord({"msg": "Case #1: 1", "levelno": ALWAYS_LEVEL})
+
+        thread = threading.Thread(target=handler.emit, args=(always_record,))
+        thread.start()
+        self.assertEqual(handler.queue.get(timeout=10).msg, "message")
+        thread.join(10)
+
+        self.assertEqual(handler.queue.get_nowait().msg, "Case #1: 1")
+        self.assertEqual(handler.dropped_records, 0)
+
+    def test_async_logging_drop_keeps_results(self):
+        """
+        Test that asynchronous logging with the DROP overflow policy writes every result to the log file.
+        """
+        StandardLogger.reset_instance()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, "async.log")
+            log_config = LogConfig(log_file=log_file, log_enable_console=False, log_async=True, log_queue_size=1,
+                                   log_queue_overflow="DROP")
+            logger = StandardLogger(log_config, "test_async_drop_logger")
+
+            for index in range(100):
+                logger.always(f"Case #{index}: 1")
+            StandardLogger.reset_instance()
+
+            with open(log_file, mode="r", encoding="utf-8") as file:
+                lines = file.read().splitlines()
+            self.assertEqual(len(lines), 100)
+
+            for handler in logging.getLogger("test_async_drop_logger").handlers:
+                handler.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,132 @@
+"""
+Module for the per-line character profile used to prune the dictionary words before scanning a line.
+"""
+
+# Imports
+from typing import AbstractSet, Optional
+from dictionary.multiset_signature import MultisetSignatureEncoder
+
+
+class LineProfile:
+    """
+    Character profile of an input string, built once per input string.
+
+    A dictionary word (or any of its scrambled forms) can only appear in the input string if every
+    one of its letters appears in the input string, so words with a missing letter are pruned before
+    any window of the input string is examined.
+
+    The profile also maps every character to its sorted positions in the input string (built on first
+    use), so that only the windows whose first and last letters match those of a word are visited,
+    and holds the prefix multiset signatures of the input string (built on first use), so that the
+    signature of the middle of any window is obtained with a single subtraction. The letters of the
+    input string are also available as a mask of signature fields, which prunes a word from its
+    signature alone.
+    """
+
+    def __init__(self, input_string: str):
+        """
+        Builds the profile of an input string.
+
+        Args:
+            input_string (str): The input string.
+        """
+        self.input_string: str = input_string
+        self.length: int = len(input_string)
+        self.letters: frozenset[str] = frozenset(input_string)
+        self._positions: Optional[dict[str, list[int]]] = None
+        self._prefix_signatures: Optional[list[int]] = None
+        self._letters_mask: Optional[int] = None
+
+    def can_contain(self, word_letters: AbstractSet[str], word_length: int) -> bool:
+        """
+        Checks whether a word may appear in the input string.
+
+        Args:
+            word_letters (AbstractSet[str]): The distinct letters of the word.
+            word_length (int): The length of the word.
+
+        Returns:
+            bool: False if the word cannot appear in the input string, True if it may appear.
+        """
+        return word_length <= self.length and word_letters <= self.letters
+
+    def get_positions(self, char: str) -> list[int]:
+        """
+        Retrieves the positions of a character in the input string.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            list[int]: The positions of the character, in ascending order (empty if it does not appear).
+        """
+        if self._positions is None:
+            self._positions = {}
+            for position, input_char in enumerate(self.input_string):
+                self._positions.setdefault(input_char, []).append(position)
+
+        return self._positions.get(char, [])
+
+    def get_window_starts(self, first: str, last: str, word_length: int) -> list[int]:
+        """
+        Retrieves the start positions of the windows of a given length whose first and last letters
+        are the given ones.
+
+        The shorter of the two position lists is walked, and the other endpoint of every window is
+        checked directly in the input string, so the cost is proportional to the occurrences of the
+        rarer letter.
+
+        Args:
+            first (str): The first letter of the windows.
+            last (str): The last letter of the windows.
+            word_length (int): The length of the windows.
+
+        Returns:
+            list[int]: The start positions of the matching windows, in ascending order.
+        """
+        offset = word_length - 1
+        first_positions = self.get_positions(first)
+        last_positions = self.get_positions(last)
+        input_string = self.input_string
+
+        if len(first_positions) <= len(last_positions):
+            end = self.length - offset
+            return [start for start in first_positions if start < end and input_string[start + offset] == last]
+
+        return [stop - offset for stop in last_positions if stop >= offset and input_string[stop - offset] == first]
+
+    def get_prefix_signatures(self, encoder: MultisetSignatureEncoder) -> list[int]:
+        """
+        Retrieves the multiset signatures of all the prefixes of the input string.
+
+        The signature of the middle of the window of length `W` starting at `i` (with `W > 2`) is
+        `prefixes[i + W - 1] - prefixes[i + 1]`.
+
+        Args:
+            encoder (MultisetSignatureEncoder): The encoder of the dictionary signatures. The same encoder
+                                                must be used for all the calls on a profile.
+
+        Returns:
+            list[int]: The `len(input_string) + 1` prefix signatures.
+        """
+        if self._prefix_signatures is None:
+            self._prefix_signatures = encoder.encode_prefixes(self.input_string)
+        return self._prefix_signatures
+
+    def get_letters_mask(self, encoder: MultisetSignatureEncoder) -> int:
+        """
+        Retrieves the mask of the signature fields of the letters of the input string.
+
+        The middle of a word with signature `signature` can only appear in the input string if
+        `signature & ~mask == 0`.
+
+        Args:
+            encoder (MultisetSignatureEncoder): The encoder of the dictionary signatures. The same encoder
+                                                must be used for all the calls on a profile.
+
+        Returns:
+            int: The mask of the signature fields of the letters of the input string.
+        """
+        if self._letters_mask is None:
+            self._letters_mask = encoder.encode_presence(self.letters)
+        return self._letters_mask
@@ -0,0 +1,100 @@
+"""
+Module for memoizing the match counts of repeated input strings.
+"""
+
+# Imports
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+from stats.cache_stats import CacheStats
+
+# Size in bytes of the digests that identify the input strings
+LINE_DIGEST_SIZE = 16
+
+
+def compute_line_key(input_string: str) -> bytes:
+    """
+    Computes the key that identifies an input string in the memo and in the result caches.
+
+    Args:
+        input_string (str): The input string.
+
+    Returns:
+        bytes: The 128-bit BLAKE2b digest of the input string.
+    """
+    return hashlib.blake2b(input_string.encode("utf-8", "surrogatepass"), digest_size=LINE_DIGEST_SIZE).digest()
+
+
+class LineResultMemo:
+    """
+    Memo of the match counts of the input strings, with least-recently-used eviction.
+
+    Input files often contain repeated input strings (e.g. retries or replayed traffic), whose count of
+    matched words only depends on their contents. The memo maps a 128-bit BLAKE2b digest of every input
+    string to its count, so repeated input strings are answered without being scanned again, while the
+    memory used by an entry does not depend on the length of the input string.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initializes the LineResultMemo.
+
+        Args:
+            max_entries (int): Maximum number of memoized input strings.
+
+        Raises:
+            ValueError: If `max_entries` is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"The maximum number of memoized input strings ({max_entries}) must be positive.")
+
+        self.max_entries: int = max_entries
+        self.stats: CacheStats = CacheStats()
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[int]:
+        """
+        Retrieves the memoized count of an input string.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+
+        Returns:
+            Optional[int]: The count of matched words, or None if the input string is not memoized.
+        """
+        count = self._counts.get(key)
+        if count is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self._counts.move_to_end(key)
+        return count
+
+    def put(self, key: bytes, count: int) -> None:
+        """
+        Memoizes the count of an input string, evicting the least recently used one if the memo is full.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+            count (int): The count of matched words.
+        """
+        self._counts[key] = count
+        self._counts.move_to_end(key)
+        if len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+            self.stats.evictions += 1
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Retrieves the statistics of the memo.
+
+        Returns:
+            dict[str, int]: The number of input strings served from the memo, of misses and of evictions,
+                            and the number of memoized input strings.
+        """
+        return {**self.stats.to_counters("line_memo"), "line_memo_entries": len(self._counts)}
+
+    def __len__(self) -> int:
+        """Returns the number of memoized input strings."""
+        return len(self._counts)
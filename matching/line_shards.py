@@ -0,0 +1,36 @@
+"""
+Module for splitting very long input strings into overlapping shards.
+"""
+
+# Imports
+from typing import Iterator
+
+
+def iter_line_shards(input_string: str, shard_size: int, overlap: int) -> Iterator[str]:
+    """
+    Splits an input string into shards that can be matched independently.
+
+    A shard starts every `shard_size` characters and also holds the first `overlap` characters of the
+    next one. When `overlap` is the length of the longest dictionary word minus one, every window of a
+    dictionary word length lies entirely in at least one shard, so the union of the matches of the shards
+    is the set of matches of the input string.
+
+    Args:
+        input_string (str): The input string to split.
+        shard_size (int): Number of characters between the starts of two consecutive shards.
+        overlap (int): Number of characters shared by two consecutive shards.
+
+    Yields:
+        str: The shards of the input string, in order. A string that fits in one shard is yielded whole.
+
+    Raises:
+        ValueError: If `shard_size` is not positive or `overlap` is negative.
+    """
+    if shard_size < 1:
+        raise ValueError(f"The shard size ({shard_size}) must be positive.")
+    if overlap < 0:
+        raise ValueError(f"The shard overlap ({overlap}) must not be negative.")
+
+    # The last shard reaches the end of the input string, so no shard starts within its overlap
+    for start in range(0, max(len(input_string) - overlap, 1), shard_size):
+        yield input_string[start: start + shard_size + overlap]
@@ -0,0 +1,143 @@
+"""
+Abstract module for match engines.
+
+Defines the `MatchEngine` interface used by `ScrambledStringFinder` to count the dictionary
+words (including their scrambled versions) that appear in an input string.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Hashable, Tuple
+from dictionary.dictionary_index import Signature
+from log.logger import Logger
+from log.null_logger import NullLogger
+
+# Names of the hot-path counters maintained by the match engines
+MATCH_COUNTERS = (
+    "windows_examined",
+    "endpoint_rejects",
+    "canonical_computations",
+    "full_matches",
+    "early_breaks",
+    "pruned_words",
+)
+
+# Matches of an input string: the number of matched dictionary words, by key of a group of scrambled-equivalent
+# dictionary words. The keys are specific to an engine, and the matches of the parts of an input string are merged
+# by union.
+Matches = Dict[Hashable, int]
+
+
+class MatchEngine(ABC):
+    """
+    Abstract class to define the interface for match engines.
+
+    Every implementation must return exactly the same counts; engines only differ in the
+    strategy used to examine the input string. Engines report the groups of scrambled-equivalent
+    dictionary words that they matched, so that the matches of overlapping parts of an input string
+    can be merged without counting a word twice.
+
+    Engines may compile the dictionary when they are created (the histogram and NumPy engines group its words,
+    and the index engine builds a `DictionaryIndex`), so an engine must be created after the dictionary is
+    loaded: words added to the dictionary afterwards are not taken into account.
+
+    Engines can be pickled, so that they can be sent to worker processes. The logger of an engine
+    is bound to the current process, so it is replaced by a `NullLogger` in the pickled state. A forked
+    worker process inherits the engine without pickling it, so it detaches the logger with `detach_logger`.
+
+    Engines maintain the hot-path counters listed in `counter_names`, among `MATCH_COUNTERS`: a counter that
+    has no meaning for the strategy of an engine is left out, so it is not reported. The counters are
+    accumulated with local variables and added once per input string, so maintaining them has negligible cost.
+    """
+
+    # Names of the hot-path counters maintained by the engine
+    counter_names: Tuple[str, ...] = MATCH_COUNTERS
+
+    def __init__(self):
+        """
+        Initializes the counters of the engine.
+        """
+        self.counters: dict[str, int] = dict.fromkeys(self.counter_names, 0)
+        # Logger of the engine, set by the implementations
+        self.logger: Logger = NullLogger()
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state of the engine used for pickling.
+
+        Returns:
+            dict: The attributes of the engine, with the logger replaced by a `NullLogger`.
+        """
+        state = self.__dict__.copy()
+        state["logger"] = NullLogger()
+        return state
+
+    def detach_logger(self) -> None:
+        """
+        Replaces the logger of the engine by a `NullLogger`, as in the pickled state. It is called by the worker
+        processes, whose handlers of the inherited logger (a log file shared with the parent process, or a queue
+        that no listener drains) must not be used.
+        """
+        self.logger = NullLogger()
+
+    def reset_counters(self) -> dict[str, int]:
+        """
+        Resets the counters of the engine.
+
+        Returns:
+            dict[str, int]: The counters accumulated since the previous reset.
+        """
+        counters = self.counters
+        self.counters = dict.fromkeys(self.counter_names, 0)
+        return counters
+
+    def _add_counters(self, **increments: int) -> None:
+        """
+        Adds the given increments to the counters of the engine.
+
+        Args:
+            **increments (int): The increments of the counters, by counter name.
+        """
+        for name, value in increments.items():
+            self.counters[name] += value
+
+    @abstractmethod
+    def find_matches(self, input_string: str) -> Matches:
+        """
+        Finds the groups of scrambled-equivalent dictionary words that appear as substrings in the input
+        string either in their original form or in their scrambled form.
+
+        Args:
+            input_string (str): The input string to search.
+
+        Returns:
+            Matches: The number of dictionary words of every matched group, by key of the group.
+        """
+        pass
+
+    def get_group_signature(self, key: Hashable) -> Signature:
+        """
+        Retrieves the length, the first and last letters and the signature of the middle characters shared by
+        the dictionary words of a matched group, e.g. to locate the group in the input string.
+
+        This default implementation is used by the engines whose keys are already these signatures.
+
+        Args:
+            key (Hashable): The key of the group, as returned by `find_matches`.
+
+        Returns:
+            Signature: The length, the first and last letters and the middle signature of the group.
+        """
+        return key
+
+    def count_matches(self, input_string: str) -> int:
+        """
+        Counts how many of the words from the dictionary appear as substrings in the input string
+        either in their original form or in their scrambled form.
+
+        Args:
+            input_string (str): The input string to search.
+
+        Returns:
+            int: The count of matched scrambled words.
+        """
+        return sum(self.find_matches(input_string).values())
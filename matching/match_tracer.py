@@ -0,0 +1,148 @@
+"""
+Module for tracing the matches of dictionary words in the input strings.
+
+The tracer writes one JSON record per matched dictionary word of the sampled input strings to a
+dedicated trace file, separately from the application log:
+
+    {"line": 3, "word": "tihs", "offset": 18, "canonical": "this"}
+
+where `line` is the index of the input string (1-based) and `offset` is the position of the first
+window of the input string matching the word.
+"""
+
+# Imports
+import json
+from itertools import chain
+from typing import Collection, Optional, Tuple
+from dictionary.dictionary import Dictionary
+from matching.line_profile import LineProfile
+from matching.match_engine import MatchEngine
+from utils.file_utils import create_parent_directories
+
+# Size of the write buffer of the trace file
+TRACE_BUFFER_SIZE = 1 << 20
+
+
+class MatchTracer:
+    """
+    Class that writes structured match records of a sample of the input strings to a trace file.
+
+    The matched groups of scrambled-equivalent words of a sampled input string are found by the active match
+    engine, and only these groups are located in the input string: the offset of a group is the first window
+    with its endpoints and the signature of its middle characters, from the prefix signatures of the input
+    string. The words of a group are looked up in the word groups of the dictionary, which are gathered on
+    first use. Input strings that are not sampled cost nothing, which allows tracing a small fraction of
+    the input strings in production. The sampling is deterministic: with a rate of 0.01, every
+    100th input string is traced.
+    """
+
+    def __init__(self, dictionary: Dictionary, match_engine: MatchEngine, trace_file_path: str,
+                 sample_rate: float = 1.0):
+        """
+        Initializes the MatchTracer and opens the trace file.
+
+        Args:
+            dictionary (Dictionary): Instance of Dictionary to fetch dictionary data.
+            match_engine (MatchEngine): The match engine that finds the matched groups of the input strings.
+            trace_file_path (str): Path to the trace file. It is overwritten if it exists.
+            sample_rate (float): Fraction of the input strings that are traced, in (0, 1].
+
+        Raises:
+            ValueError: If the sample rate is not in (0, 1].
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError(f"The trace sample rate ({sample_rate}) must be in (0, 1].")
+
+        self.dictionary = dictionary
+        self.match_engine: MatchEngine = match_engine
+        self.sample_rate: float = sample_rate
+        self.records_written: int = 0
+        self._word_groups: Optional[dict[Tuple[int, str, str], list[Collection[str]]]] = None
+
+        create_parent_directories(trace_file_path)
+        self._file = open(trace_file_path, mode="w", encoding="utf-8",  # pylint: disable=consider-using-with
+                          buffering=TRACE_BUFFER_SIZE)
+
+    def __enter__(self) -> "MatchTracer":
+        """Returns the tracer."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the trace file."""
+        self.close()
+
+    def close(self) -> None:
+        """
+        Flushes and closes the trace file.
+        """
+        self._file.close()
+
+    def is_sampled(self, line_index: int) -> bool:
+        """
+        Checks whether an input string is traced.
+
+        Args:
+            line_index (int): The index of the input string (1-based).
+
+        Returns:
+            bool: True if the input string is traced, False otherwise.
+        """
+        return int(line_index * self.sample_rate) != int((line_index - 1) * self.sample_rate)
+
+    def trace(self, line_index: int, input_string: str) -> None:
+        """
+        Writes the match records of an input string, if it is sampled.
+
+        Args:
+            line_index (int): The index of the input string (1-based).
+            input_string (str): The input string.
+        """
+        if not self.is_sampled(line_index):
+            return
+
+        for dict_word, offset, canonical_word in self._find_matches(input_string):
+            self._file.write(json.dumps({"line": line_index, "word": dict_word, "offset": offset,
+                                         "canonical": canonical_word}))
+            self._file.write("\n")
+            self.records_written += 1
+
+    def _find_matches(self, input_string: str) -> list[Tuple[str, int, str]]:
+        """
+        Locates the first match of every matched dictionary word in the input string.
+
+        Args:
+            input_string (str): The input string.
+
+        Returns:
+            list[Tuple[str, int, str]]: The dictionary word, the offset of its first match and its canonical form,
+                                        in the alphabetical order of the words.
+        """
+        # The tracer is not part of the matching, so its calls are left out of the counters of the engine
+        counters = self.match_engine.reset_counters()
+        matches = self.match_engine.find_matches(input_string)
+        self.match_engine.counters = counters
+
+        if self._word_groups is None:
+            # Depending on the storage, the words of a group may be split into several collections
+            self._word_groups = {}
+            for length, first, last, words in self.dictionary.iter_word_groups():
+                self._word_groups.setdefault((length, first, last), []).append(words)
+
+        line_profile = LineProfile(input_string)
+        signature_encoder = self.dictionary.get_signature_encoder()
+        records = []
+        for key in matches:
+            word_length, first, last, signature = self.match_engine.get_group_signature(key)
+            window_starts = line_profile.get_window_starts(first, last, word_length)
+            if word_length > 2:
+                prefix_signatures = line_profile.get_prefix_signatures(signature_encoder)
+                offset = next(i for i in window_starts
+                              if prefix_signatures[i + word_length - 1] - prefix_signatures[i + 1] == signature)
+            else:
+                offset = window_starts[0]
+
+            for dict_word in chain.from_iterable(self._word_groups[(word_length, first, last)]):
+                if word_length <= 2 or self.dictionary.get_signature(dict_word) == signature:
+                    records.append((dict_word, offset, self.dictionary.get_canonical_word(dict_word)))
+
+        return sorted(records)
@@ -0,0 +1,191 @@
+"""
+Module for implementing a vectorized match engine using NumPy.
+
+NumPy is an optional dependency; it is required only when this engine is used.
+"""
+
+# Imports
+from collections import Counter
+from typing import Hashable
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_index import Signature
+from log.logger import Logger
+from matching.match_engine import Matches, MatchEngine
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NumpyMatchEngine(MatchEngine):
+    """
+    Implements a match engine that matches a whole class of equally long dictionary words using
+    array operations.
+
+    The characters of the dictionary words are mapped to a dense alphabet (code 0 is reserved for
+    characters that do not appear in the dictionary). Every input string is encoded as an integer array
+    and per-character prefix counts are computed, so the histogram of the middle characters of every window
+    of a given length is obtained with a single array subtraction. The first and last letters of the windows
+    are compared with those of each dictionary word as vector masks, and only the histograms of the windows
+    that pass this check are compared with the histogram of the word. Words sharing a canonical form
+    are compared once, as an equivalence class, and counted together. Words containing a letter that
+    does not appear in the input string are pruned with a single mask operation per length.
+    """
+
+    def __init__(self, dictionary: Dictionary, logger: Logger):
+        """
+        Initializes the NumpyMatchEngine.
+
+        Args:
+            dictionary (Dictionary): Instance of Dictionary to fetch dictionary data.
+            logger (Logger): Logger.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("The NumPy match engine requires the 'numpy' package to be installed.")
+
+        super().__init__()
+        self.logger: Logger = logger
+        self.signature_encoder = dictionary.get_signature_encoder()
+
+        # The words sharing a canonical form match the same windows, so every equivalence class is matched
+        # once, through its canonical form, and counts for all its words
+        class_sizes = Counter(dictionary.get_canonical_word(word) for word in dictionary.iter_words())
+        words = sorted(class_sizes)
+
+        # Dense alphabet: the sorted code points of the dictionary characters are mapped to 1..N
+        self.alphabet = np.array(sorted({ord(char) for word in words for char in word}), dtype=np.uint32)
+        alphabet_size = len(self.alphabet) + 1
+
+        # Per length: the canonical forms of the classes, their sizes, the codes of their first/last letters,
+        # the histograms of their middles and the masks of their distinct letters
+        self.word_groups: dict[int, tuple] = {}
+        for word_length in sorted({len(word) for word in words}):
+            group_words = [word for word in words if len(word) == word_length]
+            codes = [self._encode(word) for word in group_words]
+            middles = np.zeros((len(group_words), alphabet_size), dtype=np.int32)
+            letters = np.zeros((len(group_words), alphabet_size), dtype=bool)
+            for row, word_codes in enumerate(codes):
+                np.add.at(middles[row], word_codes[1:-1], 1)
+                letters[row, word_codes] = True
+
+            self.word_groups[word_length] = (
+                group_words,
+                np.array([class_sizes[word] for word in group_words], dtype=np.int64),
+                np.array([word_codes[0] for word_codes in codes], dtype=np.int64),
+                np.array([word_codes[-1] for word_codes in codes], dtype=np.int64),
+                middles,
+                letters,
+            )
+
+    def _encode(self, text: str):
+        """
+        Encodes a string as an array of dense alphabet codes.
+
+        Args:
+            text (str): The string to encode.
+
+        Returns:
+            numpy.ndarray: The codes of the characters (0 for characters outside the dictionary alphabet).
+        """
+        code_points = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        if self.alphabet.size == 0:
+            return np.zeros(len(code_points), dtype=np.int64)
+
+        positions = np.minimum(np.searchsorted(self.alphabet, code_points), len(self.alphabet) - 1)
+        return np.where(self.alphabet[positions] == code_points, positions + 1, 0)
+
+    def get_group_signature(self, key: Hashable) -> Signature:
+        """
+        Retrieves the length, the first and last letters and the signature of the middle characters shared by
+        the dictionary words of a matched group.
+
+        Args:
+            key (Hashable): The canonical form of the group.
+
+        Returns:
+            Signature: The length, the first and last letters and the middle signature of the group.
+        """
+        return len(key), key[0], key[-1], self.signature_encoder.encode(key[1:-1])
+
+    def find_matches(self, input_string: str) -> Matches:
+        """
+        Finds the groups of scrambled-equivalent dictionary words that appear as substrings in the input
+        string either in their original form or in their scrambled form.
+
+        Args:
+            input_string (str): The input string to search.
+
+        Returns:
+            Matches: The number of dictionary words of every matched group, by canonical form.
+        """
+
+        # If the input string is empty, there is no match
+        if not input_string:
+            return {}
+
+        input_len = len(input_string)
+        codes = self._encode(input_string)
+
+        # prefix[i][c] holds the number of occurrences of the character code c in input_string[:i]
+        prefix = np.zeros((input_len + 1, len(self.alphabet) + 1), dtype=np.int32)
+        prefix[np.arange(1, input_len + 1), codes] = 1
+        np.cumsum(prefix, axis=0, out=prefix)
+
+        # Mask of the letters that appear in the input string
+        present = np.zeros(len(self.alphabet) + 1, dtype=bool)
+        present[codes] = True
+
+        matches = {}
+        count = 0
+        windows_examined = 0
+        candidate_count = 0
+        pruned_words = 0
+        # Debug messages are only built if they are logged
+        debug_enabled = self.logger.is_enabled_for("DEBUG")
+        for word_length, (words, sizes, firsts, lasts, middles, letters) in self.word_groups.items():
+            # Skip if the dictionary words are longer than the input string
+            if word_length > input_len:
+                continue
+
+            # Prune the words containing a letter that does not appear in the input string
+            viable = np.flatnonzero(~(letters & ~present).any(axis=1))
+            pruned_words += int(sizes.sum() - sizes[viable].sum())
+            if viable.size == 0:
+                continue
+
+            window_count = input_len - word_length + 1
+            windows_examined += window_count * len(viable)
+            window_firsts = codes[:window_count]
+            window_lasts = codes[word_length - 1:]
+
+            # Histograms of the middle characters of all the windows of this length. Words of length two
+            # or less have no middle, so the first and last letters decide the match.
+            window_middles = None
+            if word_length > 2:
+                window_middles = (prefix[word_length - 1: word_length - 1 + window_count] -
+                                  prefix[1: 1 + window_count])
+
+            for row in viable:
+                word, first, last, middle = words[row], firsts[row], lasts[row], middles[row]
+                candidates = np.flatnonzero((window_firsts == first) & (window_lasts == last))
+                candidate_count += len(candidates)
+                if window_middles is not None and len(candidates):
+                    candidates = candidates[(window_middles[candidates] == middle).all(axis=1)]
+
+                if len(candidates):
+                    if debug_enabled:
+                        start = int(candidates[0])
+                        self.logger.debug(f"dict_word_canonical: {word} | dict_words: {sizes[row]} | "
+                                          f"substring: {input_string[start: start + word_length]}")
+                    matches[word] = int(sizes[row])
+                    count += int(sizes[row])
+
+        self._add_counters(windows_examined=windows_examined,
+                           endpoint_rejects=windows_examined - candidate_count,
+                           full_matches=count,
+                           pruned_words=pruned_words)
+        return matches
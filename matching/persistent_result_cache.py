@@ -0,0 +1,164 @@
+"""
+Module for caching the match counts of the input strings across runs, in a SQLite database.
+"""
+
+# Imports
+import sqlite3
+from typing import Optional
+from stats.cache_stats import CacheStats
+from utils.file_utils import create_parent_directories
+
+# Default maximum number of cached input strings
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# Number of pending writes after which they are flushed to the database
+FLUSH_INTERVAL = 4096
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS results (
+        fingerprint BLOB NOT NULL,
+        line_key BLOB NOT NULL,
+        count INTEGER NOT NULL,
+        last_used INTEGER NOT NULL,
+        PRIMARY KEY (fingerprint, line_key)
+    )
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+
+
+class PersistentResultCache:
+    """
+    Cache of the match counts of the input strings, stored in a SQLite database and shared across runs.
+
+    The entries are keyed by the fingerprint of the dictionary (see `Dictionary.get_fingerprint`) and the
+    key of the input string (see `compute_line_key`), so a previously seen input string costs a lookup
+    instead of a scan, and the entries of a different dictionary are never used. The cache is bounded by
+    a number of entries: when it grows beyond it, the least recently used entries are evicted, whatever
+    their dictionary, so the entries of dictionaries that are no longer used age out.
+
+    Writes (new counts and usage times) are buffered and flushed in batches, and when the cache is closed.
+    """
+
+    def __init__(self, cache_path: str, fingerprint: bytes, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initializes the PersistentResultCache and opens (or creates) the database.
+
+        Args:
+            cache_path (str): Path to the SQLite database.
+            fingerprint (bytes): Fingerprint of the dictionary the counts are computed with.
+            max_entries (int): Maximum number of cached input strings, for all the dictionaries.
+
+        Raises:
+            ValueError: If `max_entries` is not positive.
+            sqlite3.Error: If the database cannot be opened or is not a valid cache.
+        """
+        if max_entries < 1:
+            raise ValueError(f"The maximum number of cached input strings ({max_entries}) must be positive.")
+
+        self.fingerprint: bytes = fingerprint
+        self.max_entries: int = max_entries
+        self.stats: CacheStats = CacheStats()
+        self._pending_counts: dict[bytes, int] = {}
+        self._pending_uses: set[bytes] = set()
+
+        create_parent_directories(cache_path)
+        self._connection = sqlite3.connect(cache_path)
+        try:
+            with self._connection:
+                self._connection.execute(_CREATE_TABLE)
+                self._connection.execute(_CREATE_INDEX)
+            # Usage time of the entries of the next flush. It grows with every flush, across runs.
+            (last_used,) = self._connection.execute("SELECT COALESCE(MAX(last_used), 0) FROM results").fetchone()
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+        self._clock: int = last_used + 1
+
+    def __enter__(self) -> "PersistentResultCache":
+        """Returns the cache."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the cache."""
+        self.close()
+
+    def get(self, key: bytes) -> Optional[int]:
+        """
+        Retrieves the cached count of an input string.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+
+        Returns:
+            Optional[int]: The count of matched words, or None if the input string is not cached.
+        """
+        count = self._pending_counts.get(key)
+        if count is None:
+            row = self._connection.execute("SELECT count FROM results WHERE fingerprint = ? AND line_key = ?",
+                                           (self.fingerprint, key)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            count = row[0]
+            self._pending_uses.add(key)
+
+        self.stats.hits += 1
+        return count
+
+    def put(self, key: bytes, count: int) -> None:
+        """
+        Caches the count of an input string.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+            count (int): The count of matched words.
+        """
+        self._pending_counts[key] = count
+        if len(self._pending_counts) + len(self._pending_uses) >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the pending counts and usage times to the database, and evicts the least recently used
+        entries beyond the maximum number of entries.
+        """
+        if not self._pending_counts and not self._pending_uses:
+            return
+
+        clock = self._clock
+        self._clock += 1
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results (fingerprint, line_key, count, last_used) VALUES (?, ?, ?, ?)",
+                ((self.fingerprint, key, count, clock) for key, count in self._pending_counts.items()))
+            self._connection.executemany(
+                "UPDATE results SET last_used = ? WHERE fingerprint = ? AND line_key = ?",
+                ((clock, self.fingerprint, key) for key in self._pending_uses))
+
+            (entries,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+            if entries > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY last_used LIMIT ?)",
+                    (entries - self.max_entries,))
+                self.stats.evictions += entries - self.max_entries
+
+        self._pending_counts.clear()
+        self._pending_uses.clear()
+
+    def close(self) -> None:
+        """
+        Flushes the pending writes and closes the database.
+        """
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Retrieves the statistics of the cache.
+
+        Returns:
+            dict[str, int]: The number of input strings served from the cache, of misses and of evictions.
+        """
+        return self.stats.to_counters("result_cache")
@@ -0,0 +1,140 @@
+"""
+Module for implementing a match engine using a rolling character histogram.
+"""
+
+# Imports
+from typing import Tuple
+from dictionary.dictionary import Dictionary
+from log.logger import Logger
+from matching.line_profile import LineProfile
+from matching.match_engine import MATCH_COUNTERS, Matches, MatchEngine
+
+# Key of a group of scrambled-equivalent words of a given length: (first letter, last letter, middle signature)
+WordKey = Tuple[str, str, int]
+
+
+class RollingHistogramMatchEngine(MatchEngine):
+    """
+    Implements a match engine that moves a character-count histogram along the input string.
+
+    The histogram of the middle characters of a window is held as a bit-packed multiset signature
+    (see `MultisetSignatureEncoder`). Dictionary words are grouped by length and by (first letter,
+    last letter, middle signature) when the engine is created. For every length, a single window is
+    moved one position at a time over the input string, and its signature is updated by subtracting the
+    weight of the character that leaves the middle of the window and adding the weight of the character
+    that enters it. The words matched by a window are then found with a single lookup, which makes every
+    window step O(1) regardless of the number of dictionary words.
+
+    Words containing a letter that does not appear in the input string are pruned before scanning, and
+    the scan of a length stops as soon as every remaining word of that length has been matched.
+    """
+
+    # Every window is looked up with its endpoints and its signature at once, so no window is rejected
+    # on its endpoints or compared separately
+    counter_names = tuple(name for name in MATCH_COUNTERS if name not in ("endpoint_rejects", "canonical_computations"))
+
+    def __init__(self, dictionary: Dictionary, logger: Logger):
+        """
+        Initializes the RollingHistogramMatchEngine.
+
+        Args:
+            dictionary (Dictionary): Instance of Dictionary to fetch dictionary data.
+            logger (Logger): Logger.
+        """
+        super().__init__()
+        self.logger: Logger = logger
+        self.signature_encoder = dictionary.get_signature_encoder()
+        self.words_by_length: dict[int, dict[WordKey, list[str]]] = {}
+        self.letters_by_key: dict[WordKey, frozenset[str]] = {}
+
+        for dict_word in dictionary.iter_words():
+            key = (dict_word[0], dict_word[-1], dictionary.get_signature(dict_word))
+            self.words_by_length.setdefault(len(dict_word), {}).setdefault(key, []).append(dict_word)
+            self.letters_by_key[key] = frozenset(dict_word)
+
+    def find_matches(self, input_string: str) -> Matches:
+        """
+        Finds the groups of scrambled-equivalent dictionary words that appear as substrings in the input
+        string either in their original form or in their scrambled form.
+
+        Args:
+            input_string (str): The input string to search.
+
+        Returns:
+            Matches: The number of dictionary words of every matched group, by key of the group.
+        """
+
+        # If the input string is empty, there is no match
+        if not input_string:
+            return {}
+
+        matches = {}
+        input_len = len(input_string)
+        line_profile = LineProfile(input_string)
+
+        for word_length, words_by_key in self.words_by_length.items():
+            # Skip if the dictionary words are longer than the input string
+            if word_length > input_len:
+                continue
+
+            # Prune the words containing a letter that does not appear in the input string
+            pending_keys = set()
+            for key, words in words_by_key.items():
+                if line_profile.can_contain(self.letters_by_key[key], word_length):
+                    pending_keys.add(key)
+                else:
+                    self._add_counters(pruned_words=len(words))
+
+            if pending_keys:
+                self._find_length_group_matches(input_string, word_length, words_by_key, pending_keys, matches)
+
+        return matches
+
+    def _find_length_group_matches(self, input_string: str, word_length: int, words_by_key: dict[WordKey, list[str]],
+                                   pending_keys: set[WordKey], matches: Matches) -> None:
+        """
+        Finds the matches of dictionary words that share the same length.
+
+        Args:
+            input_string (str): The input string to search.
+            word_length (int): The length of the dictionary words.
+            words_by_key (dict[WordKey, list[str]]): The dictionary words of the given length, by key.
+            pending_keys (set[WordKey]): The keys of the words that may appear in the input string.
+                                         Matched keys are removed from the set.
+            matches (Matches): The matches of the input string, to which the matched groups are added,
+                               keyed by length and key.
+        """
+        get_weight = self.signature_encoder.get_weight
+        # Debug messages are only built if they are logged
+        debug_enabled = self.logger.is_enabled_for("DEBUG")
+
+        # Signature of the middle characters of the first window
+        signature = self.signature_encoder.encode(input_string[1: word_length - 1])
+
+        count = 0
+        window_count = len(input_string) - word_length + 1
+        for i in range(window_count):
+            # Slide the middle of the window by one position. Words of length two or less have no middle.
+            if i and word_length > 2:
+                signature += get_weight(input_string[i + word_length - 2]) - get_weight(input_string[i])
+
+            key = (input_string[i], input_string[i + word_length - 1], signature)
+            if key not in pending_keys:
+                continue
+
+            # Avoid double-counting for the same dictionary words
+            pending_keys.remove(key)
+            words = words_by_key[key]
+            matches[(word_length, *key)] = len(words)
+            count += len(words)
+            if debug_enabled:
+                self.logger.debug(f"dict_words: {sorted(words)} | substring: {input_string[i: i + word_length]}")
+
+            # Stop scanning once every word of this length has been matched
+            if not pending_keys:
+                self._add_counters(windows_examined=i + 1, early_breaks=i + 1 < window_count)
+                break
+        else:
+            self._add_counters(windows_examined=window_count)
+
+        self._add_counters(full_matches=count)
@@ -0,0 +1,169 @@
+"""
+Module for implementing a match engine using a signature-indexed dictionary.
+"""
+
+# Imports
+from typing import Tuple
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_index import DictionaryIndex, Signature
+from log.logger import Logger
+from matching.line_profile import LineProfile
+from matching.match_engine import Matches, MatchEngine
+
+
+class SignatureIndexMatchEngine(MatchEngine):
+    """
+    Implements a match engine that probes a `DictionaryIndex` with the signature of every window.
+
+    The input string is scanned once per distinct dictionary word length, instead of once per
+    dictionary word. Windows whose first and last letters do not belong to any dictionary word of
+    the scanned length are skipped before their signature is computed, and the signature of the middle
+    of the other windows is obtained from the prefix signatures of the input string, with a single
+    subtraction. All the words sharing the signature of a window are counted from a single probe.
+
+    Signatures containing a letter that does not appear in the input string are pruned before
+    scanning, and the scan of a length stops as soon as every remaining signature has been found.
+    """
+
+    def __init__(self, dictionary: Dictionary, logger: Logger):
+        """
+        Initializes the SignatureIndexMatchEngine.
+
+        Args:
+            dictionary (Dictionary): Instance of Dictionary to fetch dictionary data.
+            logger (Logger): Logger.
+        """
+        super().__init__()
+        self.logger: Logger = logger
+        self.dictionary_index: DictionaryIndex = DictionaryIndex(dictionary)
+
+    def find_matches(self, input_string: str) -> Matches:
+        """
+        Finds the groups of scrambled-equivalent dictionary words that appear as substrings in the input
+        string either in their original form or in their scrambled form.
+
+        Args:
+            input_string (str): The input string to search.
+
+        Returns:
+            Matches: The number of dictionary words of every matched group, by signature.
+        """
+
+        # If the input string is empty, there is no match
+        if not input_string:
+            return {}
+
+        matches = {}
+        line_profile = LineProfile(input_string)
+        windows_examined = 0
+        candidates = 0
+        early_breaks = 0
+        pruned_words = 0
+
+        for word_length in self.dictionary_index.get_lengths():
+            # Skip if the dictionary words are longer than the input string
+            if word_length > line_profile.length:
+                continue
+
+            viable_signatures, length_pruned_words = self._get_viable_signatures(line_profile, word_length)
+            pruned_words += length_pruned_words
+            if not viable_signatures:
+                continue
+
+            length_windows, length_candidates, early_break = self._scan_windows(line_profile, word_length,
+                                                                                viable_signatures, matches)
+            windows_examined += length_windows
+            candidates += length_candidates
+            early_breaks += early_break
+
+        self._add_counters(windows_examined=windows_examined,
+                           endpoint_rejects=windows_examined - candidates,
+                           canonical_computations=candidates,
+                           full_matches=sum(matches.values()),
+                           early_breaks=early_breaks,
+                           pruned_words=pruned_words)
+
+        return matches
+
+    def _get_viable_signatures(self, line_profile: LineProfile, word_length: int) -> Tuple[list[Signature], int]:
+        """
+        Prunes the signatures of a word length that contain a letter that does not appear in the input string.
+
+        Args:
+            line_profile (LineProfile): The profile of the input string.
+            word_length (int): The word length.
+
+        Returns:
+            Tuple[list[Signature], int]: The signatures that may appear in the input string, and the number of
+                                         dictionary words of the pruned signatures.
+        """
+        letters = line_profile.letters
+        # Signature fields of the letters that do not appear in the input string
+        absent_letters_mask = ~line_profile.get_letters_mask(self.dictionary_index.signature_encoder)
+        viable_signatures = []
+        pruned_words = 0
+        for signature in self.dictionary_index.get_signatures(word_length):
+            _, first, last, middle_signature = signature
+            if first in letters and last in letters and not middle_signature & absent_letters_mask:
+                viable_signatures.append(signature)
+            else:
+                pruned_words += len(self.dictionary_index.get_words(signature))
+        return viable_signatures, pruned_words
+
+    def _scan_windows(self, line_profile: LineProfile, word_length: int, viable_signatures: list[Signature],
+                      matches: Matches) -> Tuple[int, int, bool]:
+        """
+        Probes the index with the signature of every window of a word length, until every viable signature
+        has been found, and adds the matched signatures to the matches.
+
+        Args:
+            line_profile (LineProfile): The profile of the input string.
+            word_length (int): The word length.
+            viable_signatures (list[Signature]): The signatures of the word length that may appear.
+            matches (Matches): The matches of the input string, updated with the matched signatures.
+
+        Returns:
+            Tuple[int, int, bool]: The number of examined windows, the number of windows whose signature
+                                   was computed, and whether the scan stopped before the last window.
+        """
+        input_string = line_profile.input_string
+        if len(viable_signatures) < len(self.dictionary_index.get_signatures(word_length)):
+            endpoints = {(signature[1], signature[2]) for signature in viable_signatures}
+        else:
+            endpoints = self.dictionary_index.get_endpoints(word_length)
+        # Words of length two or less have no middle, so their middle signature is 0
+        prefix_signatures = (line_profile.get_prefix_signatures(self.dictionary_index.signature_encoder)
+                             if word_length > 2 else None)
+        offset = word_length - 1
+        remaining_signatures = len(viable_signatures)
+        candidates = 0
+        window_count = line_profile.length - offset
+        # Debug messages are only built if they are logged
+        debug_enabled = self.logger.is_enabled_for("DEBUG")
+
+        for i in range(window_count):
+            first = input_string[i]
+            last = input_string[i + offset]
+            if (first, last) not in endpoints:
+                continue
+
+            candidates += 1
+            middle_signature = prefix_signatures[i + offset] - prefix_signatures[i + 1] if prefix_signatures else 0
+            signature = (word_length, first, last, middle_signature)
+            if signature in matches:
+                continue
+
+            words = self.dictionary_index.get_words(signature)
+            if not words:
+                continue
+
+            if debug_enabled:
+                self.logger.debug(f"dict_words: {sorted(words)} | substring: {input_string[i: i + word_length]}")
+            matches[signature] = len(words)
+            remaining_signatures -= 1
+
+            # Stop scanning once every signature of this length has been found
+            if not remaining_signatures:
+                return i + 1, candidates, i + 1 < window_count
+
+        return window_count, candidates, False
@@ -0,0 +1,150 @@
+"""
+Module for implementing a match engine using a sliding window per dictionary word.
+"""
+
+# Imports
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_utils import compute_canonical_form
+from log.logger import Logger
+from log.null_logger import NullLogger
+from matching.line_profile import LineProfile
+from matching.match_engine import MATCH_COUNTERS, Matches, MatchEngine
+
+
+class SlidingWindowMatchEngine(MatchEngine):
+    """
+    Implements a match engine that scans the input string once per equivalence class of dictionary words.
+
+    The words sharing a canonical form (an equivalence class) are matched once and counted together.
+    The classes are visited in groups of the same length and the same first and last letters. For every
+    window whose first and last letters match those of the group, the bit-packed signature of the middle
+    characters of the window is compared with the signature of the class. These windows are located with
+    the position index of a `LineProfile`, so the other windows are never visited, and their signatures are
+    obtained from the prefix signatures of the input string, so no substring is built.
+    The engine reports the matched classes by length, first and last letters and signature.
+    Words containing a letter that does not appear in the input string are pruned without scanning,
+    from their signature alone.
+    """
+
+    # The windows whose first and last letters do not match are never visited, so none is rejected
+    counter_names = tuple(name for name in MATCH_COUNTERS if name != "endpoint_rejects")
+
+    def __init__(self, dictionary: Dictionary, logger: Logger):
+        """
+        Initializes the SlidingWindowMatchEngine.
+
+        Args:
+            dictionary (Dictionary): Instance of Dictionary to fetch dictionary data.
+            logger (Logger): Logger.
+        """
+        super().__init__()
+        self.dictionary = dictionary
+        self.logger: Logger = logger
+        # The classes are built before the first input string, and before the engine is sent to worker processes
+        self.dictionary.build_equivalence_classes()
+
+    def detach_logger(self) -> None:
+        """
+        Replaces the loggers of the engine and of its dictionary by a `NullLogger`.
+        """
+        super().detach_logger()
+        self.dictionary.logger = NullLogger()
+
+    def find_matches(self, input_string: str) -> Matches:
+        """
+        Finds the equivalence classes of dictionary words that appear as substrings in the input string
+        either in their original form or in their scrambled form. The scrambled form of the
+        dictionary word must adhere to the following rule: the first and last letter must be maintained
+        while the middle characters can be reorganised.
+
+        Args:
+            input_string (str): The input string to search.
+
+        Returns:
+            Matches: The number of dictionary words of every matched equivalence class, by length, first and last
+                     letters and signature.
+        """
+
+        # If the input string is empty, there is no match
+        if not input_string:
+            return {}
+
+        # Local variables
+        matches = {}
+        count = 0
+        input_len = len(input_string)
+        line_profile = LineProfile(input_string)
+        windows_examined = 0
+        signature_comparisons = 0
+        early_breaks = 0
+        pruned_words = 0
+        # Debug messages are only built if they are logged
+        debug_enabled = self.logger.is_enabled_for("DEBUG")
+        signature_encoder = self.dictionary.get_signature_encoder()
+
+        letters = line_profile.letters
+        # Signature fields of the letters that do not appear in the input string
+        absent_letters_mask = ~line_profile.get_letters_mask(signature_encoder)
+
+        for word_length, first, last, classes in self.dictionary.iter_equivalence_classes():
+            # Skip if the dictionary word length exceeds input string length
+            if word_length > input_len:
+                continue
+
+            # Skip the words with a letter that does not appear in the input string. The first and last
+            # letters are shared by the group, and the middle letters are checked on the signatures.
+            if first not in letters or last not in letters:
+                pruned_words += sum(classes.values())
+                continue
+
+            # Sliding window to match the dictionary words. Only the windows whose first and last letters match
+            # those of the dictionary words can satisfy the scrambling rule, so the other windows are skipped:
+            # the start positions of the matching windows are found once per group from the positions of the
+            # first and last letters in the input string.
+            window_starts = line_profile.get_window_starts(first, last, word_length)
+            if not window_starts:
+                continue
+
+            prefix_signatures = line_profile.get_prefix_signatures(signature_encoder) if word_length > 2 else None
+            offset = word_length - 1
+
+            # The words of an equivalence class match the same windows, so every class is matched once
+            for class_signature, class_size in classes.items():
+                # Words of length two or less have no middle, so the first and last letters decide the match.
+                # Otherwise, the bit-packed signature of the middle characters of every window is obtained
+                # from the prefix signatures of the input string and compared with the one of the class.
+                if prefix_signatures is None:
+                    matched_position = 0
+                else:
+                    if class_signature & absent_letters_mask:
+                        pruned_words += class_size
+                        continue
+                    matched_position = next((position for position, i in enumerate(window_starts)
+                                             if prefix_signatures[i + offset] - prefix_signatures[i + 1]
+                                             == class_signature),
+                                            None)
+                    signature_comparisons += (len(window_starts) if matched_position is None
+                                              else matched_position + 1)
+
+                if matched_position is None:
+                    windows_examined += len(window_starts)
+                    continue
+
+                if debug_enabled:
+                    i = window_starts[matched_position]
+                    substring = input_string[i: i + word_length]
+                    self.logger.debug(f"dict_words: {class_size} | substring: {substring} | "
+                                      f"substring_canonical: {compute_canonical_form(substring)}")
+                # Every word is counted once, so the windows after the first match are not examined
+                matches[(word_length, first, last, class_signature)] = class_size
+                count += class_size
+                windows_examined += matched_position + 1
+                early_breaks += matched_position + 1 < len(window_starts)
+
+        self._add_counters(windows_examined=windows_examined,
+                           canonical_computations=signature_comparisons,
+                           full_matches=count,
+                           early_breaks=early_breaks,
+                           pruned_words=pruned_words)
+
+        return matches
@@ -0,0 +1,63 @@
+"""
+Module for matching an input string that is read in chunks.
+"""
+
+# Imports
+from matching.match_engine import Matches, MatchEngine
+
+
+class StreamingLineMatcher:
+    """
+    Matches an input string chunk by chunk, without building it.
+
+    Every chunk is matched together with the last `overlap` characters of the previous ones (the carry-over
+    tail), so a window that spans two chunks is matched too when `overlap` is the length of the longest
+    dictionary word minus one. The matches of the chunks are merged by union, so a dictionary word found
+    in several chunks is counted once. Memory usage depends on the size of the chunks and of the dictionary,
+    but not on the length of the input string.
+    """
+
+    def __init__(self, match_engine: MatchEngine, overlap: int):
+        """
+        Initializes the StreamingLineMatcher.
+
+        Args:
+            match_engine (MatchEngine): The engine used to match the chunks.
+            overlap (int): Number of characters carried over from a chunk to the next one.
+
+        Raises:
+            ValueError: If `overlap` is negative.
+        """
+        if overlap < 0:
+            raise ValueError(f"The overlap ({overlap}) must not be negative.")
+
+        self.match_engine: MatchEngine = match_engine
+        self.overlap: int = overlap
+        self._tail: str = ""
+        self._matches: Matches = {}
+
+    def feed(self, chunk: str) -> None:
+        """
+        Matches the next chunk of the input string.
+
+        Args:
+            chunk (str): The next characters of the input string.
+        """
+        if not chunk:
+            return
+
+        text = self._tail + chunk
+        self._matches.update(self.match_engine.find_matches(text))
+        self._tail = text[max(len(text) - self.overlap, 0):]
+
+    def finish(self) -> int:
+        """
+        Ends the input string, and prepares the matcher for the next one.
+
+        Returns:
+            int: The count of matched scrambled words of the input string.
+        """
+        count = sum(self._matches.values())
+        self._tail = ""
+        self._matches = {}
+        return count
@@ -0,0 +1,104 @@
+"""
+Differential test cases shared by the match engines.
+"""
+
+# Imports
+import random
+from typing import Iterable, Type
+from unittest.mock import Mock
+from dictionary.cached_dictionary_storage import CachedDictionaryStorage
+from dictionary.compact_dictionary_storage import CompactDictionaryStorage
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.dictionary_data_storage import DictionaryDataStorage
+from dictionary.hash_dictionary_storage import HashDictionaryStorage
+from dictionary.set_dictionary_storage import SetDictionaryStorage
+from log.logger import Logger
+from matching.match_engine import MatchEngine
+
+# Dictionary storages the engines are tested with
+STORAGE_FACTORIES = {
+    "set": SetDictionaryStorage,
+    "hash": HashDictionaryStorage,
+    "compact": lambda: CompactDictionaryStorage(compaction_threshold=8),
+    "cached": lambda: CachedDictionaryStorage(SetDictionaryStorage(), max_cache_bytes=256),
+}
+
+
+def count_matches_brute_force(words: Iterable[str], input_string: str) -> int:
+    """
+    Counts the dictionary words that appear in the input string, by comparing the first letter, the last letter
+    and the sorted middle letters of every word with those of every window of the input string.
+
+    Args:
+        words (Iterable[str]): The dictionary words.
+        input_string (str): The input string to search.
+
+    Returns:
+        int: The number of dictionary words that appear in the input string.
+    """
+    def get_key(text: str):
+        return text[0], text[-1], sorted(text[1:-1])
+
+    count = 0
+    for word in words:
+        word_length = len(word)
+        word_key = get_key(word)
+        count += any(get_key(input_string[i: i + word_length]) == word_key
+                     for i in range(len(input_string) - word_length + 1))
+    return count
+
+
+def create_dictionary(storage: DictionaryDataStorage, logger: Logger) -> Dictionary:
+    """
+    Creates an empty dictionary that accepts words of any length up to 100 characters.
+
+    Args:
+        storage (DictionaryDataStorage): The storage of the dictionary.
+        logger (Logger): Logger.
+
+    Returns:
+        Dictionary: The dictionary.
+    """
+    return Dictionary(
+        storage=storage,
+        dictionary_config=DictionaryConfig(min_word_length=1,
+                                           max_word_length=100, max_sum_lengths_of_all_words=1000),
+        logger=logger
+    )
+
+
+class MatchEngineTestMixin:
+    """
+    Mixin of the test cases of a match engine. It sets up an empty dictionary with the storage
+    `storage_class`, and compares the counts of the engine with the ones of a brute-force reference,
+    with every dictionary storage. The test case sets `match_engine_class`, and `random_seed` to vary
+    the generated dictionaries and input strings.
+    """
+
+    match_engine_class: Type[MatchEngine]
+    storage_class: Type[DictionaryDataStorage] = SetDictionaryStorage
+    random_seed = 0
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Set up a dictionary and a mock logger."""
+        self.logger = Mock()
+        self.dictionary = create_dictionary(self.storage_class(), self.logger)
+
+    def test_same_results_as_brute_force(self):
+        """Test that the counts are the ones of the brute-force reference, with every dictionary storage."""
+        rand = random.Random(self.random_seed)
+        words = {"".join(rand.choices("abc", k=rand.randint(1, 6))) for _ in range(60)}
+        input_strings = ["".join(rand.choices("abcd", k=rand.randint(0, 40))) for _ in range(50)]
+        logger = Mock()
+        logger.is_enabled_for.return_value = False
+
+        for storage_name, create_storage in STORAGE_FACTORIES.items():
+            dictionary = create_dictionary(create_storage(), logger)
+            dictionary.add_words(words)
+            engine = self.match_engine_class(dictionary, logger)
+
+            for input_string in input_strings:
+                with self.subTest(storage=storage_name, input_string=input_string):
+                    self.assertEqual(engine.count_matches(input_string),
+                                     count_matches_brute_force(words, input_string))
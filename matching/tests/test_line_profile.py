@@ -0,0 +1,75 @@
+"""
+Test cases for LineProfile.
+"""
+
+# Imports
+import unittest
+from dictionary.multiset_signature import MultisetSignatureEncoder
+from matching.line_profile import LineProfile
+
+
+class TestLineProfile(unittest.TestCase):
+    """
+    Unit tests for the LineProfile class.
+    """
+
+    def test_can_contain(self):
+        """Test that words are pruned when a letter is missing or when they are too long."""
+        line_profile = LineProfile("scrambled")
+
+        self.assertTrue(line_profile.can_contain(frozenset("scram"), 5))
+        self.assertTrue(line_profile.can_contain(frozenset("dels"), 9))
+        self.assertFalse(line_profile.can_contain(frozenset("this"), 4))
+        self.assertFalse(line_profile.can_contain(frozenset("scrambled"), 10))
+
+    def test_empty_line(self):
+        """Test that an empty input string cannot contain any word."""
+        self.assertFalse(LineProfile("").can_contain(frozenset("a"), 1))
+
+    def test_get_positions(self):
+        """Test that the positions of a character are returned in ascending order."""
+        line_profile = LineProfile("abracadabra")
+
+        self.assertEqual(line_profile.get_positions("a"), [0, 3, 5, 7, 10])
+        self.assertEqual(line_profile.get_positions("z"), [])
+
+    def test_get_window_starts(self):
+        """Test that only the windows with the given first and last letters are returned."""
+        line_profile = LineProfile("abracadabra")
+
+        # Walks the positions of the rarer first letter
+        self.assertEqual(line_profile.get_window_starts("b", "a", 3), [1, 8])
+        # Walks the positions of the rarer last letter
+        self.assertEqual(line_profile.get_window_starts("a", "c", 2), [3])
+        self.assertEqual(line_profile.get_window_starts("a", "a", 3), [3, 5])
+        self.assertEqual(line_profile.get_window_starts("a", "a", 1), [0, 3, 5, 7, 10])
+        self.assertEqual(line_profile.get_window_starts("a", "a", 11), [0])
+        self.assertEqual(line_profile.get_window_starts("a", "a", 12), [])
+        self.assertEqual(line_profile.get_window_starts("a", "z", 2), [])
+
+    def test_get_window_starts_brute_force(self):
+        """Test that the window starts are the same as the ones found by examining every window."""
+        input_string = "scrambled_strings_are_scrambled"
+        line_profile = LineProfile(input_string)
+
+        for first in "sdcx":
+            for last in "sdex":
+                for word_length in range(1, len(input_string) + 2):
+                    expected = [i for i in range(len(input_string) - word_length + 1)
+                                if input_string[i] == first and input_string[i + word_length - 1] == last]
+                    self.assertEqual(line_profile.get_window_starts(first, last, word_length), expected)
+
+    def test_get_letters_mask(self):
+        """Test that the letters mask prunes the signatures of the words with a missing letter."""
+        encoder = MultisetSignatureEncoder()
+        encoder.register("scrambled_xyz")
+        line_profile = LineProfile("scrambled")
+        mask = line_profile.get_letters_mask(encoder)
+
+        self.assertEqual(encoder.encode("bedlam") & ~mask, 0)
+        self.assertNotEqual(encoder.encode("blaze") & ~mask, 0)
+        self.assertIs(line_profile.get_letters_mask(encoder), mask)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Test cases for LineResultMemo.
+"""
+
+# Imports
+import unittest
+from matching.line_result_memo import LineResultMemo, compute_line_key
+
+
+class TestLineResultMemo(unittest.TestCase):
+    """
+    Unit tests for the LineResultMemo class.
+    """
+
+    def test_invalid_max_entries(self):
+        """Test that a non-positive number of entries is rejected."""
+        with self.assertRaises(ValueError):
+            LineResultMemo(0)
+
+    def test_get_and_put(self):
+        """Test that memoized counts are returned and that hits and misses are counted."""
+        memo = LineResultMemo(4)
+        key = compute_line_key("scrambled\n")
+
+        self.assertIsNone(memo.get(key))
+        memo.put(key, 3)
+        self.assertEqual(memo.get(key), 3)
+        self.assertEqual(memo.get(compute_line_key("scrambled\n")), 3)
+        self.assertIsNone(memo.get(compute_line_key("scrambled")))
+        self.assertEqual(memo.get_cache_stats(), {"line_memo_hits": 2, "line_memo_misses": 2,
+                                                 "line_memo_evictions": 0, "line_memo_entries": 1})
+
+    def test_compute_line_key(self):
+        """Test that the keys of equal input strings are equal and that the keys have a fixed size."""
+        self.assertEqual(compute_line_key("café"), compute_line_key("caf" + "é"))
+        self.assertNotEqual(compute_line_key("café"), compute_line_key("cafe"))
+        self.assertEqual(len(compute_line_key("a" * 10000)), 16)
+        self.assertEqual(len(compute_line_key("\udc80")), 16)  # Lone surrogates are accepted
+
+    def test_least_recently_used_eviction(self):
+        """Test that the least recently used input string is evicted when the memo is full."""
+        memo = LineResultMemo(2)
+        keys = [compute_line_key(line) for line in ("a", "b", "c")]
+        memo.put(keys[0], 1)
+        memo.put(keys[1], 2)
+        memo.get(keys[0])
+        memo.put(keys[2], 3)
+
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.stats.evictions, 1)
+        self.assertEqual(memo.get(keys[0]), 1)
+        self.assertIsNone(memo.get(keys[1]))
+        self.assertEqual(memo.get(keys[2]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
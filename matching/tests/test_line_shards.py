@@ -0,0 +1,57 @@
+"""
+Test cases for the splitting of input strings into shards.
+"""
+
+# Imports
+import random
+import unittest
+from matching.line_shards import iter_line_shards
+
+
+class TestLineShards(unittest.TestCase):
+    """
+    Unit tests for the iter_line_shards function.
+    """
+
+    def test_shards(self):
+        """Test that the shards start every shard size characters and overlap the next ones."""
+        self.assertEqual(list(iter_line_shards("abcdefghij", 4, 2)), ["abcdef", "efghij"])
+        self.assertEqual(list(iter_line_shards("abcdefghijkl", 4, 2)), ["abcdef", "efghij", "ijkl"])
+        self.assertEqual(list(iter_line_shards("abcdefghij", 4, 0)), ["abcd", "efgh", "ij"])
+
+    def test_short_input_string(self):
+        """Test that an input string that fits in one shard is not split."""
+        self.assertEqual(list(iter_line_shards("abc", 4, 2)), ["abc"])
+        self.assertEqual(list(iter_line_shards("abc", 1, 5)), ["abc"])
+        self.assertEqual(list(iter_line_shards("", 4, 2)), [""])
+
+    def test_every_window_in_a_shard(self):
+        """Test that every window no longer than the overlap plus one lies entirely in a shard."""
+        generator = random.Random(7)
+        for _ in range(200):
+            input_string = "".join(generator.choice("abcd") for _ in range(generator.randint(1, 40)))
+            shard_size = generator.randint(1, 10)
+            overlap = generator.randint(0, 6)
+
+            # Start and end positions of the shards in the input string
+            spans = []
+            for index, shard in enumerate(iter_line_shards(input_string, shard_size, overlap)):
+                start = index * shard_size
+                self.assertEqual(shard, input_string[start: start + len(shard)])
+                spans.append((start, start + len(shard)))
+
+            for length in range(1, overlap + 2):
+                for i in range(len(input_string) - length + 1):
+                    self.assertTrue(any(start <= i and i + length <= end for start, end in spans),
+                                    (input_string, shard_size, overlap, i, length))
+
+    def test_invalid_arguments(self):
+        """Test that invalid shard sizes and overlaps are rejected."""
+        with self.assertRaises(ValueError):
+            list(iter_line_shards("abc", 0, 2))
+        with self.assertRaises(ValueError):
+            list(iter_line_shards("abc", 4, -1))
+
+
+if __name__ == "__main__":
+    unittest.main()
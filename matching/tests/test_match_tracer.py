@@ -0,0 +1,109 @@
+"""
+Test cases for MatchTracer.
+"""
+
+# Imports
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.hash_dictionary_storage import HashDictionaryStorage
+from matching.match_tracer import MatchTracer
+from matching.numpy_match_engine import NumpyMatchEngine, np
+from matching.rolling_histogram_match_engine import RollingHistogramMatchEngine
+from matching.signature_index_match_engine import SignatureIndexMatchEngine
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+
+
+class TestMatchTracer(unittest.TestCase):
+    """
+    Unit tests for the MatchTracer class.
+    """
+
+    def setUp(self):
+        """Set up a dictionary and a temporary trace file."""
+        self.dictionary = Dictionary(
+            storage=HashDictionaryStorage(),
+            dictionary_config=DictionaryConfig(min_word_length=1,
+                                               max_word_length=100, max_sum_lengths_of_all_words=1000),
+            logger=Mock()
+        )
+        for word in ["this", "tihs", "example", "xo", "x"]:
+            self.dictionary.add_word(word)
+        self.match_engine = SlidingWindowMatchEngine(self.dictionary, Mock())
+
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.trace_file_path = os.path.join(self.temp_dir.name, "trace.jsonl")
+
+    def tearDown(self):
+        """Remove the temporary trace file."""
+        self.temp_dir.cleanup()
+
+    def read_records(self) -> list:
+        """Reads the records of the trace file."""
+        with open(self.trace_file_path, mode="r", encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    def test_trace(self):
+        """Test that a record is written for the first match of every matched word."""
+        with MatchTracer(self.dictionary, self.match_engine, self.trace_file_path) as tracer:
+            tracer.trace(1, "xx_thsi_tihs_this")
+            tracer.trace(2, "nothing")
+
+        self.assertEqual(self.read_records(), [
+            {"line": 1, "word": "this", "offset": 8, "canonical": "this"},
+            {"line": 1, "word": "tihs", "offset": 8, "canonical": "this"},
+            {"line": 1, "word": "x", "offset": 0, "canonical": "x"},
+        ])
+        self.assertEqual(tracer.records_written, 3)
+
+    def test_trace_with_every_engine(self):
+        """Test that every match engine yields the same records, and that tracing leaves the counters unchanged."""
+        engine_classes = [SlidingWindowMatchEngine, RollingHistogramMatchEngine, SignatureIndexMatchEngine]
+        if np is not None:
+            engine_classes.append(NumpyMatchEngine)
+
+        expected_records = None
+        for engine_class in engine_classes:
+            with self.subTest(engine=engine_class.__name__):
+                match_engine = engine_class(self.dictionary, Mock())
+                with MatchTracer(self.dictionary, match_engine, self.trace_file_path) as tracer:
+                    tracer.trace(1, "an_exmalpe_xo_tihs")
+                    tracer.trace(2, "ox")
+                self.assertFalse(any(match_engine.reset_counters().values()))
+
+                records = self.read_records()
+                expected_records = expected_records or records
+                self.assertEqual(records, expected_records)
+
+        self.assertEqual(expected_records, [
+            {"line": 1, "word": "example", "offset": 3, "canonical": "ealmpxe"},
+            {"line": 1, "word": "this", "offset": 14, "canonical": "this"},
+            {"line": 1, "word": "tihs", "offset": 14, "canonical": "this"},
+            {"line": 1, "word": "x", "offset": 4, "canonical": "x"},
+            {"line": 1, "word": "xo", "offset": 11, "canonical": "xo"},
+            {"line": 2, "word": "x", "offset": 1, "canonical": "x"},
+        ])
+
+    def test_sampling(self):
+        """Test that the sampled input strings are evenly spread."""
+        with MatchTracer(self.dictionary, self.match_engine, self.trace_file_path, sample_rate=0.25) as tracer:
+            sampled = [index for index in range(1, 13) if tracer.is_sampled(index)]
+            for index in range(1, 13):
+                tracer.trace(index, "this")
+
+        self.assertEqual(sampled, [4, 8, 12])
+        self.assertEqual([record["line"] for record in self.read_records()], [4, 4, 8, 8, 12, 12])
+
+    def test_invalid_sample_rate(self):
+        """Test that a sample rate outside (0, 1] raises an error."""
+        for sample_rate in (0, -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                MatchTracer(self.dictionary, self.match_engine, self.trace_file_path, sample_rate=sample_rate)
+
+
+if __name__ == "__main__":
+    unittest.main()
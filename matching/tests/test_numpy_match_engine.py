@@ -0,0 +1,38 @@
+"""
+Test cases for NumpyMatchEngine.
+"""
+
+# Imports
+import unittest
+from matching.numpy_match_engine import NumpyMatchEngine, np
+from matching.tests.match_engine_test_mixin import MatchEngineTestMixin
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestNumpyMatchEngine(MatchEngineTestMixin, unittest.TestCase):
+    """
+    Unit tests for the NumpyMatchEngine class.
+    """
+
+    match_engine_class = NumpyMatchEngine
+    random_seed = 5
+
+    def test_exact_and_scrambled_matches(self):
+        """Test that exact and scrambled matches are counted once per dictionary word."""
+        for word in ["scramble", "eaxmple", "tihs", "this", "ab", "é"]:
+            self.dictionary.add_word(word)
+        engine = NumpyMatchEngine(self.dictionary, self.logger)
+
+        self.assertEqual(engine.count_matches("scrambled_example_this_tihs_this"), 4)
+        self.assertEqual(engine.count_matches("café"), 1)
+        self.assertEqual(engine.count_matches("a"), 0)
+        self.assertEqual(engine.count_matches(""), 0)
+
+    def test_empty_dictionary(self):
+        """Test that an empty dictionary results in 0 counts."""
+        engine = NumpyMatchEngine(self.dictionary, self.logger)
+        self.assertEqual(engine.count_matches("scrambled"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
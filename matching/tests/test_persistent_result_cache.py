@@ -0,0 +1,79 @@
+"""
+Test cases for PersistentResultCache.
+"""
+
+# Imports
+import os
+import sqlite3
+import tempfile
+import unittest
+from matching.line_result_memo import compute_line_key
+from matching.persistent_result_cache import PersistentResultCache
+
+
+class TestPersistentResultCache(unittest.TestCase):
+    """
+    Unit tests for the PersistentResultCache class.
+    """
+
+    def setUp(self):
+        """Create a temporary directory for the cache database."""
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache_path = os.path.join(self.temp_dir.name, "cache", "results.db")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_invalid_max_entries(self):
+        """Test that a non-positive number of entries is rejected."""
+        with self.assertRaises(ValueError):
+            PersistentResultCache(self.cache_path, b"dictionary", max_entries=0)
+
+    def test_counts_persist_across_runs(self):
+        """Test that the cached counts are found by a later run with the same dictionary fingerprint only."""
+        key = compute_line_key("scrambled\n")
+        with PersistentResultCache(self.cache_path, b"dictionary") as cache:
+            self.assertIsNone(cache.get(key))
+            cache.put(key, 3)
+            self.assertEqual(cache.get(key), 3)
+
+        with PersistentResultCache(self.cache_path, b"dictionary") as cache:
+            self.assertEqual(cache.get(key), 3)
+            self.assertIsNone(cache.get(compute_line_key("other\n")))
+            self.assertEqual(cache.get_cache_stats(), {"result_cache_hits": 1, "result_cache_misses": 1,
+                                                       "result_cache_evictions": 0})
+
+        with PersistentResultCache(self.cache_path, b"other dictionary") as cache:
+            self.assertIsNone(cache.get(key))
+
+    def test_least_recently_used_eviction(self):
+        """Test that the least recently used entries are evicted when the cache is full."""
+        keys = [compute_line_key(line) for line in ("a", "b", "c")]
+        with PersistentResultCache(self.cache_path, b"dictionary", max_entries=2) as cache:
+            cache.put(keys[0], 1)
+            cache.put(keys[1], 2)
+
+        with PersistentResultCache(self.cache_path, b"dictionary", max_entries=2) as cache:
+            self.assertEqual(cache.get(keys[0]), 1)
+            cache.put(keys[2], 3)
+            cache.flush()
+            self.assertEqual(cache.stats.evictions, 1)
+
+        with PersistentResultCache(self.cache_path, b"dictionary", max_entries=2) as cache:
+            self.assertEqual(cache.get(keys[0]), 1)
+            self.assertIsNone(cache.get(keys[1]))
+            self.assertEqual(cache.get(keys[2]), 3)
+
+    def test_invalid_database(self):
+        """Test that a file that is not a SQLite database is rejected."""
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, mode="wb") as file:
+            file.write(b"not a database" * 100)
+
+        with self.assertRaises(sqlite3.Error):
+            PersistentResultCache(self.cache_path, b"dictionary")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Test cases for RollingHistogramMatchEngine.
+"""
+
+# Imports
+import unittest
+from matching.rolling_histogram_match_engine import RollingHistogramMatchEngine
+from matching.tests.match_engine_test_mixin import MatchEngineTestMixin
+
+
+class TestRollingHistogramMatchEngine(MatchEngineTestMixin, unittest.TestCase):
+    """
+    Unit tests for the RollingHistogramMatchEngine class.
+    """
+
+    match_engine_class = RollingHistogramMatchEngine
+    random_seed = 7
+
+    def test_exact_and_scrambled_matches(self):
+        """Test that exact and scrambled matches are counted once per dictionary word."""
+        for word in ["scramble", "eaxmple", "tihs", "this", "ab", "zz"]:
+            self.dictionary.add_word(word)
+        engine = RollingHistogramMatchEngine(self.dictionary, self.logger)
+
+        self.assertEqual(engine.count_matches("scrambled_example_this_tihs_this"), 4)
+        self.assertEqual(engine.count_matches("ab"), 1)
+        self.assertEqual(engine.count_matches("a"), 0)
+        self.assertEqual(engine.count_matches(""), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
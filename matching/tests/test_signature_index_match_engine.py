@@ -0,0 +1,65 @@
+"""
+Test cases for SignatureIndexMatchEngine.
+"""
+
+# Imports
+import unittest
+from dictionary.hash_dictionary_storage import HashDictionaryStorage
+from matching.signature_index_match_engine import SignatureIndexMatchEngine
+from matching.tests.match_engine_test_mixin import MatchEngineTestMixin
+
+
+class TestSignatureIndexMatchEngine(MatchEngineTestMixin, unittest.TestCase):
+    """
+    Unit tests for the SignatureIndexMatchEngine class.
+    """
+
+    match_engine_class = SignatureIndexMatchEngine
+    storage_class = HashDictionaryStorage
+    random_seed = 11
+
+    def test_words_sharing_a_canonical_form(self):
+        """Test that every word sharing the canonical form of a substring is counted."""
+        for word in ["this", "tihs", "scramble", "ab"]:
+            self.dictionary.add_word(word)
+        engine = SignatureIndexMatchEngine(self.dictionary, self.logger)
+
+        self.assertEqual(engine.count_matches("scrambled_this"), 3)
+        self.assertEqual(engine.count_matches("thsi"), 0)
+        self.assertEqual(engine.count_matches(""), 0)
+
+    def test_counters(self):
+        """Test that the hot-path counters are accumulated and reset."""
+        for word in ["this", "tihs", "ab"]:
+            self.dictionary.add_word(word)
+        engine = SignatureIndexMatchEngine(self.dictionary, self.logger)
+
+        self.assertEqual(engine.count_matches("abthsi"), 1)
+        self.assertEqual(engine.count_matches("ab"), 1)
+        counters = engine.reset_counters()
+
+        # Length 4: 3 rejected windows. Length 2: both lines stop at their first window, which matches.
+        self.assertEqual(counters["windows_examined"], 3 + 1 + 1)
+        self.assertEqual(counters["endpoint_rejects"], 3)
+        self.assertEqual(counters["canonical_computations"], 2)
+        self.assertEqual(counters["full_matches"], 2)
+        self.assertEqual(counters["early_breaks"], 1)
+        self.assertEqual(counters["pruned_words"], 0)
+        self.assertEqual(sum(engine.counters.values()), 0)
+
+    def test_pruning(self):
+        """Test that signatures with a missing letter are pruned and the scan stops once the others are found."""
+        for word in ["abc", "axc", "ayc"]:
+            self.dictionary.add_word(word)
+        engine = SignatureIndexMatchEngine(self.dictionary, self.logger)
+
+        self.assertEqual(engine.count_matches("abc_axc_abc_abc"), 2)
+        counters = engine.reset_counters()
+
+        self.assertEqual(counters["pruned_words"], 1)
+        self.assertEqual(counters["windows_examined"], 5)
+        self.assertEqual(counters["early_breaks"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Test cases for SlidingWindowMatchEngine.
+"""
+
+# Imports
+import unittest
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+from matching.tests.match_engine_test_mixin import MatchEngineTestMixin
+
+
+class TestSlidingWindowMatchEngine(MatchEngineTestMixin, unittest.TestCase):
+    """
+    Unit tests for the SlidingWindowMatchEngine class.
+    """
+
+    match_engine_class = SlidingWindowMatchEngine
+    random_seed = 3
+
+    def test_matches_by_signature(self):
+        """Test that the matched equivalence classes are reported by signature, with their number of words."""
+        self.dictionary.add_words(["scramble", "eaxmple", "tihs", "this", "ab"])
+        engine = SlidingWindowMatchEngine(self.dictionary, self.logger)
+
+        get_signature = self.dictionary.get_signature
+        self.assertEqual(engine.find_matches("scrambled_example_this"),
+                         {(8, "s", "e", get_signature("scramble")): 1,
+                          (7, "e", "e", get_signature("example")): 1,
+                          (4, "t", "s", get_signature("this")): 2})
+        self.assertEqual(engine.count_matches("scrambled_example_this"), 4)
+        self.assertEqual(engine.find_matches("a"), {})
+        self.assertEqual(engine.find_matches(""), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Test cases for StreamingLineMatcher.
+"""
+
+# Imports
+import random
+import unittest
+from unittest.mock import Mock
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.set_dictionary_storage import SetDictionaryStorage
+from matching.rolling_histogram_match_engine import RollingHistogramMatchEngine
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+from matching.streaming_line_matcher import StreamingLineMatcher
+
+
+class TestStreamingLineMatcher(unittest.TestCase):
+    """
+    Unit tests for the StreamingLineMatcher class.
+    """
+
+    def setUp(self):
+        """Set up the dictionary and the logger."""
+        self.logger = Mock()
+        self.logger.is_enabled_for.return_value = False
+        self.dictionary = Dictionary(SetDictionaryStorage(),
+                                     DictionaryConfig(min_word_length=2, max_word_length=10,
+                                                      max_sum_lengths_of_all_words=100),
+                                     self.logger)
+        self.dictionary.add_words(["eaxmple", "tihs", "ab", "ba", "abab"])
+
+    def test_windows_spanning_chunks(self):
+        """Test that the words spanning two chunks are matched, and that every word is counted once."""
+        matcher = StreamingLineMatcher(SlidingWindowMatchEngine(self.dictionary, self.logger), 6)
+        for chunk in ("xxexa", "mp", "", "le_th", "is_this_ab"):
+            matcher.feed(chunk)
+        self.assertEqual(matcher.finish(), 3)
+
+        # The matcher is ready for the next input string
+        matcher.feed("xthisx")
+        self.assertEqual(matcher.finish(), 1)
+        self.assertEqual(matcher.finish(), 0)
+
+    def test_same_results_as_whole_input_strings(self):
+        """Test that the counts are the ones of the whole input strings, whatever the chunk size."""
+        generator = random.Random(5)
+        overlap = self.dictionary.get_max_word_length() - 1
+        for match_engine in (SlidingWindowMatchEngine(self.dictionary, self.logger),
+                             RollingHistogramMatchEngine(self.dictionary, self.logger)):
+            matcher = StreamingLineMatcher(match_engine, overlap)
+            for _ in range(100):
+                input_string = "".join(generator.choice("abehilmpstx") for _ in range(generator.randint(1, 60)))
+                chunk_size = generator.randint(1, 12)
+                for start in range(0, len(input_string), chunk_size):
+                    matcher.feed(input_string[start: start + chunk_size])
+                self.assertEqual(matcher.finish(), match_engine.count_matches(input_string),
+                                 (input_string, chunk_size))
+
+    def test_invalid_overlap(self):
+        """Test that a negative overlap is rejected."""
+        with self.assertRaises(ValueError):
+            StreamingLineMatcher(SlidingWindowMatchEngine(self.dictionary, self.logger), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Python module that writes the results as fixed-width binary records.
+
+Every result is a record of two little-endian unsigned 64-bit integers: the index of the input
+string (1-based) and the count of matched dictionary words. The file has no header, so the number
+of results is the file size divided by `RECORD_SIZE`.
+"""
+
+# Imports
+import sys
+from array import array
+from itertools import chain
+from typing import List, Tuple
+from results.results_writer import ResultsWriter
+
+# Size in bytes of a (index, count) record
+RECORD_SIZE = 16
+
+
+class BinaryResultsWriter(ResultsWriter):
+    """
+    Writes one packed `(index, count)` record per input string.
+    """
+
+    def _format_batch(self, batch: List[Tuple[int, int]]) -> bytes:
+        """
+        Packs a batch of results into binary records.
+
+        Args:
+            batch (List[Tuple[int, int]]): The results.
+
+        Returns:
+            bytes: The packed records.
+        """
+        records = array("Q", chain.from_iterable(batch))
+        if sys.byteorder == "big":
+            records.byteswap()
+        return records.tobytes()
+
+
+def read_binary_results(results_path: str) -> List[Tuple[int, int]]:
+    """
+    Reads the records written by a `BinaryResultsWriter`.
+
+    Args:
+        results_path (str): Path to the binary results file.
+
+    Returns:
+        List[Tuple[int, int]]: The index of the input string and the count of matched dictionary words
+                               of every record.
+
+    Raises:
+        ValueError: If the file size is not a multiple of the record size.
+    """
+    records = array("Q")
+    with open(results_path, mode="rb") as file:
+        data = file.read()
+    if len(data) % RECORD_SIZE:
+        raise ValueError(f"Results file '{results_path}' is truncated.")
+
+    records.frombytes(data)
+    if sys.byteorder == "big":
+        records.byteswap()
+    return list(zip(records[::2], records[1::2]))
@@ -0,0 +1,34 @@
+"""
+Python module that writes the results in CSV format.
+"""
+
+# Imports
+from typing import List, Tuple
+from results.results_writer import ResultsWriter
+
+
+class CsvResultsWriter(ResultsWriter):
+    """
+    Writes a `case,count` header followed by one `<index>,<count>` row per input string.
+    """
+
+    def _format_header(self) -> bytes:
+        """
+        Formats the header row.
+
+        Returns:
+            bytes: The header row.
+        """
+        return b"case,count\n"
+
+    def _format_batch(self, batch: List[Tuple[int, int]]) -> bytes:
+        """
+        Formats a batch of results as CSV rows.
+
+        Args:
+            batch (List[Tuple[int, int]]): The results.
+
+        Returns:
+            bytes: The formatted results.
+        """
+        return "".join([f"{case_index},{count}\n" for case_index, count in batch]).encode("ascii")
@@ -0,0 +1,28 @@
+"""
+Python module that writes the results in JSON Lines format.
+"""
+
+# Imports
+from typing import List, Tuple
+from results.results_writer import ResultsWriter
+
+
+class JsonlResultsWriter(ResultsWriter):
+    """
+    Writes one `{"case": <index>, "count": <count>}` JSON object per line and input string.
+    """
+
+    def _format_batch(self, batch: List[Tuple[int, int]]) -> bytes:
+        """
+        Formats a batch of results as JSON lines.
+
+        The records only contain integers, so they are formatted directly instead of with `json.dumps`.
+
+        Args:
+            batch (List[Tuple[int, int]]): The results.
+
+        Returns:
+            bytes: The formatted results.
+        """
+        return "".join([f'{{"case": {case_index}, "count": {count}}}\n'
+                        for case_index, count in batch]).encode("ascii")
@@ -0,0 +1,125 @@
+"""
+Abstract module for results writers.
+
+Defines the `ResultsWriter` interface used to write the results of the scrambled string finder,
+i.e. the count of matched dictionary words of every input string, separately from the log.
+"""
+
+# Imports
+import sys
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+from utils.file_utils import create_parent_directories
+
+# Path that selects the standard output instead of a file
+STDOUT_PATH = "-"
+
+# Size of the write buffer of the output file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Default number of results that are formatted and written at once
+DEFAULT_BATCH_SIZE = 4096
+
+
+class ResultsWriter(ABC):
+    """
+    Abstract class to define the interface for results writers.
+
+    Results are collected in batches; every batch is formatted at once and written to the output with
+    a single buffered write. Writers must be closed (or used as context managers) so that the last
+    batch is written.
+    """
+
+    def __init__(self, output_path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initializes the ResultsWriter and opens the output.
+
+        Args:
+            output_path (str): Path to the output file, or "-" for the standard output.
+            batch_size (int): Number of results that are formatted and written at once.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError(f"The batch size ({batch_size}) must be positive.")
+
+        self.batch_size: int = batch_size
+        self._batch: List[Tuple[int, int]] = []
+
+        if output_path == STDOUT_PATH:
+            self._file = sys.stdout.buffer
+            self._owns_file = False
+        else:
+            create_parent_directories(output_path)
+            # pylint: disable-next=consider-using-with
+            self._file = open(output_path, mode="wb", buffering=OUTPUT_BUFFER_SIZE)
+            self._owns_file = True
+
+        header = self._format_header()
+        if header:
+            self._file.write(header)
+
+    def __enter__(self) -> "ResultsWriter":
+        """Returns the writer."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Writes the pending results and closes the output."""
+        self.close()
+
+    def write(self, case_index: int, count: int) -> None:
+        """
+        Writes the result of an input string.
+
+        Args:
+            case_index (int): The index of the input string (1-based).
+            count (int): The count of matched dictionary words.
+        """
+        self._batch.append((case_index, count))
+        if len(self._batch) >= self.batch_size:
+            self._write_batch()
+
+    def close(self) -> None:
+        """
+        Writes the pending results, flushes the output and closes it (unless it is the standard output).
+        """
+        if self._file is None:
+            return
+
+        self._write_batch()
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+        self._file = None
+
+    def _write_batch(self) -> None:
+        """
+        Formats and writes the collected results.
+        """
+        if self._batch:
+            self._file.write(self._format_batch(self._batch))
+            self._batch = []
+
+    def _format_header(self) -> bytes:
+        """
+        Formats the header of the output.
+
+        Returns:
+            bytes: The header. The default implementation returns no header.
+        """
+        return b""
+
+    @abstractmethod
+    def _format_batch(self, batch: List[Tuple[int, int]]) -> bytes:
+        """
+        Formats a batch of results.
+
+        Args:
+            batch (List[Tuple[int, int]]): The index of the input string and the count of matched
+                                           dictionary words of every result.
+
+        Returns:
+            bytes: The formatted results.
+        """
+        pass
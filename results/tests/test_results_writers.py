@@ -0,0 +1,95 @@
+"""
+Test cases for the results writers.
+"""
+
+# Imports
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from results.binary_results_writer import RECORD_SIZE, BinaryResultsWriter, read_binary_results
+from results.csv_results_writer import CsvResultsWriter
+from results.jsonl_results_writer import JsonlResultsWriter
+from results.results_writer import STDOUT_PATH
+from results.text_results_writer import TextResultsWriter
+
+RESULTS = [(1, 4), (2, 0), (3, 12), (4, 2 ** 40)]
+
+
+class TestResultsWriters(unittest.TestCase):
+    """
+    Unit tests for the results writers.
+    """
+
+    def setUp(self):
+        """Create a temporary directory for the results files."""
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.output_path = os.path.join(self.temp_dir.name, "results", "results.out")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def write_results(self, writer_type, batch_size=2) -> bytes:
+        """Writes the results with a writer and returns the contents of the results file."""
+        with writer_type(self.output_path, batch_size=batch_size) as writer:
+            for case_index, count in RESULTS:
+                writer.write(case_index, count)
+
+        with open(self.output_path, mode="rb") as file:
+            return file.read()
+
+    def test_text(self):
+        """Test the text format."""
+        self.assertEqual(self.write_results(TextResultsWriter).decode(),
+                         "Case #1: 4\nCase #2: 0\nCase #3: 12\nCase #4: 1099511627776\n")
+
+    def test_csv(self):
+        """Test the CSV format."""
+        self.assertEqual(self.write_results(CsvResultsWriter).decode(),
+                         "case,count\n1,4\n2,0\n3,12\n4,1099511627776\n")
+
+    def test_jsonl(self):
+        """Test the JSON Lines format."""
+        lines = self.write_results(JsonlResultsWriter).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines],
+                         [{"case": case_index, "count": count} for case_index, count in RESULTS])
+
+    def test_binary(self):
+        """Test that binary records are written and read back."""
+        contents = self.write_results(BinaryResultsWriter, batch_size=3)
+        self.assertEqual(len(contents), len(RESULTS) * RECORD_SIZE)
+        self.assertEqual(read_binary_results(self.output_path), RESULTS)
+
+    def test_binary_truncated(self):
+        """Test that reading a truncated binary results file raises an error."""
+        contents = self.write_results(BinaryResultsWriter)
+        with open(self.output_path, mode="wb") as file:
+            file.write(contents[:-1])
+
+        with self.assertRaises(ValueError):
+            read_binary_results(self.output_path)
+
+    def test_batching(self):
+        """Test that results are written once a batch is full, and the last batch when the writer is closed."""
+        with patch("sys.stdout") as mock_stdout:
+            writer = TextResultsWriter(STDOUT_PATH, batch_size=2)
+            for case_index, count in RESULTS[:3]:
+                writer.write(case_index, count)
+            mock_stdout.buffer.write.assert_called_once_with(b"Case #1: 4\nCase #2: 0\n")
+
+            writer.close()
+            writer.close()
+            mock_stdout.buffer.write.assert_called_with(b"Case #3: 12\n")
+            self.assertEqual(mock_stdout.buffer.write.call_count, 2)
+            mock_stdout.buffer.close.assert_not_called()
+
+    def test_invalid_batch_size(self):
+        """Test that a non-positive batch size raises an error."""
+        with self.assertRaises(ValueError):
+            TextResultsWriter(self.output_path, batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+"""
+Python module that writes the results in the human-readable format of the application.
+"""
+
+# Imports
+from typing import List, Tuple
+from results.results_writer import ResultsWriter
+
+
+class TextResultsWriter(ResultsWriter):
+    """
+    Writes one `Case #<index>: <count>` line per input string.
+    """
+
+    def _format_batch(self, batch: List[Tuple[int, int]]) -> bytes:
+        """
+        Formats a batch of results as text lines.
+
+        Args:
+            batch (List[Tuple[int, int]]): The results.
+
+        Returns:
+            bytes: The formatted results.
+        """
+        return "".join([f"Case #{case_index}: {count}\n" for case_index, count in batch]).encode("ascii")
@@ -18,5 +18,20 @@ python3 -m unittest discover "${verbose}" -s ./dictionary/tests/ -p "*.py"
 echo "================= Testing input_strings..."
 python3 -m unittest discover "${verbose}" -s ./input_strings/tests/ -p "*.py"
 
+echo "================= Testing matching..."
+python3 -m unittest discover "${verbose}" -s ./matching/tests/ -p "*.py"
+
+echo "================= Testing results..."
+python3 -m unittest discover "${verbose}" -s ./results/tests/ -p "*.py"
+
+echo "================= Testing stats..."
+python3 -m unittest discover "${verbose}" -s ./stats/tests/ -p "*.py"
+
+echo "================= Testing benchmarks..."
+python3 -m unittest discover "${verbose}" -s ./benchmarks/tests/ -p "*.py"
+
+echo "================= Testing service..."
+python3 -m unittest discover "${verbose}" -s ./service/tests/ -p "*.py"
+
 echo "================= Testing app..."
 python3 -m unittest discover "${verbose}" -s ./tests -p "*.py"
@@ -6,11 +6,180 @@ dictionary words (including their scrambled versions) that appear as substrings
 in input strings.
 """
 
-from typing import List, Tuple
+import threading
+from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from input_strings.input_provider import InputProvider
 from dictionary.dictionary import Dictionary
-from dictionary.dictionary_utils import compute_canonical_form
 from log.logger import Logger
+from matching.line_result_memo import LineResultMemo, compute_line_key
+from matching.line_shards import iter_line_shards
+from matching.match_engine import Matches, MatchEngine
+from matching.match_tracer import MatchTracer
+from matching.persistent_result_cache import PersistentResultCache
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+from matching.streaming_line_matcher import StreamingLineMatcher
+from stats.stats_recorder import StatsRecorder
+
+# Maximum number of chunks that are queued per worker process. It bounds the memory used by
+# in-flight chunks while keeping every worker busy.
+MAX_PENDING_CHUNKS_PER_WORKER = 2
+
+# Counts of a chunk that is processed by a worker process: the memoized or cached count of every input string
+# of the chunk (None if it is counted by the chunk task, the futures of its shards if it is sharded, or its key if
+# it repeats an input string that is in flight), the keys of the input strings that are not known, and the future
+# of the counts of the chunk task and of the match engine counters
+PendingCounts = Tuple[List[Union[None, int, bytes, List[Future]]], List[Optional[bytes]], Future]
+
+# Match engine of a worker process (or of the worker thread of a `MatchServer`), in the attribute `match_engine`.
+# It is set once, when the worker starts. It is local to the worker thread, so that the worker threads of the pools
+# of a `MatchServer` that swaps its match engine keep their own.
+_worker_state = threading.local()
+
+
+def initialize_worker(match_engine: MatchEngine) -> None:
+    """
+    Initializes a worker process with the match engine, so that it is sent once per worker
+    instead of once per task.
+
+    Args:
+        match_engine (MatchEngine): The match engine used by the worker process.
+    """
+    _worker_state.match_engine = match_engine
+
+
+def initialize_worker_process(match_engine: MatchEngine) -> None:
+    """
+    Initializes a worker process with the match engine, with its logger detached. A forked worker process inherits
+    the engine of the parent process without pickling it, so it would write its records to the log file of the
+    parent process, or to the queue of its asynchronous logger, which is only drained in the parent process.
+
+    Args:
+        match_engine (MatchEngine): The match engine used by the worker process.
+    """
+    match_engine.detach_logger()
+    initialize_worker(match_engine)
+
+
+def count_chunk_matches(chunk: List[str]) -> Tuple[List[int], Dict[str, int]]:
+    """
+    Counts the matches of a chunk of input strings inside a worker process.
+
+    Args:
+        chunk (List[str]): The input strings of the chunk.
+
+    Returns:
+        Tuple[List[int], Dict[str, int]]: The count of matched scrambled words of every input string of
+                                          the chunk, and the match engine counters of the chunk.
+    """
+    match_engine = _worker_state.match_engine
+    counts = [match_engine.count_matches(input_string) for input_string in chunk]
+    return counts, match_engine.reset_counters()
+
+
+def _find_shard_matches(shard: str) -> Tuple[Matches, Dict[str, int]]:
+    """
+    Finds the matches of a shard of a long input string inside a worker process.
+
+    Args:
+        shard (str): The shard of the input string.
+
+    Returns:
+        Tuple[Matches, Dict[str, int]]: The matches of the shard, and the match engine counters of the shard.
+    """
+    match_engine = _worker_state.match_engine
+    matches = match_engine.find_matches(shard)
+    return matches, match_engine.reset_counters()
+
+
+@dataclass
+class _InFlightLine:
+    """
+    Input string sent to the workers, whose repeats in the chunks in flight wait for its count instead of being
+    sent again.
+
+    Attributes:
+        count -- count of matched words, once the chunk of the input string is processed
+        references -- number of occurrences of the input string whose chunk is not processed yet
+    """
+    count: Optional[int] = None
+    references: int = 1
+
+
+@dataclass(frozen=True)
+class ParallelismOptions:
+    """
+    Options of the processing of the input strings by worker processes.
+
+    Attributes:
+        workers -- number of worker processes. A value of 1 processes the input strings in the current process.
+        chunk_size -- number of input strings sent to a worker process per task
+        shard_size -- with more than one worker, input strings longer than `shard_size` characters are split into
+                      shards of `shard_size` characters, which overlap the next ones by the length of the longest
+                      dictionary word minus one and are matched in parallel. A value of 0 disables sharding.
+
+    Raises:
+        ValueError: If `workers` or `chunk_size` is not positive, or if `shard_size` is negative.
+    """
+    workers: int = 1
+    chunk_size: int = 64
+    shard_size: int = 0
+
+    def __post_init__(self):
+        """Validates the options."""
+        if self.workers < 1:
+            raise ValueError(f"The number of workers ({self.workers}) must be positive.")
+        if self.chunk_size < 1:
+            raise ValueError(f"The chunk size ({self.chunk_size}) must be positive.")
+        if self.shard_size < 0:
+            raise ValueError(f"The shard size ({self.shard_size}) must not be negative.")
+
+
+@dataclass(frozen=True)
+class FinderOptions:
+    """
+    Options of a `ScrambledStringFinder`.
+
+    Attributes:
+        match_engine -- engine used to match the dictionary words against the input strings. Defaults to a
+                        `SlidingWindowMatchEngine`.
+        parallelism -- options of the processing of the input strings by worker processes. Defaults to the
+                       current process only.
+        stats -- recorder of the processed lines and characters and of the match engine counters. Defaults to
+                 a disabled recorder.
+        tracer -- tracer that writes the match records of a sample of the input strings. Defaults to no tracing.
+        memo -- memo of the counts of the input strings, which answers repeated input strings without scanning
+                them again. Defaults to no memo.
+        result_cache -- cache of the counts of the input strings that persists across runs. It must be bound to
+                        the fingerprint of the dictionary. Defaults to no cache.
+        stream_chunk_size -- if positive, the input strings are read from the input provider in chunks of at most
+                             `stream_chunk_size` characters and matched chunk by chunk in the current process
+                             (see `StreamingLineMatcher`), so that they are never built. It cannot be combined
+                             with workers, a memo, a result cache or a tracer, which need whole input strings.
+                             A value of 0 disables streaming.
+
+    Raises:
+        ValueError: If `stream_chunk_size` is negative, or if streaming is combined with workers, a memo, a result
+                    cache or a tracer.
+    """
+    match_engine: Optional[MatchEngine] = None
+    parallelism: ParallelismOptions = ParallelismOptions()
+    stats: Optional[StatsRecorder] = None
+    tracer: Optional[MatchTracer] = None
+    memo: Optional[LineResultMemo] = None
+    result_cache: Optional[PersistentResultCache] = None
+    stream_chunk_size: int = 0
+
+    def __post_init__(self):
+        """Validates the options."""
+        if self.stream_chunk_size < 0:
+            raise ValueError(f"The stream chunk size ({self.stream_chunk_size}) must not be negative.")
+        if self.stream_chunk_size and (self.parallelism.workers > 1 or self.memo is not None
+                                       or self.result_cache is not None or self.tracer is not None):
+            raise ValueError("Streamed input strings cannot be matched by workers, memoized, cached or traced.")
 
 
 class ScrambledStringFinder:
@@ -18,10 +187,16 @@ class ScrambledStringFinder:
     Class to find scrambled substrings in input strings.
 
     This class uses an `InputProvider` to fetch input strings and a `Dictionary` to fetch dictionary data.
-    It identifies dictionary words and their scrambled versions in the input strings.
+    It identifies dictionary words and their scrambled versions in the input strings, delegating the
+    matching of every input string to a `MatchEngine`. Input strings are independent of each other, so
+    they can optionally be processed in parallel by a pool of worker processes, which can also split very
+    long input strings into overlapping shards, and the counts of repeated input strings can optionally be
+    memoized within a run and cached across runs. Input strings that do not fit in memory can be read and
+    matched in chunks instead.
     """
 
-    def __init__(self, input_provider: InputProvider, dictionary: Dictionary, logger: Logger):
+    def __init__(self, input_provider: InputProvider, dictionary: Dictionary, logger: Logger,
+                 options: Optional[FinderOptions] = None):
         """
         Initializes the ScrambledStringFinder.
 
@@ -29,10 +204,15 @@ class ScrambledStringFinder:
             input_provider (InputProvider): Instance of InputProvider to fetch input strings.
             dictionary (Dictionary): Instance of Dictionary to fetch dictionary data.
             logger (Logger): Logger.
+            options (Optional[FinderOptions]): The match engine, the parallelism, the caches and the recorders
+                                               used to process the input strings. Defaults to `FinderOptions()`.
         """
         self.input_provider = input_provider
         self.dictionary = dictionary
         self.logger: Logger = logger
+        self.options: FinderOptions = options or FinderOptions()
+        self.match_engine: MatchEngine = self.options.match_engine or SlidingWindowMatchEngine(dictionary, logger)
+        self.stats: StatsRecorder = self.options.stats or StatsRecorder(enabled=False)
 
     def find_scrambled_strings(self) -> List[Tuple[int, int]]:
         """
@@ -43,65 +223,310 @@ class ScrambledStringFinder:
                     - The index of the input string (1-based).
                     - The count of matched dictionary words (including scrambled versions).
         """
-        inputs = self.input_provider.get()
+        return list(self.iter_scrambled_strings())
 
-        results = []
-        for index, input_string in enumerate(inputs, start=1):
-            count = self._count_matches(input_string)
-            results.append((index, count))
+    def iter_scrambled_strings(self) -> Iterator[Tuple[int, int]]:
+        """
+        Finds scrambled substrings in the input strings and yields the results in the order of the
+        input strings, as soon as they are available.
 
-        return results
+        The input strings are consumed lazily from the input provider, so that streaming providers
+        keep memory usage constant and the first result is produced right away.
 
-    def _count_matches(self, input_string: str) -> int:
+        Yields:
+            Tuple[int, int]: A tuple containing:
+                - The index of the input string (1-based).
+                - The count of matched dictionary words (including scrambled versions).
         """
-        Counts how many of the words from the dictionary appear as substrings in the input string
-        either in their original form or in their scrambled form. The scrambled form of the
-        dictionary word must adhere to the following rule: the first and last letter must be maintained
-        while the middle characters can be reorganised.
+        if self.options.stream_chunk_size:
+            yield from self._iter_streamed()
+            return
+
+        inputs = self.input_provider.iter_inputs()
+        if self.stats.enabled:
+            inputs = self._iter_recorded(inputs)
+
+        if self.options.parallelism.workers == 1:
+            self.match_engine.reset_counters()
+            for index, input_string in enumerate(inputs, start=1):
+                count = self._count_matches(input_string)
+                if self.options.tracer is not None:
+                    self.options.tracer.trace(index, input_string)
+                yield index, count
+            self.stats.merge_counters(self.match_engine.reset_counters())
+        else:
+            yield from self._iter_parallel(inputs)
+
+    def _iter_recorded(self, inputs: Iterable[str]) -> Iterator[str]:
+        """
+        Records the number of lines and characters of the input strings while they are consumed.
 
         Args:
-            input_string (str): The input string to search.
+            inputs (Iterable[str]): The input strings.
 
-        Returns:
-            int: The count of matched scrambled words.
+        Yields:
+            str: The input strings.
         """
+        for input_string in inputs:
+            self.stats.increment("lines_processed")
+            self.stats.increment("characters_processed", len(input_string))
+            yield input_string
 
-        # If the input string is empty, return 0
-        if not input_string:
-            return 0
+    def _iter_streamed(self) -> Iterator[Tuple[int, int]]:
+        """
+        Reads the input strings in chunks and matches them chunk by chunk, carrying over the last characters
+        of every chunk to the next one.
 
-        # Local variables
-        count = 0
-        input_len = len(input_string)
+        Yields:
+            Tuple[int, int]: The index of the input string (1-based) and the count of matched words.
+        """
+        # Every window of a dictionary word length lies entirely in a chunk or spans the carried-over characters
+        line_matcher = StreamingLineMatcher(self.match_engine, max(self.dictionary.get_max_word_length() - 1, 0))
+        self.match_engine.reset_counters()
 
-        for dict_word in self.dictionary.get_all_words():
-            word_length = len(dict_word)
+        index = 1
+        for chunk, line_ended in self.input_provider.iter_input_chunks(self.options.stream_chunk_size):
+            self.stats.increment("characters_processed", len(chunk))
+            line_matcher.feed(chunk)
+            if line_ended:
+                self.stats.increment("lines_processed")
+                yield index, line_matcher.finish()
+                index += 1
 
-            # Skip if the dictionary word length exceeds input string length
-            if word_length > input_len:
-                continue
+        self.stats.merge_counters(self.match_engine.reset_counters())
 
-            # Sliding window to match canonical forms. The algorithm iterates through the input string and extracts
-            # substrings of the same length as the dictionary word. This ensures that every potential match
-            # is examined efficiently.
-            for i in range(input_len - word_length + 1):
-                substring = input_string[i: i + word_length]
+    def _iter_parallel(self, inputs: Iterable[str]) -> Iterator[Tuple[int, int]]:
+        """
+        Processes chunks of input strings in a pool of worker processes.
 
-                # The first and last letters of the substring must match those of the dictionary word to satisfy
-                # the scrambling rule. Substrings that fail this check are guaranteed not to match and are
-                # skipped entirely in order to improve performance.
-                if not (dict_word[0] == substring[0] and dict_word[-1] == substring[-1]):
-                    continue
+        The match engine is sent to every worker once, when the pool starts. A bounded number of chunks
+        is kept in flight, and their results are yielded in the order of the input strings. The input
+        strings answered by the memo or the result cache are not sent to the workers, nor are the repeats
+        of the input strings in flight, which reuse their counts. The shards of the input strings longer
+        than the shard size are sent to the workers as separate tasks.
+
+        Args:
+            inputs (Iterable[str]): The input strings.
+
+        Yields:
+            Tuple[int, int]: The index of the input string (1-based) and the count of matched words.
+        """
+        input_iterator = iter(inputs)
+        parallelism = self.options.parallelism
+        max_pending_chunks = parallelism.workers * MAX_PENDING_CHUNKS_PER_WORKER
+        # Every window of a dictionary word length lies entirely in at least one shard
+        shard_overlap = max(self.dictionary.get_max_word_length() - 1, 0) if parallelism.shard_size else 0
+
+        with ProcessPoolExecutor(max_workers=parallelism.workers, initializer=initialize_worker_process,
+                                 initargs=(self.match_engine,)) as executor:
+            pending = deque()
+            # Input strings sent to the workers whose chunks are in flight, by key
+            in_flight: Dict[bytes, _InFlightLine] = {}
+            index = 1
 
-                if ((substring == dict_word) or
-                        compute_canonical_form(substring) == self.dictionary.get_canonical_word(dict_word)):
-                    self.logger.debug(f"dict_word: {dict_word} | substring: {substring} | "
-                                      f"substring_canonical: {compute_canonical_form(substring)} | "
-                                      f"dict_word_canonical: {self.dictionary.get_canonical_word(dict_word)} "
-                                      )
-                    count += 1
+            while True:
+                chunk = list(islice(input_iterator, parallelism.chunk_size))
+                if chunk:
+                    pending.append(self._submit_chunk(executor, chunk, shard_overlap, in_flight))
 
-                    # Avoid double-counting for the same dictionary word
+                # Yield the results of the oldest chunk when the queue is full or the input is exhausted
+                if pending and (not chunk or len(pending) >= max_pending_chunks):
+                    oldest_chunk, pending_counts = pending.popleft()
+                    chunk_counts = self._get_chunk_counts(pending_counts, in_flight)
+                    for input_string, count in zip(oldest_chunk, chunk_counts):
+                        if self.options.tracer is not None:
+                            self.options.tracer.trace(index, input_string)
+                        yield index, count
+                        index += 1
+                elif not chunk:
                     break
 
+    def _submit_chunk(self, executor: ProcessPoolExecutor, chunk: List[str], shard_overlap: int,
+                      in_flight: Dict[bytes, _InFlightLine]) -> Tuple[List[str], PendingCounts]:
+        """
+        Sends the input strings of a chunk that are neither memoized, cached nor in flight to a worker process,
+        and the shards of the long ones to the workers.
+
+        Args:
+            executor (ProcessPoolExecutor): The pool of worker processes.
+            chunk (List[str]): The input strings of the chunk.
+            shard_overlap (int): Number of characters shared by two consecutive shards of a long input string.
+            in_flight (Dict[bytes, _InFlightLine]): The input strings in flight, by key. The input strings sent
+                                                    to the workers are added to it, when they are memoized or
+                                                    cached.
+
+        Returns:
+            Tuple[List[str], PendingCounts]: The chunk and its pending counts.
+        """
+        shard_size = self.options.parallelism.shard_size
+        cached = self.options.memo is not None or self.options.result_cache is not None
+        if not cached and not shard_size:
+            return chunk, ([None] * len(chunk), [], executor.submit(count_chunk_matches, chunk))
+
+        known_counts = []
+        missing_keys = []
+        missing = []
+        for input_string in chunk:
+            key = None
+            count = None
+            if cached:
+                key = compute_line_key(input_string)
+                in_flight_line = in_flight.get(key)
+                if in_flight_line is not None:
+                    # The repeat waits for the count of the input string in flight
+                    in_flight_line.references += 1
+                    known_counts.append(key)
+                    continue
+                count = self._get_known_count(key)
+                if count is None:
+                    in_flight[key] = _InFlightLine()
+            if count is None:
+                if shard_size and len(input_string) > shard_size:
+                    count = [executor.submit(_find_shard_matches, shard)
+                             for shard in iter_line_shards(input_string, shard_size, shard_overlap)]
+                else:
+                    missing.append(input_string)
+                missing_keys.append(key)
+            known_counts.append(count)
+
+        return chunk, (known_counts, missing_keys, executor.submit(count_chunk_matches, missing))
+
+    def _get_chunk_counts(self, pending_counts: PendingCounts, in_flight: Dict[bytes, _InFlightLine]) -> List[int]:
+        """
+        Combines the memoized or cached counts of a chunk with the counts computed by the worker processes,
+        and memoizes and caches the computed counts. The chunks are processed in order, so the count of an
+        input string in flight is known when its repeats are processed.
+
+        Args:
+            pending_counts (PendingCounts): The pending counts of the chunk.
+            in_flight (Dict[bytes, _InFlightLine]): The input strings in flight, by key.
+
+        Returns:
+            List[int]: The count of matched scrambled words of every input string of the chunk.
+        """
+        known_counts, missing_keys, future = pending_counts
+        counts, counters = future.result()
+        self.stats.merge_counters(counters)
+
+        computed_counts = iter(counts)
+        missing_keys = iter(missing_keys)
+        chunk_counts = []
+        for count in known_counts:
+            if isinstance(count, bytes):
+                count = self._get_repeated_count(count, in_flight)
+            elif not isinstance(count, int):
+                count = next(computed_counts) if count is None else self._merge_shard_matches(count)
+                if self.options.memo is not None or self.options.result_cache is not None:
+                    key = next(missing_keys)
+                    self._store_count(key, count)
+                    self._release_in_flight_line(key, in_flight).count = count
+            chunk_counts.append(count)
+        return chunk_counts
+
+    def _get_repeated_count(self, key: bytes, in_flight: Dict[bytes, _InFlightLine]) -> int:
+        """
+        Retrieves the count of the repeat of an input string that was in flight when the repeat was read. It is
+        served from the memo or the result cache, like the repeats of the input strings that are not in flight,
+        or else from the count of the input string in flight if it is already evicted.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+            in_flight (Dict[bytes, _InFlightLine]): The input strings in flight, by key.
+
+        Returns:
+            int: The count of matched words.
+        """
+        in_flight_line = self._release_in_flight_line(key, in_flight)
+        count = self._get_known_count(key)
+        return in_flight_line.count if count is None else count
+
+    @staticmethod
+    def _release_in_flight_line(key: bytes, in_flight: Dict[bytes, _InFlightLine]) -> _InFlightLine:
+        """
+        Releases an occurrence of an input string in flight, which is removed once all its occurrences are
+        processed.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+            in_flight (Dict[bytes, _InFlightLine]): The input strings in flight, by key.
+
+        Returns:
+            _InFlightLine: The input string in flight.
+        """
+        in_flight_line = in_flight[key]
+        in_flight_line.references -= 1
+        if not in_flight_line.references:
+            del in_flight[key]
+        return in_flight_line
+
+    def _merge_shard_matches(self, shard_futures: List[Future]) -> int:
+        """
+        Merges the matches of the shards of an input string. A dictionary word that appears in several
+        shards (e.g. in their overlap) is counted once.
+
+        Args:
+            shard_futures (List[Future]): The futures of the matches and match engine counters of the shards.
+
+        Returns:
+            int: The count of matched scrambled words of the input string.
+        """
+        matches = {}
+        for future in shard_futures:
+            shard_matches, counters = future.result()
+            self.stats.merge_counters(counters)
+            matches.update(shard_matches)
+        return sum(matches.values())
+
+    def _get_known_count(self, key: bytes) -> Optional[int]:
+        """
+        Retrieves the count of an input string from the memo, or else from the result cache.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+
+        Returns:
+            Optional[int]: The count of matched words, or None if the input string is neither memoized
+                           nor cached.
+        """
+        memo = self.options.memo
+        count = memo.get(key) if memo is not None else None
+        if count is None and self.options.result_cache is not None:
+            count = self.options.result_cache.get(key)
+            # Repeated input strings of this run are then served from the memo
+            if count is not None and memo is not None:
+                memo.put(key, count)
+        return count
+
+    def _store_count(self, key: bytes, count: int) -> None:
+        """
+        Memoizes and caches the count of an input string.
+
+        Args:
+            key (bytes): The key of the input string (see `compute_line_key`).
+            count (int): The count of matched words.
+        """
+        if self.options.memo is not None:
+            self.options.memo.put(key, count)
+        if self.options.result_cache is not None:
+            self.options.result_cache.put(key, count)
+
+    def _count_matches(self, input_string: str) -> int:
+        """
+        Counts how many of the words from the dictionary appear as substrings in the input string
+        either in their original form or in their scrambled form.
+
+        Args:
+            input_string (str): The input string to search.
+
+        Returns:
+            int: The count of matched scrambled words.
+        """
+        if self.options.memo is None and self.options.result_cache is None:
+            return self.match_engine.count_matches(input_string)
+
+        key = compute_line_key(input_string)
+        count = self._get_known_count(key)
+        if count is None:
+            count = self.match_engine.count_matches(input_string)
+            self._store_count(key, count)
         return count
@@ -6,17 +6,75 @@ Main application.
 import argparse
 import os.path
 import sys
+from itertools import islice
+from typing import Tuple
 from config.config_reader import ConfigReader
+from input_strings.input_provider import InputProvider
 from input_strings.input_strings_config import InputStringsConfig
 from input_strings.input_file_provider import InputFileProvider
+from input_strings.mmap_input_file_provider import MmapInputFileProvider
+from input_strings.streaming_input_file_provider import StreamingInputFileProvider
 from log.log_config import LogConfig
 from log.standard_logger import StandardLogger
 from log.logger import Logger
+from dictionary.cached_dictionary_storage import CachedDictionaryStorage
+from dictionary.compact_dictionary_storage import CompactDictionaryStorage
 from dictionary.dictionary_config import DictionaryConfig
+from dictionary.dictionary_data_storage import DictionaryDataStorage
 from dictionary.hash_dictionary_storage import HashDictionaryStorage
 from dictionary.set_dictionary_storage import SetDictionaryStorage
 from dictionary.dictionary import Dictionary
-from scrambled_string_finder import ScrambledStringFinder
+from dictionary.dictionary_snapshot import load_or_compile_dictionary, write_dictionary_snapshot
+from matching.line_result_memo import LineResultMemo
+from matching.match_engine import MatchEngine
+from matching.match_tracer import MatchTracer
+from matching.numpy_match_engine import NumpyMatchEngine
+from matching.persistent_result_cache import DEFAULT_MAX_ENTRIES, PersistentResultCache
+from matching.rolling_histogram_match_engine import RollingHistogramMatchEngine
+from matching.signature_index_match_engine import SignatureIndexMatchEngine
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+from results.binary_results_writer import BinaryResultsWriter
+from results.csv_results_writer import CsvResultsWriter
+from results.jsonl_results_writer import JsonlResultsWriter
+from results.results_writer import STDOUT_PATH
+from results.text_results_writer import TextResultsWriter
+from scrambled_string_finder import FinderOptions, ParallelismOptions, ScrambledStringFinder
+from service.dictionary_reloader import DictionaryReloader
+from service.match_client import MatchClient
+from service.match_protocol import DEFAULT_HOST
+from service.match_server import MatchServer, MatchServerOptions
+from service.service_errors import MatchServiceError
+from stats.stats_recorder import StatsRecorder
+
+# Dictionary storages that can be selected from the command line
+DICTIONARY_STORAGES = {
+    "set": SetDictionaryStorage,
+    "hash": HashDictionaryStorage,
+    "compact": CompactDictionaryStorage,
+}
+
+# Match engines that can be selected from the command line
+MATCH_ENGINES = {
+    "window": SlidingWindowMatchEngine,
+    "histogram": RollingHistogramMatchEngine,
+    "index": SignatureIndexMatchEngine,
+    "numpy": NumpyMatchEngine,
+}
+
+# Input providers that can be selected from the command line
+INPUT_PROVIDERS = {
+    "file": InputFileProvider,
+    "stream": StreamingInputFileProvider,
+    "mmap": MmapInputFileProvider,
+}
+
+# Formats of the results file that can be selected from the command line
+RESULTS_WRITERS = {
+    "text": TextResultsWriter,
+    "csv": CsvResultsWriter,
+    "jsonl": JsonlResultsWriter,
+    "binary": BinaryResultsWriter,
+}
 
 
 def check_arguments(args, logger: Logger) -> None:
@@ -37,12 +95,26 @@ def check_arguments(args, logger: Logger) -> None:
         logger.error(f"Dictionary file {dict_file_path} does not exist.")
         sys.exit(1)
 
-    if not os.path.exists(input_file_path):
+    if input_file_path is not None and not os.path.exists(input_file_path):
         logger.error(f"Input file {input_file_path} does not exist.")
         sys.exit(1)
 
     logger.info(f"Dictionary file path: {dict_file_path}")
-    logger.info(f"Input file path: {input_file_path}")
+    if input_file_path is not None:
+        logger.info(f"Input file path: {input_file_path}")
+
+def add_server_address_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the arguments that select the socket of the match server.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser of a command.
+    """
+    address_group = parser.add_mutually_exclusive_group(required=True)
+    address_group.add_argument("--socket", metavar="PATH", help="Path to the Unix domain socket of the server.")
+    address_group.add_argument("--port", type=int, help="TCP port of the server.")
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help=f"Host of the TCP server, used with --port (default: {DEFAULT_HOST}).")
 
 def parse_arguments():
     """
@@ -52,85 +124,529 @@ def parse_arguments():
         argparse.Namespace: An object containing the parsed command-line arguments.
     """
     parser = argparse.ArgumentParser(description="Scrambled String Finder")
-    parser.add_argument("--dictionary", required=True, help="Path to the dictionary file.")
-    parser.add_argument("--input", required=True, help="Path to the input file.")
+
+    # Commands. Without a command, the scrambled strings of the input file are found.
+    subparsers = parser.add_subparsers(dest="command", title="commands")
+    compile_parser = subparsers.add_parser("compile-dictionary",
+                                           help="Compiles the dictionary into a binary index snapshot.")
+    compile_parser.add_argument("--dictionary", required=True, help="Path to the dictionary file.")
+    compile_parser.add_argument("--dictionary-index", required=True, help="Path to the dictionary index to write.")
+    compile_parser.add_argument("--config", default="config.ini",
+                                help="Path to the configuration file (default: config.ini).")
+
+    serve_parser = subparsers.add_parser("serve", help="Loads the dictionary once and serves the matching of "
+                                                       "batches of input strings on a socket.")
+    serve_parser.add_argument("--dictionary", required=True, help="Path to the dictionary file.")
+    serve_parser.add_argument("--config", default="config.ini",
+                              help="Path to the configuration file (default: config.ini).")
+    serve_parser.add_argument("--storage", choices=list(DICTIONARY_STORAGES), default="set",
+                              help="Type of storage to use for the dictionary.")
+    serve_parser.add_argument("--dictionary-index",
+                              help="Path to a compiled dictionary index. It is rebuilt if it is missing or stale.")
+    serve_parser.add_argument("--engine", choices=list(MATCH_ENGINES), default="window",
+                              help="Matching engine to use for finding the scrambled strings.")
+    serve_parser.add_argument("--workers", type=int, default=1,
+                              help="Number of worker processes used for processing the input strings (default: 1).")
+    serve_parser.add_argument("--chunk-size", type=int, default=64,
+                              help="Number of input strings sent to a worker per task (default: 64).")
+    serve_parser.add_argument("--reload-interval", metavar="SECONDS", type=float, default=0,
+                              help="Poll the dictionary file every SECONDS and reload it when it changes, "
+                                   "without pausing the server (default: 0, disabled).")
+    add_server_address_arguments(serve_parser)
+
+    client_parser = subparsers.add_parser("client", help="Sends the input strings of a file to a running server "
+                                                         "and writes their results.")
+    client_parser.add_argument("--input", required=True, help="Path to the input file.")
+    client_parser.add_argument("--batch-size", type=int, default=1024,
+                               help="Number of input strings sent per request (default: 1024).")
+    client_parser.add_argument("--output", metavar="FILE", default="-",
+                               help="Path to the results file, or - for the standard output (default: -).")
+    client_parser.add_argument("--output-format", choices=list(RESULTS_WRITERS), default="text",
+                               help="Format of the results file (default: text).")
+    add_server_address_arguments(client_parser)
+
+    parser.add_argument("--dictionary", help="Path to the dictionary file.")
+    parser.add_argument("--input", help="Path to the input file.")
     parser.add_argument("--config", default="config.ini", help="Path to the configuration file (default: config.ini).")
-    parser.add_argument("--storage", choices=["set", "hash"], default="set",
+    parser.add_argument("--storage", choices=list(DICTIONARY_STORAGES), default="set",
                         help="Type of storage to use for the dictionary.")
-    return parser.parse_args()
+    parser.add_argument("--dictionary-index",
+                        help="Path to a compiled dictionary index. It is rebuilt if it is missing or stale.")
+    parser.add_argument("--input-provider", choices=list(INPUT_PROVIDERS), default="file",
+                        help="Type of provider to use for reading the input file.")
+    parser.add_argument("--engine", choices=list(MATCH_ENGINES), default="window",
+                        help="Matching engine to use for finding the scrambled strings.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes used for processing the input strings (default: 1).")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="Number of input strings sent to a worker process per task (default: 64).")
+    parser.add_argument("--shard-size", type=int, default=0, metavar="N",
+                        help="With several workers, input strings longer than N characters are split into "
+                             "overlapping shards of N characters, matched in parallel (default: 0, disabled).")
+    parser.add_argument("--stream-chunk-size", type=int, default=0, metavar="N",
+                        help="Reads and matches the input strings in chunks of N characters, so that they are never "
+                             "held in memory whole; requires --input-provider stream (default: 0, disabled).")
+    parser.add_argument("--line-memo-size", type=int, default=0, metavar="N",
+                        help="Number of input strings whose counts are memoized, so that repeated input strings "
+                             "are not scanned again (default: 0, disabled).")
+    parser.add_argument("--result-cache", metavar="PATH",
+                        help="Path to a SQLite database that caches the counts of the input strings across runs, "
+                             "for the loaded dictionary contents.")
+    parser.add_argument("--result-cache-size", type=int, default=DEFAULT_MAX_ENTRIES, metavar="N",
+                        help="Maximum number of input strings kept in the result cache "
+                             f"(default: {DEFAULT_MAX_ENTRIES}).")
+    parser.add_argument("--output", metavar="FILE",
+                        help="Path to the results file, or - for the standard output. "
+                             "Without it, the results are logged.")
+    parser.add_argument("--output-format", choices=list(RESULTS_WRITERS), default="text",
+                        help="Format of the results file (default: text).")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print the timing of every phase and the matching counters to stderr.")
+    parser.add_argument("--stats-json", metavar="FILE",
+                        help="Write the timing of every phase and the matching counters to a JSON file.")
+    parser.add_argument("--trace-matches", metavar="FILE",
+                        help="Write a JSON record for every match of the sampled input strings to a trace file.")
+    parser.add_argument("--trace-sample-rate", type=float, default=1.0,
+                        help="Fraction of the input strings that are traced, in (0, 1] (default: 1.0).")
 
-def main():
+    args = parser.parse_args()
+    if args.command is None and (args.dictionary is None or args.input is None):
+        parser.error("the following arguments are required: --dictionary, --input")
+    # The other providers build every input string before splitting it into chunks
+    if args.stream_chunk_size and args.input_provider != "stream":
+        parser.error("argument --stream-chunk-size: requires --input-provider stream")
+    return args
+
+def create_storage(storage_name: str, dict_config: DictionaryConfig) -> DictionaryDataStorage:
     """
-    Main function to handle command-line arguments and orchestrate the program flow.
+    Creates an empty dictionary storage.
+
+    Args:
+        storage_name (str): The type of storage (see `DICTIONARY_STORAGES`).
+        dict_config (DictionaryConfig): Dictionary configuration.
+
+    Returns:
+        DictionaryDataStorage: The storage, wrapped in a cache of canonical forms if the cache is enabled.
     """
+    storage = DICTIONARY_STORAGES[storage_name]()
+    if dict_config.canonical_cache_bytes:
+        storage = CachedDictionaryStorage(storage, dict_config.canonical_cache_bytes)
+    return storage
 
-    # Parse command-line arguments
-    args = parse_arguments()
-    config_file = args.config
-    dict_file_path = args.dictionary
-    input_file_path = args.input
+def build_dictionary(args, dict_config: DictionaryConfig, logger: Logger) -> Dictionary:
+    """
+    Builds a dictionary from the dictionary file, or from its compiled index if one is given.
 
-    # Initialize configuration
-    try:
-        config_reader = ConfigReader(config_file)
-        dict_config = config_reader.get_config("DICTIONARY", DictionaryConfig)
-        log_config = config_reader.get_config("LOGGER", LogConfig)
-        input_strings_config = config_reader.get_config("INPUT_STRINGS", InputStringsConfig)
-    except Exception as err:
-        print(f"Error loading configuration: {err}")
-        sys.exit(1)
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        dict_config (DictionaryConfig): Dictionary configuration.
+        logger (Logger): Logger.
+
+    Returns:
+        Dictionary: The loaded dictionary.
+
+    Raises:
+        DictionaryError: If the dictionary is invalid.
+        OSError: If the dictionary file or its index cannot be read.
+    """
+    # Select dictionary storage type
+    logger.info(f"Dictionary storage type: {args.storage}")
+    if dict_config.canonical_cache_bytes:
+        logger.info(f"Canonical form cache: {dict_config.canonical_cache_bytes} bytes")
+
+    if args.dictionary_index:
+        dictionary = load_or_compile_dictionary(
+            snapshot_path=args.dictionary_index,
+            source_file_path=args.dictionary,
+            storage=create_storage(args.storage, dict_config),
+            dictionary_config=dict_config,
+            logger=logger
+        )
+    else:
+        dictionary = Dictionary(
+            storage=create_storage(args.storage, dict_config),
+            dictionary_config=dict_config,
+            logger=logger
+        )
+
+        dictionary.load_from_file(args.dictionary)
+    logger.info(f"Total length of all dictionary words: {dictionary.total_length_of_all_words}")
+    return dictionary
+
+def load_dictionary(args, dict_config: DictionaryConfig, logger: Logger) -> Dictionary:
+    """
+    Loads the dictionary file, or its compiled index if one is given.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        dict_config (DictionaryConfig): Dictionary configuration.
+        logger (Logger): Logger.
+
+    Returns:
+        Dictionary: The loaded dictionary.
 
-    # Initialize logging
+    Raises:
+        SystemExit: If the dictionary cannot be loaded.
+    """
     try:
-        logger = StandardLogger(log_config, "scrambled_app")
+        dictionary = build_dictionary(args, dict_config, logger)
     except Exception as err:
-        print(f"Error initializing logger: {err}")
+        logger.error(f"Error loading dictionary: {err}")
         sys.exit(1)
 
-    logger.info("Configuration and logging initialized successfully.")
+    return dictionary
 
-    # Check command line arguments
-    check_arguments(args, logger)
+def compile_dictionary(args, dict_config: DictionaryConfig, logger: Logger) -> None:
+    """
+    Compiles the dictionary file into a binary index snapshot.
 
-    try:
-        # Select dictionary storage type
-        storage_type = HashDictionaryStorage if args.storage == "hash" else SetDictionaryStorage
-        logger.info(f"Dictionary storage type: {args.storage}")
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        dict_config (DictionaryConfig): Dictionary configuration.
+        logger (Logger): Logger.
 
+    Raises:
+        SystemExit: If the dictionary cannot be compiled.
+    """
+    try:
         dictionary = Dictionary(
-            storage=storage_type(),
+            storage=HashDictionaryStorage(),
             dictionary_config=dict_config,
             logger=logger
         )
+        dictionary.load_from_file(args.dictionary)
+        write_dictionary_snapshot(dictionary, args.dictionary, args.dictionary_index)
+        logger.info(f"Dictionary index written to {args.dictionary_index}.")
+    except Exception as err:
+        logger.error(f"Error compiling dictionary: {err}")
+        sys.exit(1)
+
+def serve(args, dict_config: DictionaryConfig, input_strings_config: InputStringsConfig, logger: Logger) -> None:
+    """
+    Loads the dictionary and serves the matching of input strings until the server is interrupted.
+    With a reload interval, the dictionary is reloaded whenever its file changes.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        dict_config (DictionaryConfig): Dictionary configuration.
+        input_strings_config (InputStringsConfig): Configuration of the input strings.
+        logger (Logger): Logger.
+
+    Raises:
+        SystemExit: If the dictionary cannot be loaded or the server fails.
+    """
+    dictionary = load_dictionary(args, dict_config, logger)
+
+    try:
+        logger.info(f"Match engine: {args.engine}")
+        match_engine = MATCH_ENGINES[args.engine](dictionary, logger)
+        reloader = None
+        if args.reload_interval:
+            def load_match_engine() -> MatchEngine:
+                # The engines build their index of the dictionary when they are created, so the new engine is
+                # complete before it is swapped in and sent to the workers
+                return MATCH_ENGINES[args.engine](build_dictionary(args, dict_config, logger), logger)
 
-        dictionary.load_from_file(dict_file_path)
-        logger.info(f"Total length of all dictionary words: {dictionary.total_length_of_all_words}")
+            logger.info(f"Dictionary reload interval: {args.reload_interval} seconds")
+            reloader = DictionaryReloader(
+                dictionary_file_path=args.dictionary,
+                load_match_engine=load_match_engine,
+                logger=logger,
+                poll_interval=args.reload_interval
+            )
+        options = MatchServerOptions(input_strings_config, workers=args.workers, chunk_size=args.chunk_size,
+                                     reloader=reloader)
+        server = MatchServer(match_engine, logger, options)
+        server.serve_forever(socket_path=args.socket, host=args.host, port=args.port)
     except Exception as err:
-        logger.error(f"Error loading dictionary: {err}")
+        logger.error(f"Error serving: {err}")
+        sys.exit(1)
+
+def run_client(args) -> None:
+    """
+    Sends the input strings of the input file to a running server, in batches, and writes their results.
+
+    The client does not load the configuration nor the dictionary: the input strings are validated by
+    the server.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+
+    Raises:
+        SystemExit: If the input file cannot be read or the server fails.
+    """
+    try:
+        with MatchClient(socket_path=args.socket, host=args.host, port=args.port) as client, \
+                open(args.input, mode="r", encoding="utf-8") as file, \
+                RESULTS_WRITERS[args.output_format](args.output) as results_writer:
+            case_index = 1
+            while batch := list(islice(file, args.batch_size)):
+                for count in client.count_matches(batch):
+                    results_writer.write(case_index, count)
+                    case_index += 1
+
+        if case_index == 1:
+            raise MatchServiceError(f"Input file '{args.input}' is empty.")
+    except (OSError, ValueError, MatchServiceError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        sys.exit(1)
+
+def report_stats(args, stats: StatsRecorder, logger: Logger) -> None:
+    """
+    Prints and/or writes the recorded statistics, as requested by the command-line arguments.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        stats (StatsRecorder): The recorded statistics.
+        logger (Logger): Logger.
+    """
+    if args.stats:
+        print(stats.format_table(), file=sys.stderr)
+
+    if args.stats_json:
+        try:
+            stats.write_json(args.stats_json)
+            logger.info(f"Statistics written to {args.stats_json}.")
+        except OSError as err:
+            logger.error(f"Error writing statistics: {err}")
+
+def initialize(args, stats: StatsRecorder) -> Tuple[DictionaryConfig, InputStringsConfig, Logger]:
+    """
+    Loads the configuration and initializes the logging.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        stats (StatsRecorder): Recorder of the timing of the phases.
+
+    Returns:
+        Tuple[DictionaryConfig, InputStringsConfig, Logger]: The dictionary configuration, the configuration of
+                                                             the input strings and the logger.
+
+    Raises:
+        SystemExit: If the configuration cannot be loaded or the logging cannot be initialized.
+    """
+    try:
+        with stats.phase("config_load"):
+            config_reader = ConfigReader(args.config)
+            dict_config = config_reader.get_config("DICTIONARY", DictionaryConfig)
+            log_config = config_reader.get_config("LOGGER", LogConfig)
+            input_strings_config = config_reader.get_config("INPUT_STRINGS", InputStringsConfig)
+    except Exception as err:
+        print(f"Error loading configuration: {err}")
+        sys.exit(1)
+
+    # The results written to the standard output must not be mixed with the console logging
+    if args.command is None and args.output == STDOUT_PATH:
+        log_config = log_config.model_copy(update={"log_console_stream": "STDERR"})
+
+    try:
+        with stats.phase("logger_init"):
+            logger = StandardLogger(log_config, "scrambled_app")
+    except Exception as err:
+        print(f"Error initializing logger: {err}")
         sys.exit(1)
 
+    logger.info("Configuration and logging initialized successfully.")
+    return dict_config, input_strings_config, logger
+
+def load_input(args, input_strings_config: InputStringsConfig, stats: StatsRecorder, logger: Logger) -> InputProvider:
+    """
+    Loads the input file with the input provider selected by the command-line arguments.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        input_strings_config (InputStringsConfig): Configuration of the input strings.
+        stats (StatsRecorder): Recorder of the timing of the phases.
+        logger (Logger): Logger.
+
+    Returns:
+        InputProvider: The loaded input provider.
+
+    Raises:
+        SystemExit: If the input file cannot be loaded.
+    """
     try:
-        input_file_provider = InputFileProvider(input_file_path=input_file_path,
-                                                input_strings_config=input_strings_config)
-        input_file_provider.load()
+        logger.info(f"Input provider type: {args.input_provider}")
+        with stats.phase("input_load"):
+            input_provider = INPUT_PROVIDERS[args.input_provider](input_file_path=args.input,
+                                                                  input_strings_config=input_strings_config)
+            input_provider.load()
     except Exception as err:
         logger.error(f"Error loading input file: {err}")
         sys.exit(1)
 
+    return input_provider
+
+def create_finder_options(args, dictionary: Dictionary, stats: StatsRecorder, logger: Logger) -> FinderOptions:
+    """
+    Creates the match engine, the tracer and the caches selected by the command-line arguments.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        dictionary (Dictionary): The dictionary.
+        stats (StatsRecorder): Recorder of the statistics.
+        logger (Logger): Logger.
+
+    Returns:
+        FinderOptions: The options of the `ScrambledStringFinder`.
+    """
+    logger.info(f"Match engine: {args.engine}")
+    match_engine = MATCH_ENGINES[args.engine](dictionary, logger)
+
+    tracer = None
+    if args.trace_matches:
+        tracer = MatchTracer(dictionary, match_engine, args.trace_matches, args.trace_sample_rate)
+        logger.info(f"Tracing matches to {args.trace_matches} (sample rate: {args.trace_sample_rate})")
+
+    memo = None
+    if args.line_memo_size:
+        memo = LineResultMemo(args.line_memo_size)
+        logger.info(f"Line memo: {args.line_memo_size} input strings")
+
+    result_cache = None
+    if args.result_cache:
+        result_cache = PersistentResultCache(args.result_cache, dictionary.get_fingerprint(),
+                                             args.result_cache_size)
+        logger.info(f"Result cache: {args.result_cache} (dictionary fingerprint: "
+                    f"{dictionary.get_fingerprint().hex()})")
+
+    logger.info(f"Workers: {args.workers} (chunk size: {args.chunk_size})")
+    if args.shard_size and args.workers > 1:
+        logger.info(f"Input strings longer than {args.shard_size} characters are split into shards")
+    if args.stream_chunk_size:
+        logger.info(f"Input strings are streamed in chunks of {args.stream_chunk_size} characters")
+
+    return FinderOptions(
+        match_engine=match_engine,
+        parallelism=ParallelismOptions(workers=args.workers, chunk_size=args.chunk_size, shard_size=args.shard_size),
+        stats=stats,
+        tracer=tracer,
+        memo=memo,
+        result_cache=result_cache,
+        stream_chunk_size=args.stream_chunk_size
+    )
+
+def write_results(args, scrambled_string_finder: ScrambledStringFinder, logger: Logger) -> None:
+    """
+    Finds the scrambled strings and writes the results to the results file, or logs them if there is none.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        scrambled_string_finder (ScrambledStringFinder): The finder of the scrambled strings.
+        logger (Logger): Logger.
+    """
+    if args.output:
+        logger.info(f"Writing {args.output_format} results to {args.output}")
+        with RESULTS_WRITERS[args.output_format](args.output) as results_writer:
+            for case_index, count in scrambled_string_finder.iter_scrambled_strings():
+                results_writer.write(case_index, count)
+    else:
+        logger.always("\n\n====== Results: ")
+        for case_index, count in scrambled_string_finder.iter_scrambled_strings():
+            logger.always(f"Case #{case_index}: {count}")
+
+def report_cache_stats(dictionary: Dictionary, options: FinderOptions, stats: StatsRecorder, logger: Logger) -> None:
+    """
+    Logs the statistics of the canonical form cache, of the line memo and of the result cache, and adds them
+    to the recorded statistics.
+
+    Args:
+        dictionary (Dictionary): The dictionary.
+        options (FinderOptions): The options of the `ScrambledStringFinder`.
+        stats (StatsRecorder): Recorder of the statistics.
+        logger (Logger): Logger.
+    """
+    if isinstance(dictionary.dictionary_data_storage, CachedDictionaryStorage):
+        cache_stats = dictionary.dictionary_data_storage.get_cache_stats()
+        stats.merge_counters(cache_stats)
+        logger.info(f"Canonical form cache: {cache_stats['canonical_cache_hits']} hits, "
+                    f"{cache_stats['canonical_cache_misses']} misses, "
+                    f"{cache_stats['canonical_cache_evictions']} evictions")
+
+    if options.memo is not None:
+        memo_stats = options.memo.get_cache_stats()
+        stats.merge_counters(memo_stats)
+        logger.info(f"Line memo: {memo_stats['line_memo_hits']} input strings served from the memo, "
+                    f"{memo_stats['line_memo_misses']} misses, {memo_stats['line_memo_evictions']} evictions")
+
+    if options.result_cache is not None:
+        result_cache_stats = options.result_cache.get_cache_stats()
+        stats.merge_counters(result_cache_stats)
+        logger.info(f"Result cache: {result_cache_stats['result_cache_hits']} hits, "
+                    f"{result_cache_stats['result_cache_misses']} misses "
+                    f"(hit rate: {options.result_cache.stats.get_hit_rate():.1%}), "
+                    f"{result_cache_stats['result_cache_evictions']} evictions")
+
+def find_scrambled_strings(args, dict_config: DictionaryConfig, input_strings_config: InputStringsConfig,
+                           stats: StatsRecorder, logger: Logger) -> None:
+    """
+    Loads the dictionary and the input file, finds the scrambled strings and writes or logs their results.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        dict_config (DictionaryConfig): Dictionary configuration.
+        input_strings_config (InputStringsConfig): Configuration of the input strings.
+        stats (StatsRecorder): Recorder of the statistics.
+        logger (Logger): Logger.
+
+    Raises:
+        SystemExit: If the dictionary or the input file cannot be loaded, or the matching fails.
+    """
+    with stats.phase("dictionary_load"):
+        dictionary = load_dictionary(args, dict_config, logger)
+    stats.increment("dictionary_words", dictionary.get_word_count())
+
+    input_provider = load_input(args, input_strings_config, stats, logger)
+
     try:
+        options = create_finder_options(args, dictionary, stats, logger)
         scrambled_string_finder = ScrambledStringFinder(
-            input_provider=input_file_provider,
+            input_provider=input_provider,
             dictionary=dictionary,
-            logger=logger
+            logger=logger,
+            options=options
         )
 
-        logger.always("\n\n====== Results: ")
-        for case_index, count in scrambled_string_finder.find_scrambled_strings():
-            logger.always(f"Case #{case_index}: {count}")
+        try:
+            with stats.phase("matching"):
+                write_results(args, scrambled_string_finder, logger)
+        finally:
+            if options.tracer is not None:
+                options.tracer.close()
+            if options.result_cache is not None:
+                options.result_cache.close()
     except Exception as err:
         logger.error(f"Error finding scrambled strings: {err}")
         sys.exit(1)
 
+    report_cache_stats(dictionary, options, stats, logger)
+    report_stats(args, stats, logger)
+
+def main():
+    """
+    Main function to handle command-line arguments and orchestrate the program flow.
+    """
+
+    # Parse command-line arguments
+    args = parse_arguments()
+    if args.command == "client":
+        run_client(args)
+        return
+
+    stats = StatsRecorder(enabled=args.command is None and (args.stats or args.stats_json is not None))
+
+    # Initialize configuration and logging
+    dict_config, input_strings_config, logger = initialize(args, stats)
+
+    # Check command line arguments
+    check_arguments(args, logger)
+
+    if args.command == "compile-dictionary":
+        compile_dictionary(args, dict_config, logger)
+    elif args.command == "serve":
+        serve(args, dict_config, input_strings_config, logger)
+    else:
+        find_scrambled_strings(args, dict_config, input_strings_config, stats, logger)
 
 # Main code of the scrambled-strings application
 if __name__ == '__main__':
@@ -0,0 +1,91 @@
+"""
+Module for reloading the dictionary of a long-running process when its file changes.
+"""
+
+# Imports
+import time
+from typing import Callable, Dict, Optional
+from dictionary.dictionary_file_watcher import DictionaryFileWatcher
+from log.logger import Logger
+from matching.match_engine import MatchEngine
+
+# Default number of seconds between two polls of the dictionary file
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+class DictionaryReloader:
+    """
+    Builds a new match engine when the contents of the dictionary file change.
+
+    The reloader only builds the engine: the caller swaps it in, so the engine in use is never modified.
+    The engine is built completely before it is returned, with its index of the dictionary (e.g. the equivalence
+    classes of the words), so the first requests after the swap, and the workers it is sent to, do not build it.
+    If the new dictionary cannot be loaded, for example because it fails its validation, the failure is
+    logged and counted, and the caller keeps its engine. The same contents are not loaded again, so a
+    failed reload is only retried once the file changes again.
+    """
+
+    def __init__(self, dictionary_file_path: str, load_match_engine: Callable[[], MatchEngine], logger: Logger,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initializes the DictionaryReloader with the current contents of the dictionary file.
+
+        Args:
+            dictionary_file_path (str): Path to the dictionary file.
+            load_match_engine (Callable[[], MatchEngine]): Loads the dictionary file and returns a new engine,
+                                                           with its index built. It raises an exception if the
+                                                           dictionary is invalid.
+            logger (Logger): Logger.
+            poll_interval (float): Number of seconds between two polls of the dictionary file.
+
+        Raises:
+            ValueError: If `poll_interval` is not positive.
+            OSError: If the dictionary file cannot be read.
+        """
+        if poll_interval <= 0:
+            raise ValueError(f"The poll interval ({poll_interval}) must be positive.")
+
+        self.watcher: DictionaryFileWatcher = DictionaryFileWatcher(dictionary_file_path)
+        self.load_match_engine: Callable[[], MatchEngine] = load_match_engine
+        self.logger: Logger = logger
+        self.poll_interval: float = poll_interval
+        self.reloads: int = 0
+        self.reload_failures: int = 0
+        self.last_reload_seconds: Optional[float] = None
+
+    def reload_if_changed(self) -> Optional[MatchEngine]:
+        """
+        Polls the dictionary file and builds a new match engine if its contents have changed.
+
+        Returns:
+            Optional[MatchEngine]: The new engine, or None if the file is unchanged or cannot be loaded.
+        """
+        if not self.watcher.poll():
+            return None
+
+        self.logger.info(f"Dictionary file {self.watcher.file_path} changed, reloading it")
+        start = time.perf_counter()
+        try:
+            match_engine = self.load_match_engine()
+        except Exception as err:
+            self.reload_failures += 1
+            self.logger.error(f"Dictionary reload failed after {time.perf_counter() - start:.3f} seconds, "
+                              f"the previous dictionary is kept: {err}")
+            return None
+
+        self.reloads += 1
+        self.last_reload_seconds = time.perf_counter() - start
+        reload_stats = self.get_reload_stats()
+        self.logger.info(f"Dictionary reloaded in {self.last_reload_seconds:.3f} seconds "
+                         f"({reload_stats['dictionary_reloads']} reloads, "
+                         f"{reload_stats['dictionary_reload_failures']} failed)")
+        return match_engine
+
+    def get_reload_stats(self) -> Dict[str, int]:
+        """
+        Gets the number of successful and failed reloads.
+
+        Returns:
+            Dict[str, int]: The counters `dictionary_reloads` and `dictionary_reload_failures`.
+        """
+        return {"dictionary_reloads": self.reloads, "dictionary_reload_failures": self.reload_failures}
@@ -0,0 +1,92 @@
+"""
+Module for sending input strings to a match server.
+"""
+
+# Imports
+import socket
+from typing import List, Optional
+from service.match_protocol import DEFAULT_HOST, MAX_MESSAGE_SIZE, decode_message, encode_message
+from service.service_errors import MatchServiceError
+
+
+class MatchClient:
+    """
+    Client of a `MatchServer`, which sends batches of input strings over a single connection and receives
+    their counts of matched dictionary words.
+
+    Clients must be closed (or used as context managers) so that the connection is released.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, host: str = DEFAULT_HOST, port: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        """
+        Initializes the MatchClient and connects to the server.
+
+        Args:
+            socket_path (Optional[str]): Path to the Unix domain socket of the server.
+            host (str): Host of the TCP server, used when `port` is given.
+            port (Optional[int]): TCP port of the server.
+            timeout (Optional[float]): Timeout in seconds of the socket operations. Defaults to no timeout.
+
+        Raises:
+            ValueError: If neither or both of `socket_path` and `port` are given.
+            OSError: If the client cannot connect to the server.
+        """
+        if (socket_path is None) == (port is None):
+            raise ValueError("Either a socket path or a port must be given.")
+
+        if socket_path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                self._socket.settimeout(timeout)
+                self._socket.connect(socket_path)
+            except OSError:
+                self._socket.close()
+                raise
+        else:
+            self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._socket.makefile("rb")
+
+    def __enter__(self) -> "MatchClient":
+        """Returns the client."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the connection."""
+        self.close()
+
+    def count_matches(self, input_strings: List[str]) -> List[int]:
+        """
+        Counts how many of the words from the dictionary of the server appear in every input string
+        either in their original form or in their scrambled form.
+
+        Args:
+            input_strings (List[str]): The input strings.
+
+        Returns:
+            List[int]: The count of matched scrambled words of every input string, in order.
+
+        Raises:
+            MatchServiceError: If the server rejects the request or sends an invalid response.
+            OSError: If the connection fails.
+        """
+        self._socket.sendall(encode_message({"lines": input_strings}))
+        line = self._file.readline(MAX_MESSAGE_SIZE)
+        if not line.endswith(b"\n"):
+            raise MatchServiceError("The server closed the connection or sent an incomplete response.")
+
+        response = decode_message(line)
+        if "error" in response:
+            raise MatchServiceError(f"The server rejected the request: {response['error']}")
+
+        counts = response.get("counts")
+        if not isinstance(counts, list) or len(counts) != len(input_strings):
+            raise MatchServiceError("Invalid response: one count per input string is expected.")
+        return counts
+
+    def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        self._file.close()
+        self._socket.close()
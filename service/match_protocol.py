@@ -0,0 +1,54 @@
+"""
+Module for the messages exchanged by the match server and its clients.
+
+Every message is a JSON object on a single line. A request holds a batch of input strings
+(`{"lines": [...]}`), and its response holds their counts of matched dictionary words, in the
+same order (`{"counts": [...]}`), or the reason why the request was rejected or failed (`{"error": "..."}`).
+A connection can carry any number of requests, which are answered in order.
+"""
+
+# Imports
+import json
+from service.service_errors import MatchServiceError
+
+# Host of the TCP server, which only accepts local connections by default
+DEFAULT_HOST = "127.0.0.1"
+
+# Maximum size in bytes of a message, including its line break
+MAX_MESSAGE_SIZE = 64 << 20
+
+
+def encode_message(message: dict) -> bytes:
+    """
+    Encodes a message as a line of JSON.
+
+    Args:
+        message (dict): The message.
+
+    Returns:
+        bytes: The encoded message, ending with a line break. Non-ASCII characters are escaped.
+    """
+    return json.dumps(message, separators=(",", ":")).encode("ascii") + b"\n"
+
+
+def decode_message(line: bytes) -> dict:
+    """
+    Decodes a line of JSON into a message.
+
+    Args:
+        line (bytes): The encoded message.
+
+    Returns:
+        dict: The message.
+
+    Raises:
+        MatchServiceError: If the line is not a JSON object.
+    """
+    try:
+        message = json.loads(line)
+    except ValueError as err:
+        raise MatchServiceError(f"Invalid message: {err}") from err
+
+    if not isinstance(message, dict):
+        raise MatchServiceError("Invalid message: a JSON object is expected.")
+    return message
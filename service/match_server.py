@@ -0,0 +1,324 @@
+"""
+Module for serving the matching of input strings from a long-running process.
+"""
+
+# Imports
+import asyncio
+import os
+import signal
+import stat
+import threading
+from concurrent.futures import BrokenExecutor, Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, List, Optional
+from input_strings.input_string_errors import InputStringError
+from input_strings.input_strings_config import InputStringsConfig
+from input_strings.input_strings_utils import validate_line_length_or_raise
+from log.logger import Logger
+from matching.match_engine import MatchEngine
+from scrambled_string_finder import count_chunk_matches
+from service.dictionary_reloader import DictionaryReloader
+from service.match_protocol import DEFAULT_HOST, MAX_MESSAGE_SIZE, decode_message, encode_message
+from service.service_errors import MatchServiceError
+from service.worker_pools import WorkerPools
+
+
+@dataclass(frozen=True)
+class MatchServerOptions:
+    """
+    Options of a `MatchServer`.
+
+    Attributes:
+        input_strings_config -- configuration of the input strings, used to validate them
+        workers -- number of worker processes. A value of 1 matches the input strings in a thread of the server
+                   process.
+        chunk_size -- number of input strings sent to a worker per task
+        reloader -- reloads the dictionary when its file changes. Defaults to no reload.
+
+    Raises:
+        ValueError: If `workers` or `chunk_size` is not positive.
+    """
+    input_strings_config: InputStringsConfig
+    workers: int = 1
+    chunk_size: int = 64
+    reloader: Optional[DictionaryReloader] = None
+
+    def __post_init__(self):
+        """Validates the options."""
+        if self.workers < 1:
+            raise ValueError(f"The number of workers ({self.workers}) must be positive.")
+        if self.chunk_size < 1:
+            raise ValueError(f"The chunk size ({self.chunk_size}) must be positive.")
+
+
+@dataclass
+class MatchServerStats:
+    """
+    Statistics of a `MatchServer`.
+
+    Attributes:
+        requests -- number of answered requests
+        input_strings -- number of input strings of the answered requests
+        failed_requests -- number of requests whose matching failed
+    """
+    requests: int = 0
+    input_strings: int = 0
+    failed_requests: int = 0
+
+
+class MatchServer:
+    """
+    Server that counts the matches of batches of input strings with a match engine that is created once.
+
+    The configuration, the dictionary and the match engine are loaded when the server starts, so a request
+    only pays for the matching of its input strings. The server listens on a Unix domain socket or on a TCP
+    port and handles its connections with asyncio, while the input strings are matched by a bounded pool:
+    a single worker thread, or a pool of worker processes (see `ScrambledStringFinder`). The input strings
+    of a request are matched in chunks, and a bounded number of chunks is kept in flight, so concurrent
+    requests share the workers fairly. See `match_protocol` for the messages.
+
+    With a `DictionaryReloader`, the dictionary file is polled while the server runs. A changed dictionary
+    is loaded in a background thread, and a new pool of workers is started with the new match engine and
+    swapped in between two requests: the requests in flight finish with the previous pool, which is shut down
+    once they are answered, and the next requests use the new one, so the serving is never paused.
+    If the new dictionary cannot be loaded, the server keeps its match engine. A request whose matching fails
+    is answered with an error, and the server keeps serving.
+    """
+
+    def __init__(self, match_engine: MatchEngine, logger: Logger, options: MatchServerOptions):
+        """
+        Initializes the MatchServer.
+
+        Args:
+            match_engine (MatchEngine): The engine used to match the dictionary words against the input strings.
+            logger (Logger): Logger.
+            options (MatchServerOptions): The configuration of the input strings, the pool of workers and the
+                                          reloader of the dictionary.
+        """
+        self.match_engine: MatchEngine = match_engine
+        self.logger: Logger = logger
+        self.options: MatchServerOptions = options
+        self.stats: MatchServerStats = MatchServerStats()
+        # Address the server listens on, and event set once it accepts connections
+        self.address = None
+        self.ready: threading.Event = threading.Event()
+        # Stops the event loop of the server while it is serving
+        self._stop: Optional[Callable[[], None]] = None
+
+    def serve_forever(self, socket_path: Optional[str] = None, host: str = DEFAULT_HOST,
+                      port: Optional[int] = None) -> None:
+        """
+        Serves requests until the server is stopped, or until SIGINT or SIGTERM is received when it runs
+        in the main thread.
+
+        Args:
+            socket_path (Optional[str]): Path to the Unix domain socket to listen on.
+            host (str): Host of the TCP server, used when `port` is given.
+            port (Optional[int]): TCP port to listen on (0 selects a free port).
+
+        Raises:
+            ValueError: If neither or both of `socket_path` and `port` are given.
+            OSError: If the server cannot listen on the socket.
+        """
+        if (socket_path is None) == (port is None):
+            raise ValueError("Either a socket path or a port must be given.")
+
+        pools = WorkerPools(self.options.workers)
+        pools.start(self.match_engine)
+        try:
+            asyncio.run(self._serve(pools, socket_path, host, port))
+        finally:
+            pools.shutdown()
+
+    def stop(self) -> None:
+        """
+        Stops the server. It can be called from any thread, once the server is ready, and does nothing if
+        the server is already stopped.
+        """
+        stop = self._stop
+        if stop is not None:
+            stop()
+
+    async def _serve(self, pools: WorkerPools, socket_path: Optional[str], host: str, port: Optional[int]) -> None:
+        """
+        Listens on the socket and serves requests until the server is stopped.
+
+        Args:
+            pools (WorkerPools): The pools of workers, with the pool of the current match engine started.
+            socket_path (Optional[str]): Path to the Unix domain socket to listen on.
+            host (str): Host of the TCP server.
+            port (Optional[int]): TCP port to listen on.
+        """
+        loop = asyncio.get_running_loop()
+        stopped = asyncio.Event()
+        handle_connection = partial(self._handle_connection, pools)
+
+        if socket_path is not None:
+            # Remove the socket left by a server that was not stopped cleanly
+            if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                os.remove(socket_path)
+            server = await asyncio.start_unix_server(handle_connection, path=socket_path, limit=MAX_MESSAGE_SIZE)
+        else:
+            server = await asyncio.start_server(handle_connection, host, port, limit=MAX_MESSAGE_SIZE)
+
+        if threading.current_thread() is threading.main_thread():
+            for signal_number in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signal_number, stopped.set)
+
+        self.address = server.sockets[0].getsockname()
+        self.logger.info(f"Match server listening on {self.address} with {self.options.workers} worker(s)")
+        self._stop = partial(loop.call_soon_threadsafe, stopped.set)
+        self.ready.set()
+        reloader = self.options.reloader
+        watch_task = asyncio.create_task(self._watch_dictionary(pools, reloader)) if reloader is not None else None
+        try:
+            await stopped.wait()
+        finally:
+            self._stop = None
+            if watch_task is not None:
+                watch_task.cancel()
+            server.close()
+            if socket_path is not None and os.path.exists(socket_path):
+                os.remove(socket_path)
+            reloads = ""
+            if reloader is not None:
+                reload_stats = reloader.get_reload_stats()
+                reloads = (f", {reload_stats['dictionary_reloads']} dictionary reloads "
+                           f"({reload_stats['dictionary_reload_failures']} failed)")
+            self.logger.info(f"Match server stopped after {self.stats.requests} requests "
+                             f"({self.stats.input_strings} input strings, {self.stats.failed_requests} failed)"
+                             f"{reloads}")
+
+    async def _watch_dictionary(self, pools: WorkerPools, reloader: DictionaryReloader) -> None:
+        """
+        Polls the dictionary file and swaps in a new match engine whenever the dictionary changes.
+
+        Args:
+            pools (WorkerPools): The pools of workers.
+            reloader (DictionaryReloader): The reloader of the dictionary.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(reloader.poll_interval)
+            # The dictionary is loaded in a background thread, so the requests are served meanwhile
+            match_engine = await loop.run_in_executor(None, reloader.reload_if_changed)
+            if match_engine is not None:
+                self._swap_match_engine(pools, match_engine)
+
+    def _swap_match_engine(self, pools: WorkerPools, match_engine: MatchEngine) -> None:
+        """
+        Swaps in a new match engine, with a new pool of workers. It runs in the event loop, so it is atomic
+        with respect to the requests: the requests in flight finish with the previous pool, which is shut down
+        once they are answered, and the next requests use the new pool.
+
+        Args:
+            pools (WorkerPools): The pools of workers.
+            match_engine (MatchEngine): The new match engine.
+        """
+        requests_in_flight = pools.start(match_engine)
+        self.match_engine = match_engine
+        self.logger.info(f"Match engine swapped, {requests_in_flight} requests in flight finish "
+                         f"with the previous dictionary")
+
+    async def _handle_connection(self, pools: WorkerPools, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """
+        Answers the requests of a connection, in order, until the client closes it.
+
+        Args:
+            pools (WorkerPools): The pools of workers.
+            reader (asyncio.StreamReader): The stream of the requests.
+            writer (asyncio.StreamWriter): The stream of the responses.
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The request exceeds the maximum message size, so the rest of the stream cannot be parsed
+                    writer.write(encode_message({"error": f"The request exceeds {MAX_MESSAGE_SIZE} bytes."}))
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+
+                writer.write(encode_message(await self._handle_request(pools, line)))
+                await writer.drain()
+        except ConnectionError as err:
+            self.logger.warning(f"Match server connection lost: {err}")
+        except asyncio.CancelledError:
+            # The server is stopped while the connection is open, which ends the connection
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, pools: WorkerPools, line: bytes) -> dict:
+        """
+        Validates a request and counts the matches of its input strings with the current match engine.
+
+        Args:
+            pools (WorkerPools): The pools of workers.
+            line (bytes): The encoded request.
+
+        Returns:
+            dict: The response, with the counts of the input strings or the reason why the request is invalid
+                  or failed.
+        """
+        try:
+            request = decode_message(line)
+            input_strings = request.get("lines")
+            if not isinstance(input_strings, list) or not all(isinstance(item, str) for item in input_strings):
+                raise MatchServiceError("Invalid request: 'lines' must be a list of input strings.")
+
+            input_strings_config = self.options.input_strings_config
+            for input_string in input_strings:
+                validate_line_length_or_raise(line=input_string,
+                                              min_line_length=input_strings_config.min_line_length,
+                                              max_line_length=input_strings_config.max_line_length)
+        except (MatchServiceError, InputStringError) as err:
+            self.logger.warning(f"Match server request rejected: {err.message}")
+            return {"error": err.message}
+
+        # The request keeps the match engine it started with, even if a new one is swapped in meanwhile
+        executor = pools.acquire()
+        try:
+            counts = await self._count_matches(executor, pools.chunk_slots, input_strings)
+        except Exception as err:
+            # A failure of the workers only fails this request. A pool whose worker process died cannot run
+            # tasks anymore, so the next requests use a new pool.
+            self.stats.failed_requests += 1
+            self.logger.error(f"Match server request failed: {err!r}")
+            if isinstance(err, BrokenExecutor):
+                pools.replace(executor)
+            return {"error": f"The matching of the input strings failed: {err!r}"}
+        finally:
+            pools.release(executor)
+        self.stats.requests += 1
+        self.stats.input_strings += len(input_strings)
+        return {"counts": counts}
+
+    async def _count_matches(self, executor: Executor, chunk_slots: asyncio.Semaphore,
+                             input_strings: List[str]) -> List[int]:
+        """
+        Counts the matches of input strings in chunks, with a bounded number of chunks in flight.
+
+        Args:
+            executor (Executor): The pool of workers.
+            chunk_slots (asyncio.Semaphore): The slots of the chunks in flight.
+            input_strings (List[str]): The input strings.
+
+        Returns:
+            List[int]: The count of matched scrambled words of every input string.
+        """
+        loop = asyncio.get_running_loop()
+        chunk_size = self.options.chunk_size
+
+        async def count_chunk(chunk: List[str]) -> List[int]:
+            async with chunk_slots:
+                counts, _ = await loop.run_in_executor(executor, count_chunk_matches, chunk)
+            return counts
+
+        chunk_counts = await asyncio.gather(*(count_chunk(input_strings[start: start + chunk_size])
+                                              for start in range(0, len(input_strings), chunk_size)))
+        return [count for counts in chunk_counts for count in counts]
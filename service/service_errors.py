@@ -0,0 +1,15 @@
+"""
+Python module that contains custom exceptions for the match service.
+"""
+
+
+class MatchServiceError(Exception):
+    """
+    Exception raised for invalid requests or responses of the match service.
+
+    Attributes:
+        message -- explanation of the error
+    """
+
+    def __init__(self, message):
+        self.message = message
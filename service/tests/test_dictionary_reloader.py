@@ -0,0 +1,94 @@
+"""
+Test cases for DictionaryReloader.
+"""
+
+# Imports
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.set_dictionary_storage import SetDictionaryStorage
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+from service.dictionary_reloader import DictionaryReloader
+
+
+class TestDictionaryReloader(unittest.TestCase):
+    """
+    Unit tests for the DictionaryReloader class.
+    """
+
+    def setUp(self):
+        """Set up a dictionary file in a temporary directory."""
+        self.logger = Mock()
+        self.logger.is_enabled_for.return_value = False
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.dictionary_path = os.path.join(self.temp_dir.name, "dict.txt")
+        self.write_dictionary("tihs\n", mtime=1)
+        self.reloader = DictionaryReloader(self.dictionary_path, self.load_match_engine, self.logger,
+                                           poll_interval=0.01)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def write_dictionary(self, contents: str, mtime: int) -> None:
+        """Writes the given contents to the dictionary file, with the given modification time in seconds."""
+        with open(self.dictionary_path, mode="w", encoding="utf-8") as file:
+            file.write(contents)
+        os.utime(self.dictionary_path, (mtime, mtime))
+
+    def load_match_engine(self) -> SlidingWindowMatchEngine:
+        """Loads the dictionary file into a new match engine."""
+        dictionary = Dictionary(SetDictionaryStorage(),
+                                DictionaryConfig(min_word_length=2, max_word_length=10,
+                                                 max_sum_lengths_of_all_words=100),
+                                self.logger)
+        dictionary.load_from_file(self.dictionary_path)
+        return SlidingWindowMatchEngine(dictionary, self.logger)
+
+    def reload(self):
+        """Polls the dictionary file twice, as a change is only reloaded once the file is stable."""
+        self.assertIsNone(self.reloader.reload_if_changed())
+        return self.reloader.reload_if_changed()
+
+    def test_reload(self):
+        """Test that a new match engine is built from a changed dictionary file."""
+        self.assertIsNone(self.reload())
+
+        self.write_dictionary("tihs\neaxmple\n", mtime=2)
+        match_engine = self.reload()
+        self.assertEqual(match_engine.count_matches("scrambled_example_this"), 2)
+        self.assertEqual(self.reloader.get_reload_stats(),
+                         {"dictionary_reloads": 1, "dictionary_reload_failures": 0})
+        self.assertGreaterEqual(self.reloader.last_reload_seconds, 0)
+
+    def test_reloaded_engine_is_built(self):
+        """Test that the reloaded match engine has its equivalence classes built before it is returned."""
+        self.write_dictionary("tihs\neaxmple\n", mtime=2)
+        match_engine = self.reload()
+        with patch.object(match_engine.dictionary, "iter_word_groups", side_effect=AssertionError("not built")):
+            self.assertEqual(match_engine.count_matches("scrambled_example_this"), 2)
+
+    def test_failed_reload(self):
+        """Test that an invalid dictionary is reported as a failure, and only retried once the file changes."""
+        self.write_dictionary("tihs\n" + "x" * 11 + "\n", mtime=2)
+        self.assertIsNone(self.reload())
+        self.assertEqual(self.reloader.get_reload_stats(),
+                         {"dictionary_reloads": 0, "dictionary_reload_failures": 1})
+        self.logger.error.assert_called_once()
+        self.assertIsNone(self.reload())
+        self.assertEqual(self.reloader.reload_failures, 1)
+
+        self.write_dictionary("eaxmple\n", mtime=3)
+        self.assertEqual(self.reload().count_matches("scrambled_example_this"), 1)
+
+    def test_invalid_poll_interval(self):
+        """Test that a poll interval that is not positive is rejected."""
+        with self.assertRaises(ValueError):
+            DictionaryReloader(self.dictionary_path, self.load_match_engine, self.logger, poll_interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
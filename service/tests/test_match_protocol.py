@@ -0,0 +1,33 @@
+"""
+Test cases for the messages of the match service.
+"""
+
+# Imports
+import unittest
+from service.match_protocol import decode_message, encode_message
+from service.service_errors import MatchServiceError
+
+
+class TestMatchProtocol(unittest.TestCase):
+    """
+    Unit tests for the encoding and decoding of the messages.
+    """
+
+    def test_round_trip(self):
+        """Test that a message is encoded on a single ASCII line and decoded back."""
+        message = {"lines": ["café\n", "this\ttihs", "\ud800"]}
+        line = encode_message(message)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(line.count(b"\n"), 1)
+        line.decode("ascii")
+        self.assertEqual(decode_message(line), message)
+
+    def test_invalid_messages(self):
+        """Test that lines that are not JSON objects are rejected."""
+        for line in (b"not json\n", b"[1, 2]\n", b"\xff\n", b""):
+            with self.assertRaises(MatchServiceError):
+                decode_message(line)
+
+
+if __name__ == "__main__":
+    unittest.main()
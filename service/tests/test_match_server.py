@@ -0,0 +1,223 @@
+"""
+Test cases for MatchServer and MatchClient.
+"""
+
+# Imports
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+from dictionary.dictionary import Dictionary
+from dictionary.dictionary_config import DictionaryConfig
+from dictionary.set_dictionary_storage import SetDictionaryStorage
+from input_strings.input_strings_config import InputStringsConfig
+from matching.match_engine import Matches
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+from service.dictionary_reloader import DictionaryReloader
+from service.match_client import MatchClient
+from service.match_server import MatchServer, MatchServerOptions, MatchServerStats
+from service.service_errors import MatchServiceError
+
+
+class ExitingMatchEngine(SlidingWindowMatchEngine):
+    """
+    Match engine whose worker process exits when it matches the input string "exit".
+    """
+
+    def find_matches(self, input_string: str) -> Matches:
+        """Exits the process on the input string "exit", or finds the matches of the input string."""
+        if input_string == "exit":
+            os._exit(1)
+        return super().find_matches(input_string)
+
+
+class TestMatchServer(unittest.TestCase):
+    """
+    Unit tests for the MatchServer and MatchClient classes.
+    """
+
+    def setUp(self):
+        """Set up the match engine and a temporary directory for the socket."""
+        self.logger = Mock()
+        self.logger.is_enabled_for.return_value = False
+        self.dictionary_config = DictionaryConfig(min_word_length=2, max_word_length=10,
+                                                  max_sum_lengths_of_all_words=100)
+        dictionary = Dictionary(SetDictionaryStorage(), self.dictionary_config, self.logger)
+        dictionary.add_words(["eaxmple", "tihs", "ab"])
+        self.match_engine = SlidingWindowMatchEngine(dictionary, self.logger)
+        self.input_strings_config = InputStringsConfig(min_line_length=2, max_line_length=40)
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def start_server(self, server: MatchServer, **address) -> threading.Thread:
+        """
+        Runs a server in a background thread until it is ready.
+
+        Args:
+            server (MatchServer): The server.
+            **address: The socket path or the port of the server.
+
+        Returns:
+            threading.Thread: The thread of the server.
+        """
+        thread = threading.Thread(target=server.serve_forever, kwargs=address)
+        thread.start()
+        self.assertTrue(server.ready.wait(timeout=10))
+        self.addCleanup(thread.join, 10)
+        self.addCleanup(server.stop)
+        return thread
+
+    def test_unix_socket(self):
+        """Test that batches of input strings are answered over a Unix domain socket, on one connection."""
+        socket_path = os.path.join(self.temp_dir.name, "server.sock")
+        options = MatchServerOptions(self.input_strings_config, chunk_size=2)
+        server = MatchServer(self.match_engine, self.logger, options)
+        thread = self.start_server(server, socket_path=socket_path)
+
+        with MatchClient(socket_path=socket_path, timeout=10) as client:
+            self.assertEqual(client.count_matches(["scrambled_example_this\n", "nothing\n", "ab"]), [2, 0, 1])
+            self.assertEqual(client.count_matches([]), [])
+            self.assertEqual(client.count_matches(["xx_tihs"]), [1])
+        self.assertEqual(server.stats, MatchServerStats(requests=3, input_strings=4))
+
+        # The server stops and removes its socket
+        server.stop()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(socket_path))
+
+    def test_tcp_workers(self):
+        """Test that a pool of worker processes answers concurrent clients over TCP."""
+        options = MatchServerOptions(self.input_strings_config, workers=2, chunk_size=1)
+        server = MatchServer(self.match_engine, self.logger, options)
+        self.start_server(server, port=0)
+        port = server.address[1]
+
+        inputs = ["scrambled_example_this\n", "nothing\n", "ab", "xx_tihs"] * 5
+        results = {}
+
+        def send(client_index: int) -> None:
+            with MatchClient(port=port, timeout=30) as client:
+                results[client_index] = client.count_matches(inputs)
+
+        clients = [threading.Thread(target=send, args=(client_index,)) for client_index in range(3)]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join(30)
+        self.assertEqual(results, {client_index: [2, 0, 1, 1] * 5 for client_index in range(3)})
+
+    def test_rejected_requests(self):
+        """Test that invalid requests are rejected without closing the connection."""
+        socket_path = os.path.join(self.temp_dir.name, "server.sock")
+        server = MatchServer(self.match_engine, self.logger, MatchServerOptions(self.input_strings_config))
+        self.start_server(server, socket_path=socket_path)
+
+        with MatchClient(socket_path=socket_path, timeout=10) as client:
+            with self.assertRaises(MatchServiceError):
+                client.count_matches(["x" * 41])
+            self.assertEqual(client.count_matches(["xx_tihs"]), [1])
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as raw_socket:
+            raw_socket.settimeout(10)
+            raw_socket.connect(socket_path)
+            raw_socket.sendall(b'{"lines": [1, 2]}\nnot json\n')
+            with raw_socket.makefile("rb") as file:
+                self.assertIn(b"error", file.readline())
+                self.assertIn(b"error", file.readline())
+
+    def test_failed_request(self):
+        """Test that a request whose matching fails is answered with an error, and that the server keeps serving."""
+        def count_matches(input_string: str) -> int:
+            if input_string == "boom":
+                raise RuntimeError("worker failure")
+            return self.match_engine.count_matches(input_string)
+
+        failing_match_engine = Mock()
+        failing_match_engine.count_matches.side_effect = count_matches
+        failing_match_engine.reset_counters.return_value = {}
+        socket_path = os.path.join(self.temp_dir.name, "server.sock")
+        server = MatchServer(failing_match_engine, self.logger, MatchServerOptions(self.input_strings_config))
+        self.start_server(server, socket_path=socket_path)
+
+        with MatchClient(socket_path=socket_path, timeout=10) as client:
+            with self.assertRaises(MatchServiceError) as context:
+                client.count_matches(["xx_tihs", "boom"])
+            self.assertIn("worker failure", context.exception.message)
+            self.assertEqual(client.count_matches(["xx_tihs"]), [1])
+        self.assertEqual(server.stats, MatchServerStats(requests=1, input_strings=1, failed_requests=1))
+        self.logger.error.assert_called_once()
+
+    def test_broken_worker_pool(self):
+        """Test that a request whose worker process dies fails, and that the next requests use a new pool."""
+        match_engine = ExitingMatchEngine(self.match_engine.dictionary, self.logger)
+        server = MatchServer(match_engine, self.logger,
+                             MatchServerOptions(self.input_strings_config, workers=2, chunk_size=1))
+        self.start_server(server, port=0)
+
+        with MatchClient(port=server.address[1], timeout=30) as client:
+            with self.assertRaises(MatchServiceError):
+                client.count_matches(["xx_tihs", "exit"])
+            self.assertEqual(client.count_matches(["xx_tihs", "ab"]), [1, 1])
+        self.assertEqual(server.stats.failed_requests, 1)
+
+    def test_dictionary_reload(self):
+        """Test that a changed dictionary is swapped in while serving, and that an invalid one is not."""
+        dictionary_path = os.path.join(self.temp_dir.name, "dict.txt")
+        socket_path = os.path.join(self.temp_dir.name, "server.sock")
+
+        def write_dictionary(contents: str, mtime: int) -> None:
+            with open(dictionary_path, mode="w", encoding="utf-8") as file:
+                file.write(contents)
+            os.utime(dictionary_path, (mtime, mtime))
+
+        def load_match_engine() -> SlidingWindowMatchEngine:
+            dictionary = Dictionary(SetDictionaryStorage(), self.dictionary_config, self.logger)
+            dictionary.load_from_file(dictionary_path)
+            return SlidingWindowMatchEngine(dictionary, self.logger)
+
+        write_dictionary("eaxmple\ntihs\nab\n", mtime=1)
+        reloader = DictionaryReloader(dictionary_path, load_match_engine, self.logger, poll_interval=0.01)
+        server = MatchServer(self.match_engine, self.logger,
+                             MatchServerOptions(self.input_strings_config, reloader=reloader))
+        self.start_server(server, socket_path=socket_path)
+
+        def wait_for_reload(attempts: int) -> None:
+            deadline = time.monotonic() + 10
+            while reloader.reloads + reloader.reload_failures < attempts and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        with MatchClient(socket_path=socket_path, timeout=10) as client:
+            self.assertEqual(client.count_matches(["scrambled_example_this"]), [2])
+
+            # The connection is kept open across the swap, and its next requests use the new dictionary
+            write_dictionary("eaxmple\n", mtime=2)
+            wait_for_reload(1)
+            self.assertEqual(client.count_matches(["scrambled_example_this"]), [1])
+
+            # A dictionary that fails its validation is not swapped in
+            write_dictionary("tihs\n" + "x" * 11 + "\n", mtime=3)
+            wait_for_reload(2)
+            self.assertEqual((reloader.reloads, reloader.reload_failures), (1, 1))
+            self.assertEqual(client.count_matches(["scrambled_example_this"]), [1])
+
+    def test_invalid_arguments(self):
+        """Test that invalid pool sizes and addresses are rejected."""
+        with self.assertRaises(ValueError):
+            MatchServerOptions(self.input_strings_config, workers=0)
+        with self.assertRaises(ValueError):
+            MatchServerOptions(self.input_strings_config, chunk_size=0)
+        with self.assertRaises(ValueError):
+            MatchServer(self.match_engine, self.logger, MatchServerOptions(self.input_strings_config)).serve_forever()
+        with self.assertRaises(ValueError):
+            MatchClient()
+
+
+if __name__ == "__main__":
+    unittest.main()
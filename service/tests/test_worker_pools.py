@@ -0,0 +1,58 @@
+"""
+Test cases for WorkerPools.
+"""
+
+# Imports
+import unittest
+from unittest.mock import Mock
+from scrambled_string_finder import count_chunk_matches
+from service.worker_pools import WorkerPools
+
+
+class TestWorkerPools(unittest.TestCase):
+    """
+    Unit tests for the WorkerPools class.
+    """
+
+    def setUp(self):
+        """Set up pools of a single worker thread and two match engines."""
+        self.pools = WorkerPools(workers=1)
+        self.addCleanup(self.pools.shutdown)
+        self.match_engines = []
+        for count in (1, 2):
+            match_engine = Mock()
+            match_engine.count_matches.return_value = count
+            match_engine.reset_counters.return_value = {}
+            self.match_engines.append(match_engine)
+
+    def test_swap_without_requests_in_flight(self):
+        """Test that the previous pool is shut down right away when no request uses it."""
+        self.assertEqual(self.pools.start(self.match_engines[0]), 0)
+        executor = self.pools.acquire()
+        self.assertEqual(executor.submit(count_chunk_matches, ["line"]).result(timeout=10), ([1], {}))
+        self.pools.release(executor)
+
+        self.assertEqual(self.pools.start(self.match_engines[1]), 0)
+        self.assertIs(self.pools.match_engine, self.match_engines[1])
+        with self.assertRaises(RuntimeError):
+            executor.submit(count_chunk_matches, ["line"])
+
+    def test_swap_with_requests_in_flight(self):
+        """Test that a retired pool keeps serving its requests in flight, and is shut down once they are released."""
+        self.pools.start(self.match_engines[0])
+        previous_executor = self.pools.acquire()
+        self.assertEqual(self.pools.start(self.match_engines[1]), 1)
+
+        self.assertEqual(previous_executor.submit(count_chunk_matches, ["line"]).result(timeout=10), ([1], {}))
+        executor = self.pools.acquire()
+        self.assertEqual(executor.submit(count_chunk_matches, ["line"]).result(timeout=10), ([2], {}))
+
+        self.pools.release(previous_executor)
+        with self.assertRaises(RuntimeError):
+            previous_executor.submit(count_chunk_matches, ["line"])
+        self.pools.release(executor)
+        self.assertEqual(executor.submit(count_chunk_matches, ["line"]).result(timeout=10), ([2], {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
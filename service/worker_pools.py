@@ -0,0 +1,116 @@
+"""
+Module for the pools of workers of a long-running process whose match engine can be swapped.
+"""
+
+# Imports
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional, Set
+from matching.match_engine import MatchEngine
+from scrambled_string_finder import MAX_PENDING_CHUNKS_PER_WORKER, initialize_worker, initialize_worker_process
+
+
+class WorkerPools:
+    """
+    Pools of workers that match input strings with a match engine, one pool per match engine.
+
+    The pool of the current match engine is acquired by every request, which uses it until it is answered.
+    When a new match engine is swapped in, a new pool is started for it, and the previous pool is retired:
+    it is shut down once the requests that acquired it are released. A bounded number of chunks of input
+    strings is kept in flight for all the pools, in `chunk_slots`.
+    """
+
+    def __init__(self, workers: int):
+        """
+        Initializes the WorkerPools, without any pool.
+
+        Args:
+            workers (int): Number of worker processes of every pool. A value of 1 matches the input strings in
+                           a thread of the current process.
+        """
+        self.workers: int = workers
+        self.match_engine: Optional[MatchEngine] = None
+        self.chunk_slots: asyncio.Semaphore = asyncio.Semaphore(workers * MAX_PENDING_CHUNKS_PER_WORKER)
+        # Pool of the current match engine, and number of requests in flight on every pool
+        self._executor: Optional[Executor] = None
+        self._requests_in_flight: Dict[Executor, int] = {}
+        # Pools of previous match engines, shut down once their requests in flight are released
+        self._retired_executors: Set[Executor] = set()
+
+    def start(self, match_engine: MatchEngine) -> int:
+        """
+        Starts a pool for a match engine, which becomes the current one, and retires the previous pool.
+
+        Args:
+            match_engine (MatchEngine): The match engine of the workers.
+
+        Returns:
+            int: The number of requests in flight on the previous pool, which finish with it.
+        """
+        previous_executor = self._executor
+        # A single worker matches the input strings in the current process, without sending them to another process
+        if self.workers == 1:
+            self._executor = ThreadPoolExecutor(max_workers=1, initializer=initialize_worker,
+                                                initargs=(match_engine,))
+        else:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=initialize_worker_process,
+                                                 initargs=(match_engine,))
+        self.match_engine = match_engine
+
+        if previous_executor is None:
+            return 0
+        requests_in_flight = self._requests_in_flight.get(previous_executor, 0)
+        if requests_in_flight:
+            self._retired_executors.add(previous_executor)
+        else:
+            previous_executor.shutdown(wait=False)
+        return requests_in_flight
+
+    def replace(self, executor: Executor) -> None:
+        """
+        Replaces a pool that can no longer run tasks (e.g. because a worker process died) with a new pool of the
+        current match engine, if it is the current pool.
+
+        Args:
+            executor (Executor): The pool to replace.
+        """
+        if executor is self._executor:
+            self.start(self.match_engine)
+
+    def acquire(self) -> Executor:
+        """
+        Gets the pool of the current match engine for a request, which uses it until it is released.
+
+        Returns:
+            Executor: The pool of workers.
+        """
+        executor = self._executor
+        self._requests_in_flight[executor] = self._requests_in_flight.get(executor, 0) + 1
+        return executor
+
+    def release(self, executor: Executor) -> None:
+        """
+        Releases the pool of an answered request, and shuts it down if it is retired and unused.
+
+        Args:
+            executor (Executor): The pool of workers.
+        """
+        self._requests_in_flight[executor] -= 1
+        if self._requests_in_flight[executor]:
+            return
+
+        del self._requests_in_flight[executor]
+        if executor in self._retired_executors:
+            self._retired_executors.remove(executor)
+            executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """
+        Shuts down all the pools, once their workers are done.
+        """
+        executors = [self._executor, *self._retired_executors] if self._executor is not None else []
+        for executor in executors:
+            executor.shutdown(wait=True)
+        self._executor = None
+        self._retired_executors.clear()
+        self._requests_in_flight.clear()
@@ -0,0 +1,48 @@
+"""
+Python module that defines the statistics shared by the caches of the application.
+"""
+
+# Imports
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistics of a cache: the canonical form cache, the line memo or the persistent result cache.
+
+    Attributes:
+        hits -- number of lookups served from the cache
+        misses -- number of lookups that were not cached
+        evictions -- number of entries evicted from the cache
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def get_hit_rate(self) -> float:
+        """
+        Computes the fraction of the lookups served from the cache.
+
+        Returns:
+            float: The hit rate, or 0 if there was no lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_counters(self, prefix: str) -> dict[str, int]:
+        """
+        Returns the statistics as named counters, e.g. for a `StatsRecorder`.
+
+        Args:
+            prefix (str): The prefix of the counter names (e.g. "line_memo").
+
+        Returns:
+            dict[str, int]: The number of hits, misses and evictions, as `<prefix>_hits`, `<prefix>_misses`
+                            and `<prefix>_evictions`.
+        """
+        return {
+            f"{prefix}_hits": self.hits,
+            f"{prefix}_misses": self.misses,
+            f"{prefix}_evictions": self.evictions,
+        }
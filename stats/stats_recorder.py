@@ -0,0 +1,115 @@
+"""
+Python module that records timing and counter statistics of the application.
+"""
+
+# Imports
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator, Mapping
+from utils.file_utils import create_parent_directories
+
+
+class StatsRecorder:
+    """
+    Class that records the wall and CPU time of the phases of the application and named counters.
+
+    When the recorder is disabled, phases are not timed and counters are not recorded, so the
+    instrumentation has negligible cost.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initializes the StatsRecorder.
+
+        Args:
+            enabled (bool): Whether statistics are recorded.
+        """
+        self.enabled: bool = enabled
+        self.phases: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = {}
+
+    def phase(self, name: str) -> ContextManager:
+        """
+        Returns a context manager that records the wall and CPU time of a phase.
+
+        Args:
+            name (str): The name of the phase. The times of phases with the same name are accumulated.
+
+        Returns:
+            ContextManager: The context manager timing the phase.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._timed_phase(name)
+
+    @contextmanager
+    def _timed_phase(self, name: str) -> Iterator[None]:
+        """Times a phase and accumulates its wall and CPU time."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            phase = self.phases.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0})
+            phase["wall_seconds"] += time.perf_counter() - wall_start
+            phase["cpu_seconds"] += time.process_time() - cpu_start
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): The name of the counter.
+            value (int): The increment.
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge_counters(self, counters: Mapping[str, int]) -> None:
+        """
+        Adds the given counters to the recorded counters.
+
+        Args:
+            counters (Mapping[str, int]): The counters to add.
+        """
+        if self.enabled:
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict:
+        """
+        Returns the recorded statistics.
+
+        Returns:
+            dict: The phases and counters.
+        """
+        return {"phases": self.phases, "counters": self.counters}
+
+    def format_table(self) -> str:
+        """
+        Formats the recorded statistics as a human-readable table.
+
+        Returns:
+            str: The formatted table.
+        """
+        lines = [f"{'Phase':<24} {'Wall (s)':>12} {'CPU (s)':>12}", "-" * 50]
+        for name, phase in self.phases.items():
+            lines.append(f"{name:<24} {phase['wall_seconds']:>12.4f} {phase['cpu_seconds']:>12.4f}")
+
+        lines.extend(["", f"{'Counter':<24} {'Value':>25}", "-" * 50])
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<24} {value:>25}")
+
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        """
+        Writes the recorded statistics to a JSON file.
+
+        Args:
+            path (str): Path to the JSON file.
+        """
+        create_parent_directories(path)
+        with open(path, mode="w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
@@ -0,0 +1,28 @@
+"""
+Test cases for the CacheStats class.
+"""
+
+# Imports
+import unittest
+from stats.cache_stats import CacheStats
+
+
+class TestCacheStats(unittest.TestCase):
+    """
+    Unit tests for the CacheStats class.
+    """
+
+    def test_to_counters(self):
+        """Test that the statistics are named after the given prefix."""
+        stats = CacheStats(hits=3, misses=1, evictions=2)
+        self.assertEqual(stats.to_counters("line_memo"), {"line_memo_hits": 3, "line_memo_misses": 1,
+                                                          "line_memo_evictions": 2})
+
+    def test_get_hit_rate(self):
+        """Test the hit rate, including without any lookup."""
+        self.assertEqual(CacheStats().get_hit_rate(), 0.0)
+        self.assertAlmostEqual(CacheStats(hits=3, misses=1).get_hit_rate(), 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
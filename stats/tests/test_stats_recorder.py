@@ -0,0 +1,85 @@
+"""
+Test cases for the StatsRecorder class.
+"""
+
+# Imports
+import json
+import os
+import tempfile
+import unittest
+from stats.stats_recorder import StatsRecorder
+
+
+class TestStatsRecorder(unittest.TestCase):
+    """
+    Unit tests for the StatsRecorder class.
+    """
+
+    def test_phase(self):
+        """Test that the times of phases with the same name are accumulated."""
+        stats = StatsRecorder()
+        with stats.phase("matching"):
+            sum(range(1000))
+        with stats.phase("matching"):
+            sum(range(1000))
+
+        self.assertEqual(list(stats.phases), ["matching"])
+        self.assertGreater(stats.phases["matching"]["wall_seconds"], 0)
+        self.assertGreaterEqual(stats.phases["matching"]["cpu_seconds"], 0)
+
+    def test_phase_with_exception(self):
+        """Test that a phase is recorded even if it raises an exception."""
+        stats = StatsRecorder()
+        with self.assertRaises(ValueError):
+            with stats.phase("dictionary_load"):
+                raise ValueError("Invalid word")
+
+        self.assertIn("dictionary_load", stats.phases)
+
+    def test_counters(self):
+        """Test that counters are incremented and merged."""
+        stats = StatsRecorder()
+        stats.increment("lines_processed")
+        stats.increment("lines_processed", 2)
+        stats.merge_counters({"lines_processed": 1, "full_matches": 5})
+
+        self.assertEqual(stats.counters, {"lines_processed": 4, "full_matches": 5})
+
+    def test_disabled(self):
+        """Test that a disabled recorder records nothing."""
+        stats = StatsRecorder(enabled=False)
+        with stats.phase("matching"):
+            pass
+        stats.increment("lines_processed")
+        stats.merge_counters({"full_matches": 5})
+
+        self.assertEqual(stats.to_dict(), {"phases": {}, "counters": {}})
+
+    def test_format_table(self):
+        """Test that the table contains every phase and counter."""
+        stats = StatsRecorder()
+        with stats.phase("input_load"):
+            pass
+        stats.increment("windows_examined", 42)
+
+        table = stats.format_table()
+        self.assertIn("input_load", table)
+        self.assertIn("windows_examined", table)
+        self.assertIn("42", table)
+
+    def test_write_json(self):
+        """Test that the statistics are written to a JSON file."""
+        stats = StatsRecorder()
+        with stats.phase("config_load"):
+            pass
+        stats.increment("full_matches", 3)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "stats", "stats.json")
+            stats.write_json(path)
+            with open(path, mode="r", encoding="utf-8") as file:
+                self.assertEqual(json.load(file), stats.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
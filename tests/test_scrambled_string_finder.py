@@ -3,12 +3,25 @@ Test cases for ScrambledStringFinder.
 """
 
 # Imports
+import json
+import os
+import random
+import tempfile
 import unittest
 from unittest.mock import Mock
+from dictionary.compact_dictionary_storage import CompactDictionaryStorage
 from dictionary.dictionary import Dictionary
 from dictionary.dictionary_config import DictionaryConfig
 from dictionary.set_dictionary_storage import SetDictionaryStorage
-from scrambled_string_finder import ScrambledStringFinder
+from input_strings.input_strings_config import InputStringsConfig
+from input_strings.streaming_input_file_provider import StreamingInputFileProvider
+from matching.line_result_memo import LineResultMemo
+from matching.match_tracer import MatchTracer
+from matching.persistent_result_cache import PersistentResultCache
+from matching.rolling_histogram_match_engine import RollingHistogramMatchEngine
+from matching.sliding_window_match_engine import SlidingWindowMatchEngine
+from scrambled_string_finder import FinderOptions, ParallelismOptions, ScrambledStringFinder
+from stats.stats_recorder import StatsRecorder
 
 
 class TestScrambledStringFinder(unittest.TestCase):
@@ -19,6 +32,8 @@ class TestScrambledStringFinder(unittest.TestCase):
     def setUp(self):
         """Set up mocks for InputProvider, Dictionary, and Logger."""
         self.mock_input_provider = Mock()
+        # The finder consumes the input strings lazily, so iterate over the mocked input strings
+        self.mock_input_provider.iter_inputs.side_effect = lambda: iter(self.mock_input_provider.get.return_value)
         self.mock_logger = Mock()
         self.dictionary = Dictionary(
             storage=SetDictionaryStorage(),
@@ -99,6 +114,212 @@ class TestScrambledStringFinder(unittest.TestCase):
         # Validate results
         self.assertEqual(results, [(1, 0), (2, 0)])
 
+    def test_parallel_workers(self):
+        """Test that worker processes return the same results, in the order of the input strings."""
+        self.dictionary.add_word("eaxmple")
+        self.dictionary.add_word("tihs")
+        inputs = ["scrambled_example_this_tihs", "nothing", "this", "example"] * 5
+        self.mock_input_provider.get.return_value = inputs
+
+        finder = ScrambledStringFinder(
+            input_provider=self.mock_input_provider,
+            dictionary=self.dictionary,
+            logger=self.mock_logger,
+            options=FinderOptions(parallelism=ParallelismOptions(workers=2, chunk_size=3))
+        )
+
+        # Perform the test
+        results = finder.find_scrambled_strings()
+
+        # Validate results
+        self.assertEqual(results, [(index, [2, 0, 1, 1][(index - 1) % 4]) for index in range(1, len(inputs) + 1)])
+
+    def test_compact_storage(self):
+        """Test that the compact storage gives the same results as the set storage."""
+        words = ["eaxmple", "tihs", "this", "ab", "scramble", "sbmarcle", "zz"]
+        inputs = ["scrambled_example_this_tihs", "nothing", "this", "example", "ab", "sbmarclee"]
+        self.mock_input_provider.get.return_value = inputs
+        for word in words:
+            self.dictionary.add_word(word)
+        compact_dictionary = Dictionary(
+            storage=CompactDictionaryStorage(compaction_threshold=2),
+            dictionary_config=self.dictionary.dictionary_config,
+            logger=self.mock_logger
+        )
+        compact_dictionary.add_words(words)
+
+        expected = ScrambledStringFinder(self.mock_input_provider, self.dictionary,
+                                         self.mock_logger).find_scrambled_strings()
+        results = ScrambledStringFinder(self.mock_input_provider, compact_dictionary,
+                                        self.mock_logger).find_scrambled_strings()
+        self.assertEqual(results, expected)
+        self.assertEqual(results, [(1, 5), (2, 0), (3, 2), (4, 1), (5, 1), (6, 2)])
+
+    def test_equivalence_classes(self):
+        """Test that the words sharing a canonical form are matched once and counted for every word."""
+        for word in ["scramble", "sbmarcle", "srcamble", "scrambla"]:
+            self.dictionary.add_word(word)
+        self.mock_input_provider.get.return_value = ["zsrcamblez", "scrambla", "nothing"]
+
+        stats = StatsRecorder()
+        results = ScrambledStringFinder(self.mock_input_provider, self.dictionary, self.mock_logger,
+                                        FinderOptions(stats=stats)).find_scrambled_strings()
+
+        self.assertEqual(results, [(1, 3), (2, 1), (3, 0)])
+        self.assertEqual(stats.counters["full_matches"], 4)
+        # A single window of every input string is compared, with the class of its first and last letters
+        self.assertEqual(stats.counters["canonical_computations"], 2)
+
+    def test_line_memo(self):
+        """Test that repeated input strings are served from the memo, with and without workers."""
+        self.dictionary.add_word("eaxmple")
+        self.dictionary.add_word("tihs")
+        inputs = ["scrambled_example_this_tihs", "nothing", "this", "example"] * 5
+        self.mock_input_provider.get.return_value = inputs
+        expected = [(index, [2, 0, 1, 1][(index - 1) % 4]) for index in range(1, len(inputs) + 1)]
+
+        # With workers, the repeats of the input strings in flight wait for their counts instead of being sent
+        for workers, expected_hits in ((1, 16), (2, 16)):
+            memo = LineResultMemo(16)
+            stats = StatsRecorder()
+            parallelism = ParallelismOptions(workers=workers, chunk_size=4)
+            options = FinderOptions(parallelism=parallelism, stats=stats, memo=memo)
+            finder = ScrambledStringFinder(self.mock_input_provider, self.dictionary, self.mock_logger, options)
+
+            self.assertEqual(finder.find_scrambled_strings(), expected)
+            self.assertEqual(memo.stats.hits, expected_hits)
+            self.assertEqual(stats.counters["full_matches"], (len(inputs) - expected_hits) // 4 * 4)
+
+    def test_result_cache(self):
+        """Test that the counts cached by a run are reused by a later run, with and without workers."""
+        self.dictionary.add_word("eaxmple")
+        self.dictionary.add_word("tihs")
+        inputs = ["scrambled_example_this_tihs", "nothing", "this", "example"]
+        self.mock_input_provider.get.return_value = inputs
+        expected = [(1, 2), (2, 0), (3, 1), (4, 1)]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, "results.db")
+            for workers, expected_hits in ((1, 0), (2, 4), (1, 4)):
+                stats = StatsRecorder()
+                with PersistentResultCache(cache_path, self.dictionary.get_fingerprint()) as result_cache:
+                    options = FinderOptions(parallelism=ParallelismOptions(workers=workers), stats=stats,
+                                            result_cache=result_cache)
+                    finder = ScrambledStringFinder(self.mock_input_provider, self.dictionary, self.mock_logger, options)
+                    self.assertEqual(finder.find_scrambled_strings(), expected)
+                    self.assertEqual(result_cache.stats.hits, expected_hits)
+                self.assertEqual(stats.counters.get("full_matches", 0), 4 if expected_hits == 0 else 0)
+
+    def test_sharding(self):
+        """Test that long input strings split into overlapping shards have the counts of the whole strings."""
+        for word in ("eaxmple", "tihs", "ab", "ba", "abab"):
+            self.dictionary.add_word(word)
+        generator = random.Random(3)
+        inputs = ["".join(generator.choice("abehilmpstx") for _ in range(generator.randint(1, 80)))
+                  for _ in range(20)]
+        inputs += ["xx_example_this_xx_example", "this", "ab" * 40]
+        self.mock_input_provider.get.return_value = inputs
+        expected = ScrambledStringFinder(self.mock_input_provider, self.dictionary,
+                                         self.mock_logger).find_scrambled_strings()
+
+        for match_engine in (None, RollingHistogramMatchEngine(self.dictionary, self.mock_logger)):
+            for shard_size in (1, 5, 16):
+                parallelism = ParallelismOptions(workers=2, chunk_size=4, shard_size=shard_size)
+                options = FinderOptions(match_engine=match_engine, parallelism=parallelism, memo=LineResultMemo(4))
+                finder = ScrambledStringFinder(self.mock_input_provider, self.dictionary, self.mock_logger, options)
+                self.assertEqual(finder.find_scrambled_strings(), expected, shard_size)
+
+    def test_streaming(self):
+        """Test that input strings read and matched in chunks have the counts of the whole strings."""
+        for word in ("eaxmple", "tihs", "ab", "ba", "abab"):
+            self.dictionary.add_word(word)
+        generator = random.Random(4)
+        inputs = ["".join(generator.choice("abehilmpstx") for _ in range(generator.randint(2, 80))) + "\n"
+                  for _ in range(20)]
+        inputs.append("xx_example_this_xx_ba")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file_path = os.path.join(temp_dir, "input.txt")
+            with open(input_file_path, mode="w", encoding="utf-8") as file:
+                file.write("".join(inputs))
+            input_provider = StreamingInputFileProvider(input_file_path, InputStringsConfig(max_line_length=100))
+
+            expected_stats = StatsRecorder()
+            expected = ScrambledStringFinder(input_provider, self.dictionary, self.mock_logger,
+                                             FinderOptions(stats=expected_stats)).find_scrambled_strings()
+            self.assertEqual(expected[-1], (len(inputs), 3))
+            for stream_chunk_size in (1, 7, 1000):
+                stats = StatsRecorder()
+                options = FinderOptions(stats=stats, stream_chunk_size=stream_chunk_size)
+                finder = ScrambledStringFinder(input_provider, self.dictionary, self.mock_logger, options)
+                self.assertEqual(finder.find_scrambled_strings(), expected, stream_chunk_size)
+                self.assertEqual(stats.counters["lines_processed"], len(inputs))
+                self.assertEqual(stats.counters["characters_processed"],
+                                 expected_stats.counters["characters_processed"])
+
+    def test_invalid_streaming(self):
+        """Test that streaming cannot be combined with workers or a memo."""
+        with self.assertRaises(ValueError):
+            FinderOptions(stream_chunk_size=-1)
+        with self.assertRaises(ValueError):
+            FinderOptions(parallelism=ParallelismOptions(workers=2), stream_chunk_size=16)
+        with self.assertRaises(ValueError):
+            FinderOptions(memo=LineResultMemo(4), stream_chunk_size=16)
+
+    def test_stats(self):
+        """Test that the processed lines and the match engine counters are recorded, with and without workers."""
+        self.dictionary.add_word("eaxmple")
+        self.dictionary.add_word("tihs")
+        inputs = ["scrambled_example_this_tihs", "nothing", "this", "example"] * 5
+        self.mock_input_provider.get.return_value = inputs
+
+        recorded_counters = []
+        for workers in (1, 2):
+            stats = StatsRecorder()
+            options = FinderOptions(parallelism=ParallelismOptions(workers=workers, chunk_size=3), stats=stats)
+            finder = ScrambledStringFinder(self.mock_input_provider, self.dictionary, self.mock_logger, options)
+            finder.find_scrambled_strings()
+            recorded_counters.append(stats.counters)
+
+        self.assertEqual(recorded_counters[0], recorded_counters[1])
+        self.assertEqual(recorded_counters[0]["lines_processed"], len(inputs))
+        self.assertEqual(recorded_counters[0]["characters_processed"], sum(map(len, inputs)))
+        self.assertEqual(recorded_counters[0]["full_matches"], 20)
+        self.assertGreater(recorded_counters[0]["windows_examined"], 0)
+        # The window engine only visits the windows with matching first and last letters
+        self.assertNotIn("endpoint_rejects", recorded_counters[0])
+
+    def test_trace_matches(self):
+        """Test that the matches of the input strings are traced, with and without workers."""
+        self.dictionary.add_word("tihs")
+        inputs = ["nothing", "xx_this"] * 3
+        self.mock_input_provider.get.return_value = inputs
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_file_path = os.path.join(temp_dir, "trace.jsonl")
+            for workers in (1, 2):
+                match_engine = SlidingWindowMatchEngine(self.dictionary, self.mock_logger)
+                with MatchTracer(self.dictionary, match_engine, trace_file_path) as tracer:
+                    parallelism = ParallelismOptions(workers=workers, chunk_size=1)
+                    options = FinderOptions(match_engine=match_engine, parallelism=parallelism, tracer=tracer)
+                    finder = ScrambledStringFinder(self.mock_input_provider, self.dictionary, self.mock_logger,
+                                                   options)
+                    finder.find_scrambled_strings()
+
+                with open(trace_file_path, mode="r", encoding="utf-8") as file:
+                    records = [json.loads(line) for line in file]
+                self.assertEqual(records, [{"line": line, "word": "tihs", "offset": 3, "canonical": "this"}
+                                           for line in (2, 4, 6)])
+
+    def test_invalid_workers(self):
+        """Test that a non-positive number of workers or chunk size, or a negative shard size, raises an error."""
+        with self.assertRaises(ValueError):
+            ParallelismOptions(workers=0)
+        with self.assertRaises(ValueError):
+            ParallelismOptions(chunk_size=0)
+        with self.assertRaises(ValueError):
+            ParallelismOptions(shard_size=-1)
+
 
 if __name__ == "__main__":
     unittest.main()
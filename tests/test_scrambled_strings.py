@@ -0,0 +1,108 @@
+"""
+Test cases for the scrambled_strings command line.
+"""
+
+# Imports
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import List
+
+# Directory of the scrambled_strings script
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestScrambledStrings(unittest.TestCase):
+    """
+    Unit tests for the scrambled_strings command line.
+    """
+
+    def setUp(self):
+        """Set up a configuration with console logging, a dictionary file and an input file."""
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.log_path = os.path.join(self.temp_dir.name, "scrambled_strings.log")
+        self.config_path = self.write_config("config.ini", ["LOG_ENABLE_CONSOLE = true"])
+        self.dictionary_path = self.write_file("dict.txt", "scramble\neaxmple\ntihs\nab\n")
+        self.input_path = self.write_file("input.txt", "scrambled_example_this\nnothing\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def write_file(self, name: str, contents: str) -> str:
+        """Writes the given contents to a file of the temporary directory, and returns its path."""
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, mode="w", encoding="utf-8") as file:
+            file.write(contents)
+        return path
+
+    def write_config(self, name: str, logger_options: List[str]) -> str:
+        """Writes a configuration file with debug logging and the given logger options, and returns its path."""
+        return self.write_file(name, "\n".join([
+            "[DICTIONARY]",
+            "MIN_WORD_LENGTH = 2",
+            "MAX_WORD_LENGTH = 105",
+            "MAX_SUM_LENGTHS_OF_ALL_WORDS = 105",
+            "[LOGGER]",
+            f"LOG_FILE = {self.log_path}",
+            "LOG_LEVEL = DEBUG",
+            *logger_options,
+            "[INPUT_STRINGS]",
+            "MIN_LINE_LENGTH = 2",
+            "MAX_LINE_LENGTH = 1000",
+        ]) + "\n")
+
+    def run_command(self, config_path: str, *args: str) -> subprocess.CompletedProcess:
+        """Runs the command line with the dictionary file, the input file and the given configuration."""
+        return subprocess.run([sys.executable, os.path.join(APP_DIR, "scrambled_strings.py"),
+                               "--dictionary", self.dictionary_path, "--input", self.input_path,
+                               "--config", config_path, *args],
+                              cwd=APP_DIR, capture_output=True, text=True, check=True, timeout=60)
+
+    def run_to_stdout(self, output_format: str) -> str:
+        """Runs the command line with the results written to the standard output, and returns the output."""
+        process = self.run_command(self.config_path, "--output", "-", "--output-format", output_format)
+        self.assertIn("Dictionary file path", process.stderr)
+        return process.stdout
+
+    def test_jsonl_to_stdout(self):
+        """Test that the JSON Lines results written to the standard output are not mixed with the logging."""
+        records = [json.loads(line) for line in self.run_to_stdout("jsonl").splitlines()]
+        self.assertEqual(records, [{"case": 1, "count": 3}, {"case": 2, "count": 0}])
+
+    def test_csv_to_stdout(self):
+        """Test that the CSV results written to the standard output are not mixed with the logging."""
+        rows = list(csv.reader(self.run_to_stdout("csv").splitlines()))
+        self.assertEqual(rows, [["case", "count"], ["1", "3"], ["2", "0"]])
+
+    def test_stream_chunk_size_requires_stream_provider(self):
+        """Test that streaming is rejected with an input provider that builds the input strings."""
+        with self.assertRaises(subprocess.CalledProcessError) as err:
+            self.run_command(self.config_path, "--stream-chunk-size", "8")
+        self.assertIn("--stream-chunk-size: requires --input-provider stream", err.exception.stderr)
+
+        process = self.run_command(self.config_path, "--stream-chunk-size", "8", "--input-provider", "stream",
+                                   "--output", "-", "--output-format", "jsonl")
+        records = [json.loads(line) for line in process.stdout.splitlines()]
+        self.assertEqual(records, [{"case": 1, "count": 3}, {"case": 2, "count": 0}])
+
+    def test_workers_with_async_logging(self):
+        """Test that the worker processes do not log to the queue of the asynchronous logger of the parent."""
+        config_path = self.write_config("async_config.ini", ["LOG_ENABLE_CONSOLE = false", "LOG_ASYNC = true",
+                                                             "LOG_QUEUE_SIZE = 10"])
+        self.input_path = self.write_file("input.txt", "scrambled_example_this\n" * 200)
+        output_path = os.path.join(self.temp_dir.name, "results.txt")
+
+        self.run_command(config_path, "--workers", "2", "--chunk-size", "8", "--output", output_path)
+        with open(output_path, encoding="utf-8") as file:
+            self.assertEqual(len(file.read().splitlines()), 200)
+        with open(self.log_path, encoding="utf-8") as file:
+            self.assertNotIn(" - DEBUG - ", file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
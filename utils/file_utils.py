@@ -3,14 +3,39 @@ Python module that includes utility functions for file manipulation.
 """
 
 # Imports
+import hashlib
 import os
 
 
 def create_parent_directories(path: str) -> None:
     """Creates parent directories of a path if they do not exist."""
 
+    directory = os.path.dirname(path)
+
+    # A path without parent directories refers to the current working directory
+    if not directory:
+        return
+
     try:
         # Create the parent directories if they do not exist
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
     except Exception as err:
         raise OSError(f"Failed to create parent directories for '{path}': {err}") from err
+
+
+def compute_file_digest(path: str, chunk_size: int = 1 << 20) -> bytes:
+    """
+    Computes the SHA-256 digest of the contents of a file.
+
+    Args:
+        path (str): Path to the file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        bytes: The SHA-256 digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, mode="rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.digest()
@@ -3,9 +3,12 @@ Test cases for file utilities.
 """
 
 # Imports
+import hashlib
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
-from utils.file_utils import create_parent_directories
+from utils.file_utils import compute_file_digest, create_parent_directories
 
 
 class TestFileUtils(unittest.TestCase):
@@ -37,6 +40,12 @@ class TestFileUtils(unittest.TestCase):
         # Assert that os.makedirs was called once
         mock_makedirs.assert_called_once_with("/path/to/existing", exist_ok=True)
 
+    @patch("os.makedirs")
+    def test_create_parent_directories_without_parent(self, mock_makedirs):
+        """Test that create_parent_directories does nothing for a path without parent directories."""
+        create_parent_directories("file.txt")
+        mock_makedirs.assert_not_called()
+
     @patch("os.makedirs")
     def test_create_parent_directories_error(self, mock_makedirs):
         """Test that create_parent_directories raises an OSError if directory creation fails."""
@@ -49,6 +58,15 @@ class TestFileUtils(unittest.TestCase):
         with self.assertRaises(OSError):
             create_parent_directories(path)
 
+    def test_compute_file_digest(self):
+        """Test that compute_file_digest returns the SHA-256 digest of the file contents."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "file.txt")
+            with open(path, mode="wb") as file:
+                file.write(b"scrambled" * 1000)
+
+            self.assertEqual(compute_file_digest(path, chunk_size=7), hashlib.sha256(b"scrambled" * 1000).digest())
+
 
 if __name__ == "__main__":
     unittest.main()